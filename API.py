@@ -1,109 +1,510 @@
-import requests
 import csv
 import os
+import requests
+import threading
+import time
+import datetime
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+from persistence import CSVStreamWriter
+from dates import parse_canvas_date, parse_date
+from rate_limit import AdaptiveLimiter, MAX_RETRIES, backoff_delay, is_retryable, is_throttled, parse_remaining
 
-# Configuration
-API_URL = "https://canvas.instructure.com/api/v1"
-ACCESS_TOKEN = "7~zP2uKUMuyr4wGRccMFeaRCHNT8K8PhThFu8TGJ9K8m4nFKwZ27zVCQTzMePFQDNC"
+# Configuration (CANVAS_API_URL can point at fake_canvas.py for offline testing)
+API_URL = os.environ.get("CANVAS_API_URL", "https://canvas.instructure.com/api/v1").rstrip("/")
+ACCESS_TOKEN = os.environ.get(
+    "CANVAS_ACCESS_TOKEN", "7~zP2uKUMuyr4wGRccMFeaRCHNT8K8PhThFu8TGJ9K8m4nFKwZ27zVCQTzMePFQDNC"
+)
+PER_PAGE = 100  # Canvas's maximum page size
+# One call returns every course with the student's current score inline, so
+# the per-course enrollments call is only needed as a fallback
+COURSES_PATH = "/courses?include[]=total_scores"
+REQUEST_TIMEOUT = 30  # seconds per HTTP request
 
 headers = {
     "Authorization": f"Bearer {ACCESS_TOKEN}"
 }
 
-def get_courses():
-    url = f"{API_URL}/courses"
-    resp = requests.get(url, headers=headers)
-    resp.raise_for_status()
-    return resp.json()
+METRICS_HISTORY = 20  # refreshes kept in CanvasClient.history
 
-def get_total_score(course_id):
-    url = f"{API_URL}/courses/{course_id}/enrollments"
-    resp = requests.get(url, headers=headers)
-    resp.raise_for_status()
+
+def _text(value):
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError("expected non-empty text")
+
+
+SCORES_HEADER = ["SAC", "Subject", "Score"]
+SCORES_SCHEMA = (_text, _text, float)
+EXAMS_SCHEMA = (_text, parse_date, float, _text)  # name,date,difficulty,subject
+
+
+def endpoint_name(url):
+    """Short label for request counts: /courses/12/enrollments -> "enrollments"."""
+    parts = [p for p in urlsplit(url).path.split("/") if p and not p.isdigit()]
+    return parts[-1] if parts else url
+
+
+def read_previous_rows(path, header=None):
+    """Rows of the last file written to path (header dropped), or [] if there is none."""
+    try:
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+    except FileNotFoundError:
+        return []
+    if header and rows and rows[0] == list(header):
+        rows = rows[1:]
+    return rows
+
+
+def score_blocks(rows):
+    """
+    study_scores.csv rows -> {course: (its Total row or None, its assessed
+    coursework rows)}. A course's coursework rows follow its Total row; rows
+    of a course that had no total end up in the previous course's block.
+    """
+    blocks = {}
+    current = None
+    for row in rows:
+        if len(row) >= 2 and row[0] == "Total":
+            current = row[1]
+            blocks[current] = (row, [])
+        elif row and current is not None:
+            blocks[current][1].append(row)
+    return blocks
+
+
+def bulk_total_score(course):
+    """
+    (True, score) when a course from COURSES_PATH carries the student's current
+    score inline, else (False, None) and the enrollments call is needed.
+    """
+    enrollments = course.get("enrollments") or []
+    for enrollment in sorted(enrollments, key=lambda e: e.get("type") != "student"):
+        if "computed_current_score" in enrollment:
+            return True, enrollment["computed_current_score"]
+    return False, None
+
+
+def _upcoming(date_text, today):
+    try:
+        return parse_date(date_text) >= today
+    except ValueError:
+        return False
+
+
+def sync_warning(metrics):
+    """What to tell the user about a sync that didn't fully succeed, or None if it did."""
+    status = metrics.get("status")
+    if status == "partial":
+        failures = metrics["failures"]
+        shown = "\n".join(failures[:5])
+        if len(failures) > 5:
+            shown += f"\n... and {len(failures) - 5} more"
+        return (f"{len(failures)} request(s) failed after retries; those courses kept "
+                f"their previous data:\n{shown}")
+    if status == "cancelled":
+        return "The sync was cancelled; data it had not written yet was left as it was."
+    return None
+
+
+def enrollment_score(enrollments):
+    """A course's current score from its enrollments response."""
     # Assuming the first enrollment is the current user
-    enrollment = resp.json()[0]
-    return enrollment.get("grades", {}).get("current_score")
+    return enrollments[0].get("grades", {}).get("current_score")
 
-def get_assignment_groups(course_id):
-    url = f"{API_URL}/courses/{course_id}/assignment_groups?include[]=assignments"
-    resp = requests.get(url, headers=headers)
-    resp.raise_for_status()
-    return resp.json()
 
-def fetch_and_save_scores(csv_path="programs/study_scores.csv"):
+class CanvasClient:
     """
-    Fetches course and assignment data from the API and saves to study_scores.csv.
+    Long-lived Canvas client shared by every caller in the process.
+
+    Holds one HTTP session for connection reuse (several clients with different
+    tokens may share one, as multi_sync does; auth goes on each request) and caches
+    course, score and assignment group responses for the duration of a refresh,
+    so the score and exam writers don't fetch the same data twice. During a
+    refresh the per-course requests run in parallel, with the number in flight
+    set by an AdaptiveLimiter that follows Canvas's rate limit headers; failed
+    requests are retried with backoff. Each refresh records its timings and any
+    failures in last_metrics / history.
+
+    Current scores come inline with the course list (COURSES_PATH), so a sync
+    is one courses call plus one assignment groups call per course; the
+    per-course enrollments call is only made for courses without an inline score.
     """
-    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-    with open(csv_path, "w", newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(["SAC", "Subject", "Score"])
-        courses = get_courses()
-        for course in courses:
+
+    def __init__(self, api_url=API_URL, access_token=ACCESS_TOKEN, limiter=None, session=None):
+        self.api_url = api_url
+        self.session = session or requests.Session()
+        self.auth_headers = {"Authorization": f"Bearer {access_token}"}
+        self.limiter = limiter or AdaptiveLimiter()
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._refreshing = False
+        self._courses = None
+        self._scores = {}
+        self._groups = {}
+        self._failures = []
+        self._failed = {}  # course id -> {"score", "groups"} that failed after retries
+        self._skipped = []
+        self.request_count = 0
+        self.retry_count = 0
+        self.endpoint_counts = {}
+        self.last_metrics = None
+        self.history = []
+
+    def _count(self, url=None, retry=False):
+        with self._stats_lock:
+            if retry:
+                self.retry_count += 1
+            else:
+                self.request_count += 1
+                name = endpoint_name(url) if url else "other"
+                self.endpoint_counts[name] = self.endpoint_counts.get(name, 0) + 1
+
+    def _request(self, url):
+        """One GET under the concurrency limiter, retrying throttles, 5xx and network errors."""
+        for attempt in range(MAX_RETRIES + 1):
+            resp = None
+            with self.limiter:
+                self._count(url)
+                try:
+                    resp = self.session.get(url, headers=self.auth_headers, timeout=REQUEST_TIMEOUT)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+            if resp is not None:
+                if resp.ok:
+                    self.limiter.on_success(parse_remaining(resp.headers))
+                    return resp
+                if is_throttled(resp.status_code, resp.text):
+                    self.limiter.on_throttle()
+                elif not is_retryable(resp.status_code):
+                    resp.raise_for_status()
+                error = requests.HTTPError(f"{resp.status_code} Error for url: {url}", response=resp)
+            if attempt == MAX_RETRIES:
+                raise error
+            self._count(url, retry=True)
+            retry_after = resp.headers.get("Retry-After") if resp is not None else None
+            time.sleep(backoff_delay(attempt, retry_after))
+
+    def _get(self, path):
+        """GET a list endpoint, following Canvas's Link: rel="next" pagination."""
+        sep = "&" if "?" in path else "?"
+        url = f"{self.api_url}{path}{sep}per_page={PER_PAGE}"
+        results = []
+        while url:
+            resp = self._request(url)
+            page = resp.json()
+            if not isinstance(page, list):
+                return page
+            results.extend(page)
+            url = resp.links.get("next", {}).get("url")
+        return results
+
+    def _record_failure(self, what, error):
+        with self._stats_lock:
+            self._failures.append(f"{what}: {error}")
+
+    def _course_failed(self, course, part, error):
+        """Record that part ("score" or "groups") of course failed; its old rows are carried forward."""
+        with self._stats_lock:
+            self._failed.setdefault(course.get("id"), set()).add(part)
+        what = "total score" if part == "score" else "assignment groups"
+        self._record_failure(f"{course.get('name')} {what}", error)
+
+    def _reset_failures(self):
+        self._failures = []
+        self._failed = {}
+        self._skipped = []
+
+    def _write(self, out, row):
+        """Write a row, dropping (and logging) it if it fails the file's schema."""
+        if not out.writerow(row):
+            print(f"Warning: skipped invalid row {row!r}")
+
+    def clear_cache(self):
+        self._courses = None
+        self._scores = {}
+        self._groups = {}
+
+    def get_courses(self):
+        if not self._refreshing:
+            return self._get(COURSES_PATH)
+        if self._courses is None:
+            self._courses = self._get(COURSES_PATH)
+            for course in self._courses:
+                found, score = bulk_total_score(course)
+                if found:
+                    self._scores[course.get("id")] = score
+        return self._courses
+
+    def get_total_score(self, course_id):
+        if self._refreshing and course_id in self._scores:
+            return self._scores[course_id]
+        score = enrollment_score(self._get(f"/courses/{course_id}/enrollments"))
+        if self._refreshing:
+            self._scores[course_id] = score
+        return score
+
+    def get_assignment_groups(self, course_id):
+        groups = self._groups.get(course_id) if self._refreshing else None
+        if groups is None:
+            groups = self._get(f"/courses/{course_id}/assignment_groups?include[]=assignments")
+            if self._refreshing:
+                self._groups[course_id] = groups
+        return groups
+
+    def _prefetch(self, courses, scores=True, cancel_event=None):
+        """Fill the refresh caches for every course with parallel, rate-limited requests."""
+        def load(course):
+            if cancel_event is not None and cancel_event.is_set():
+                return
             course_id = course.get("id")
-            course_name = course.get("name")
-            try:
-                total_score = get_total_score(course_id)
-                if total_score is not None:
-                    writer.writerow(["Total", course_name, total_score])
-            except Exception:
-                pass
+            if scores:
+                try:
+                    self.get_total_score(course_id)
+                except Exception as e:
+                    self._scores[course_id] = None
+                    self._course_failed(course, "score", e)
             try:
-                groups = get_assignment_groups(course_id)
-                for group in groups:
-                    if "Assessed Coursework" in group.get("name", ""):
+                self.get_assignment_groups(course_id)
+            except Exception as e:
+                self._groups[course_id] = []
+                self._course_failed(course, "groups", e)
+
+        with ThreadPoolExecutor(max_workers=self.limiter.max_limit,
+                                thread_name_prefix="canvas") as pool:
+            list(pool.map(load, courses))
+
+    def _finish(self, out):
+        """Commit the streamed file, keeping count of the rows that failed validation."""
+        out.commit()
+        self._skipped.extend(out.skipped)
+        return out.committed
+
+    def fetch_and_save_scores(self, csv_path="programs/study_scores.csv"):
+        """
+        Fetches course and assignment data from the API and saves to study_scores.csv.
+        Rows stream into a temp file that is validated and swapped in once all
+        rows are fetched. A course whose requests failed after retries keeps
+        its rows from the previous file; rows that fail validation are dropped.
+        """
+        if not self._refreshing:
+            self._reset_failures()
+        courses = self.get_courses()
+        previous = None
+        out = CSVStreamWriter(csv_path, SCORES_HEADER, SCORES_SCHEMA, skip_invalid=True)
+        try:
+            for course in courses:
+                course_id = course.get("id")
+                course_name = course.get("name")
+                total_row = None
+                try:
+                    total_score = self.get_total_score(course_id)
+                    if total_score is not None:
+                        total_row = ["Total", course_name, total_score]
+                except Exception as e:
+                    self._course_failed(course, "score", e)
+                rows = []
+                try:
+                    groups = self.get_assignment_groups(course_id)
+                    for group in groups:
+                        if "Assessed Coursework" in group.get("name", ""):
+                            for assignment in group.get("assignments", []):
+                                name = assignment.get("name")
+                                score = assignment.get("score") or assignment.get("points_possible")
+                                if score is not None:
+                                    rows.append([group['name'], name, score])
+                except Exception as e:
+                    self._course_failed(course, "groups", e)
+                failed = self._failed.get(course_id, ())
+                if failed:
+                    if previous is None:
+                        previous = score_blocks(read_previous_rows(csv_path, SCORES_HEADER))
+                    old_total, old_rows = previous.get(course_name, (None, []))
+                    if "score" in failed:
+                        total_row = old_total
+                    if "groups" in failed:
+                        rows = old_rows
+                if total_row is not None:
+                    self._write(out, total_row)
+                for row in rows:
+                    self._write(out, row)
+            return self._finish(out)
+        except BaseException:
+            out.abort()
+            raise
+
+    def fetch_and_save_exams(self, csv_path="programs/exams.csv"):
+        """
+        Fetches upcoming assignments from Canvas and writes them to exams.csv
+        Format: name,date,0.5,subject
+        A course whose assignment groups failed keeps its upcoming rows from
+        the previous file; rows that fail validation are dropped.
+        """
+        if not self._refreshing:
+            self._reset_failures()
+        courses = self.get_courses()
+        today = datetime.date.today()
+        previous = None
+        # No header: main.load_exams_from_csv expects bare 4-column rows
+        out = CSVStreamWriter(csv_path, schema=EXAMS_SCHEMA, skip_invalid=True)
+        try:
+            for course in courses:
+                course_id = course.get("id")
+                course_name = course.get("name")
+                rows = []
+                try:
+                    groups = self.get_assignment_groups(course_id)
+                    for group in groups:
                         for assignment in group.get("assignments", []):
                             name = assignment.get("name")
-                            score = assignment.get("score") or assignment.get("points_possible")
-                            if score is not None:
-                                writer.writerow([group['name'], name, score])
-            except Exception:
-                pass
+                            due_at = assignment.get("due_at")
+                            # Only include assignments with a due date in the future
+                            if due_at:
+                                try:
+                                    due_date = parse_canvas_date(due_at)
+                                except (TypeError, AttributeError, ValueError):
+                                    continue
+                                if due_date >= today:
+                                    rows.append([name, due_date.isoformat(), 0.5, course_name])
+                except Exception as e:
+                    self._course_failed(course, "groups", e)
+                if "groups" in self._failed.get(course_id, ()):
+                    if previous is None:
+                        previous = read_previous_rows(csv_path)
+                    rows = [row for row in previous
+                            if len(row) == 4 and row[3] == course_name and _upcoming(row[1], today)]
+                for row in rows:
+                    self._write(out, row)
+            return self._finish(out)
+        except BaseException:
+            out.abort()
+            raise
 
-def fetch_and_save_exams(csv_path="programs/exams.csv"):
+    def refresh(self, scores_path=None, exams_path=None, cancel_event=None):
+        """
+        Run one sync: fetch fresh data and write the requested CSVs.
+
+        Returns the metrics dict for this refresh (also stored in last_metrics):
+        total and per-step durations in seconds, the number of HTTP requests and
+        retries, and a status of "ok", "partial" (some requests still failed after
+        retries, listed in "failures"; the affected courses kept their rows from
+        the previous CSVs, every other course was written fresh) or "cancelled".
+        "skipped" lists rows dropped for failing validation, which don't make a
+        sync partial.
+        """
+        with self._lock:
+            self.clear_cache()
+            self._reset_failures()
+            self._refreshing = True
+            start = time.perf_counter()
+            requests_before = self.request_count
+            retries_before = self.retry_count
+            endpoints_before = dict(self.endpoint_counts)
+            metrics = {"started": datetime.datetime.now().isoformat(timespec="seconds"), "steps": {}}
+            steps = [("scores", scores_path, self.fetch_and_save_scores),
+                     ("exams", exams_path, self.fetch_and_save_exams)]
+            try:
+                step_start = time.perf_counter()
+                self._prefetch(self.get_courses(), scores=scores_path is not None,
+                               cancel_event=cancel_event)
+                metrics["steps"]["fetch"] = round(time.perf_counter() - step_start, 3)
+                for step, path, fetch in steps:
+                    if path is None:
+                        continue
+                    if cancel_event is not None and cancel_event.is_set():
+                        metrics["cancelled"] = True
+                        break
+                    step_start = time.perf_counter()
+                    fetch(path)
+                    metrics["steps"][step] = round(time.perf_counter() - step_start, 3)
+            except Exception as e:
+                self._record_failure("sync", e)
+                raise
+            finally:
+                metrics["duration"] = round(time.perf_counter() - start, 3)
+                metrics["requests"] = self.request_count - requests_before
+                metrics["retries"] = self.retry_count - retries_before
+                metrics["requests_by_endpoint"] = {
+                    name: count - endpoints_before.get(name, 0)
+                    for name, count in self.endpoint_counts.items()
+                    if count > endpoints_before.get(name, 0)
+                }
+                metrics["concurrency"] = round(self.limiter.limit, 2)
+                metrics["failures"] = list(self._failures)
+                metrics["skipped"] = list(self._skipped)
+                if metrics.get("cancelled"):
+                    metrics["status"] = "cancelled"
+                else:
+                    metrics["status"] = "partial" if self._failures else "ok"
+                self._refreshing = False
+                self.clear_cache()
+                self.last_metrics = metrics
+                self.history = (self.history + [metrics])[-METRICS_HISTORY:]
+            return metrics
+
+
+ENGINES = ("threads", "async")
+SYNC_ENGINE = os.environ.get("CANVAS_SYNC_ENGINE", "threads")
+
+_clients = {}
+_client_lock = threading.Lock()
+
+
+def get_client(engine=None):
     """
-    Fetches upcoming assignments from Canvas and writes them to exams.csv
-    Format: name,date,0.5,subject
+    Return the process-wide client for engine ("threads", or "async" for the
+    asyncio engine in async_api), creating it on first use. Defaults to
+    CANVAS_SYNC_ENGINE. The async engine needs httpx or aiohttp; without them
+    it falls back to the threaded client, so every window's sync keeps working.
     """
-    import datetime
-    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-    with open(csv_path, "w", newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        # Optionally write header: writer.writerow(["name", "date", "difficulty", "subject"])
-        courses = get_courses()
-        for course in courses:
-            course_id = course.get("id")
-            course_name = course.get("name")
-            try:
-                groups = get_assignment_groups(course_id)
-                for group in groups:
-                    for assignment in group.get("assignments", []):
-                        name = assignment.get("name")
-                        due_at = assignment.get("due_at")
-                        # Only include assignments with a due date in the future
-                        if due_at:
-                            try:
-                                due_date = datetime.datetime.fromisoformat(due_at.replace('Z', '+00:00')).date()
-                                if due_date >= datetime.date.today():
-                                    writer.writerow([name, due_date.isoformat(), 0.5, course_name])
-                            except Exception:
-                                continue
-            except Exception:
-                pass
+    engine = engine or SYNC_ENGINE
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown sync engine {engine!r}; expected one of {ENGINES}")
+    with _client_lock:
+        if engine not in _clients:
+            if engine == "async":
+                import async_api
+                if async_api.available():
+                    _clients[engine] = async_api.AsyncCanvasClient()
+                else:
+                    print("Warning: the async sync engine needs httpx or aiohttp; using the threaded sync engine")
+                    _clients[engine] = _clients.get("threads") or CanvasClient()
+                    _clients.setdefault("threads", _clients[engine])
+            else:
+                _clients[engine] = CanvasClient()
+        return _clients[engine]
+
+
+def get_courses():
+    return get_client().get_courses()
+
+def get_total_score(course_id):
+    return get_client().get_total_score(course_id)
+
+def get_assignment_groups(course_id):
+    return get_client().get_assignment_groups(course_id)
+
+def fetch_and_save_scores(csv_path="programs/study_scores.csv"):
+    return get_client().refresh(scores_path=csv_path)
+
+def fetch_and_save_exams(csv_path="programs/exams.csv"):
+    return get_client().refresh(exams_path=csv_path)
 
 def main():
-    courses = get_courses()
+    client = get_client()
+    courses = client.get_courses()
     for course in courses:
         course_id = course.get("id")
         course_name = course.get("name")
         print(f"\nCourse: {course_name} (ID: {course_id})")
         try:
-            total_score = get_total_score(course_id)
+            total_score = client.get_total_score(course_id)
             print(f"  Total Score: {total_score}")
         except Exception as e:
             print(f"  Total Score: N/A ({e})")
         try:
-            groups = get_assignment_groups(course_id)
+            groups = client.get_assignment_groups(course_id)
             for group in groups:
                 if "Assessed Coursework" in group.get("name", ""):
                     print(f"  Assignment Group: {group['name']}")
@@ -119,5 +520,8 @@ def main():
 
 if __name__ == "__main__":
     # For manual testing, fetch and save to CSV
-    fetch_and_save_scores()
-    fetch_and_save_exams()
\ No newline at end of file
+    metrics = get_client().refresh("programs/study_scores.csv", "programs/exams.csv")
+    print(f"Sync {metrics['status']} in {metrics['duration']}s "
+          f"({metrics['requests']} requests, {metrics['retries']} retries)")
+    for failure in metrics["failures"]:
+        print(f"  Failed: {failure}")
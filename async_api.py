@@ -0,0 +1,168 @@
+"""
+asyncio sync engine for the Canvas client.
+
+AsyncCanvasClient is a CanvasClient whose per-course fetch step issues every
+enrollments and assignment group request concurrently on one event loop, so
+a sync takes about as long as its slowest requests rather than their sum.
+The number in flight is still set by the client's AdaptiveLimiter (AIMD on
+Canvas's rate limit headers, with the same retry/backoff rules), and the
+fetched data lands in the same refresh caches, so the CSV writers are shared
+with the threaded engine.
+
+Connection pools: the course list still goes through the client's requests
+session, so pass session= to share one pool (as multi_sync does). The per-course
+requests use an httpx/aiohttp client opened for each refresh, because an async
+client is tied to the event loop it runs on; those connections are not shared
+between clients.
+
+Needs httpx or aiohttp (whichever is installed; httpx preferred):
+
+    pip install httpx
+"""
+import asyncio
+import json
+
+import API
+from rate_limit import AdaptiveLimiter, MAX_RETRIES, backoff_delay, is_retryable, is_throttled, parse_remaining
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Coroutines are cheap, so the async engine may go well past the threaded cap
+# when Canvas's quota allows it
+MAX_IN_FLIGHT = 64
+
+
+def available():
+    return httpx is not None or aiohttp is not None
+
+
+class AsyncRequestError(Exception):
+    def __init__(self, status, url):
+        super().__init__(f"{status} Error for url: {url}")
+        self.status = status
+
+
+class SyncCancelled(Exception):
+    pass
+
+
+class AsyncCanvasClient(API.CanvasClient):
+    def __init__(self, api_url=API.API_URL, access_token=API.ACCESS_TOKEN, limiter=None, session=None):
+        if not available():
+            raise ImportError("The async sync engine needs httpx or aiohttp installed")
+        super().__init__(api_url, access_token, limiter or AdaptiveLimiter(max_limit=MAX_IN_FLIGHT),
+                         session=session)
+
+    def _prefetch(self, courses, scores=True, cancel_event=None):
+        asyncio.run(self._prefetch_async(courses, scores, cancel_event))
+
+    async def _prefetch_async(self, courses, scores, cancel_event):
+        self._gate = asyncio.Condition()
+        self._in_flight = 0
+        self._cancel_event = cancel_event
+        if httpx is not None:
+            # Follow redirects like requests and aiohttp do; anything not 2xx is an error
+            async with httpx.AsyncClient(headers=self.auth_headers, timeout=API.REQUEST_TIMEOUT,
+                                         follow_redirects=True) as http:
+                await self._fetch_courses(http, courses, scores, cancel_event)
+        else:
+            timeout = aiohttp.ClientTimeout(total=API.REQUEST_TIMEOUT)
+            async with aiohttp.ClientSession(headers=self.auth_headers, timeout=timeout) as http:
+                await self._fetch_courses(http, courses, scores, cancel_event)
+
+    async def _fetch_courses(self, http, courses, scores, cancel_event):
+        async def load(course):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            course_id = course.get("id")
+            if scores and course_id not in self._scores:
+                try:
+                    self._scores[course_id] = API.enrollment_score(
+                        await self._get_async(http, f"/courses/{course_id}/enrollments"))
+                except Exception as e:
+                    self._scores[course_id] = None
+                    self._course_failed(course, "score", e)
+            try:
+                self._groups[course_id] = await self._get_async(
+                    http, f"/courses/{course_id}/assignment_groups?include[]=assignments")
+            except Exception as e:
+                self._groups[course_id] = []
+                self._course_failed(course, "groups", e)
+
+        await asyncio.gather(*(load(course) for course in courses))
+
+    async def _acquire(self):
+        async with self._gate:
+            await self._gate.wait_for(lambda: self._in_flight < int(self.limiter.limit))
+            self._in_flight += 1
+
+    async def _release(self):
+        async with self._gate:
+            self._in_flight -= 1
+            self._gate.notify_all()
+
+    async def _send(self, http, url):
+        """One GET; returns (status, headers, body text, next page url or None)."""
+        if httpx is not None:
+            resp = await http.get(url)
+            next_url = resp.links.get("next", {}).get("url")
+            return resp.status_code, resp.headers, resp.text, next_url
+        async with http.get(url) as resp:
+            next_link = resp.links.get("next")
+            next_url = str(next_link["url"]) if next_link else None
+            return resp.status, resp.headers, await resp.text(), next_url
+
+    async def _request_async(self, http, url):
+        """Async counterpart of CanvasClient._request, with the same retry rules."""
+        for attempt in range(MAX_RETRIES + 1):
+            status = headers = None
+            await self._acquire()
+            try:
+                if self._cancel_event is not None and self._cancel_event.is_set():
+                    raise SyncCancelled("sync cancelled")
+                self._count(url)
+                status, headers, body, next_url = await self._send(http, url)
+            except (OSError, asyncio.TimeoutError) as e:
+                error = e
+            except Exception as e:
+                # httpx/aiohttp transport errors don't share a base class with OSError
+                if httpx is not None and isinstance(e, httpx.TransportError):
+                    error = e
+                elif aiohttp is not None and isinstance(e, aiohttp.ClientError):
+                    error = e
+                else:
+                    raise
+            finally:
+                await self._release()
+            if status is not None:
+                if 200 <= status < 300:
+                    self.limiter.on_success(parse_remaining(headers))
+                    return json.loads(body), next_url
+                if is_throttled(status, body):
+                    self.limiter.on_throttle()
+                elif not is_retryable(status):
+                    raise AsyncRequestError(status, url)
+                error = AsyncRequestError(status, url)
+            if attempt == MAX_RETRIES:
+                raise error
+            self._count(url, retry=True)
+            await asyncio.sleep(backoff_delay(attempt, headers.get("Retry-After") if headers else None))
+
+    async def _get_async(self, http, path):
+        sep = "&" if "?" in path else "?"
+        url = f"{self.api_url}{path}{sep}per_page={API.PER_PAGE}"
+        results = []
+        while url:
+            page, url = await self._request_async(http, url)
+            if not isinstance(page, list):
+                return page
+            results.extend(page)
+        return results
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exam date parsing with strptime per row vs the memoized dates module.
+
+    python bench_dates.py [rows]
+
+Writes a synthetic exams.csv-format file (default 1,000,000 rows, due dates
+spread over two school years) to a temp dir and times the load_exams_from_csv
+parsing loop both ways.
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dates
+
+
+def write_exams(path, rows, seed=0):
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for i in range(rows):
+            day = start + timedelta(days=rng.randrange(730))
+            writer.writerow([f"SAC {i % 12}", day.isoformat(), 0.5, f"Subject {i % 40:02d}"])
+
+
+def load_strptime(path):
+    days = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for name, date_str, diff, subject in csv.reader(f):
+            days.append(datetime.strptime(date_str, "%Y-%m-%d").toordinal())
+    return days
+
+
+def load_cached(path):
+    days = []
+    parse_day = dates.parse_day
+    with open(path, newline='', encoding='utf-8') as f:
+        for name, date_str, diff, subject in csv.reader(f):
+            days.append(parse_day(date_str))
+    return days
+
+
+def timed(fn, path):
+    start = time.perf_counter()
+    result = fn(path)
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "exams.csv")
+        write_exams(path, rows)
+        # Read once so both runs start with the file in the page cache
+        with open(path, 'rb') as f:
+            while f.read(1 << 20):
+                pass
+        slow, expected = timed(load_strptime, path)
+        dates.clear_cache()
+        fast, actual = timed(load_cached, path)
+        assert actual == expected, "parsers disagree"
+        print(f"{rows:,} rows: strptime {slow:.2f}s, cached fromisoformat {fast:.2f}s "
+              f"({slow / fast:.1f}x faster, {dates.parse_day.cache_info().currsize} distinct dates)")
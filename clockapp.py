@@ -1,9 +1,11 @@
 import sys
-import csv
 import os
+import functools
 from pathlib import Path
 from datetime import datetime, timedelta
 
+from data_service import STUDYTIME_FILE, get_service
+
 try:
     import tkinter as tk
     from tkinter import ttk, messagebox
@@ -21,6 +23,71 @@ except ImportError:
     )
     sys.exit(1)
 
+SEARCH_DEBOUNCE_MS = 150  # wait for a pause in typing before filtering
+NGRAM_MAX = 3
+SEARCH_CACHE_SIZE = 256  # recent queries kept; typing produces a new one per keystroke
+
+
+class TimezoneIndex:
+    """
+    Prebuilt n-gram index over lowercased timezone names.
+
+    Every 1..NGRAM_MAX character gram of each zone name points at the zones that
+    contain it, so a query only has to verify the zones in the smallest matching
+    posting list instead of scanning all of them.
+    """
+
+    def __init__(self, zones):
+        self.zones = tuple(sorted(zones))
+        self._lower = [tz.lower() for tz in self.zones]
+        # City/region components, e.g. "America/Argentina/Buenos_Aires" ->
+        # ("america", "argentina", "buenos_aires", "buenos", "aires")
+        self._parts = []
+        self._grams = {}
+        for idx, name in enumerate(self._lower):
+            parts = name.split('/')
+            for part in list(parts):
+                if '_' in part:
+                    parts.extend(part.split('_'))
+            self._parts.append(tuple(parts))
+            for n in range(1, NGRAM_MAX + 1):
+                for i in range(len(name) - n + 1):
+                    self._grams.setdefault(name[i:i + n], set()).add(idx)
+        self._search = functools.lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search_uncached)
+
+    def _rank(self, idx, q):
+        """Lower is better: exact, name prefix, component prefix, substring."""
+        name = self._lower[idx]
+        if name == q:
+            return 0
+        if name.startswith(q):
+            return 1
+        if any(part.startswith(q) for part in self._parts[idx]):
+            return 2
+        return 3
+
+    def search(self, query):
+        """Return matching zone names, best matches first, ties alphabetical."""
+        q = query.strip().lower()
+        if not q:
+            return self.zones
+        return self._search(q)
+
+    def _search_uncached(self, q):
+        n = min(len(q), NGRAM_MAX)
+        postings = []
+        for i in range(len(q) - n + 1):
+            ids = self._grams.get(q[i:i + n])
+            if not ids:
+                return ()
+            postings.append(ids)
+        candidates = min(postings, key=len)
+        matches = [idx for idx in candidates if q in self._lower[idx]]
+        # Zones are stored sorted, so the index doubles as the alphabetical tiebreak
+        matches.sort(key=lambda idx: (self._rank(idx, q), idx))
+        return tuple(self.zones[idx] for idx in matches)
+
+
 class TimezoneClockApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -31,7 +98,7 @@ class TimezoneClockApp(tk.Tk):
         # Setup data directory and file
         self.data_dir = Path.home() / "TimezoneClockData"
         #self.data_file = self.data_dir / "studytime.csv"
-        self.data_file = "programs/studytime.csv"
+        self.data_file = STUDYTIME_FILE
         os.makedirs(self.data_dir, exist_ok=True)
 
         # Record when the app was opened
@@ -83,9 +150,11 @@ class TimezoneClockApp(tk.Tk):
         self.search_var = tk.StringVar()
         self.search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=20)
         self.search_entry.grid(row=0, column=1, sticky='w')
-        self.search_entry.bind("<KeyRelease>", lambda e: self.filter_timezones())
+        self.search_entry.bind("<KeyRelease>", lambda e: self.schedule_filter())
+        self._filter_job = None
 
-        self.all_timezones = available_timezones()
+        self.tz_index = TimezoneIndex(available_timezones())
+        self.all_timezones = self.tz_index.zones
         self.filtered_timezones = self.all_timezones
         self.selected_tz = tk.StringVar(value="UTC")
         self.tz_combo = ttk.Combobox(
@@ -121,9 +190,18 @@ class TimezoneClockApp(tk.Tk):
         self.change_btn.config(state='normal')
         self.update_time()
 
+    def schedule_filter(self):
+        # Debounce: only filter once the user pauses typing
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(SEARCH_DEBOUNCE_MS, self.filter_timezones)
+
     def filter_timezones(self):
-        q = self.search_var.get().lower()
-        self.filtered_timezones = [tz for tz in self.all_timezones if q in tz.lower()] if q else self.all_timezones.copy()
+        self._filter_job = None
+        matches = self.tz_index.search(self.search_var.get())
+        if matches == self.filtered_timezones:
+            return
+        self.filtered_timezones = matches
         self.tz_combo['values'] = self.filtered_timezones
         if self.selected_tz.get() not in self.filtered_timezones:
             self.selected_tz.set('')
@@ -164,15 +242,13 @@ class TimezoneClockApp(tk.Tk):
         try:
             # Check if file exists to write header
             file_exists = os.path.isfile(self.data_file)
-            
-            with open(self.data_file, mode='a', newline='', encoding='utf-8') as file:
-                writer = csv.writer(file)
-                if not file_exists:
-                    writer.writerow(['Timestamp', 'Duration'])  # Write header if new file
-                writer.writerow([
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 
-                    str(elapsed_time)
-                ])
+            rows = [] if file_exists else [['Timestamp', 'Duration']]  # Write header if new file
+            rows.append([
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S"), 
+                str(elapsed_time)
+            ])
+            # Appended through the data service so an open study log updates itself
+            get_service().append(self.data_file, rows)
                 
         except PermissionError:
             messagebox.showerror(
@@ -0,0 +1,194 @@
+"""
+Memory-mapped column reader for the CSV files in programs/.
+
+Scans the raw bytes of a file for delimiters and hands back only the requested
+columns, as memoryview slices into the mapping, for only the rows matching a
+filter, so e.g. the Total rows of a large study_scores.csv can be read without
+decoding or building every row:
+
+    with MappedCSV(path) as data:
+        for subject, score in data.scan(["Subject", "Score"], where={"SAC": "Total"}):
+            totals[text(subject)] = text(score)
+
+Decode values with text() while the reader is open. Rows containing a quote
+character (or a bare carriage return) take a slow path through the csv module (values are then plain
+str), so quoted fields, embedded commas and newlines parse exactly as
+csv.reader would. Blank lines are skipped, and a row shorter than the header
+yields None for the missing columns, as csv.DictReader does.
+"""
+import csv
+import io
+import mmap
+import os
+
+DELIMITER = b","
+WHITESPACE = b" \t\r\n\x0b\x0c\x1c\x1d\x1e\x1f"  # the ASCII characters str.strip() removes
+
+
+def text(value):
+    """Decode a scanned value (memoryview or str) to str; None stays None."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value, 'utf-8')
+
+
+def _record_end(mm, pos, size):
+    """End of the record starting at pos (just past its newline), respecting quotes."""
+    quotes = 0
+    nl = mm.find(b"\n", pos)
+    while nl != -1:
+        quotes += mm[pos:nl + 1].count(b'"')
+        pos = nl + 1
+        if quotes % 2 == 0:
+            return pos
+        nl = mm.find(b"\n", pos)
+    return size
+
+
+def _pick(positions, width):
+    """First of positions (last-first header indexes) that a row of width fields has."""
+    for i in positions:
+        if i < width:
+            return i
+    return None
+
+
+class MappedCSV:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        st = os.fstat(self._file.fileno())
+        self.version = (st.st_ino, st.st_mtime_ns, st.st_size)  # as persistence.snapshot_version
+        self.size = st.st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._view = memoryview(self._mm) if self._mm is not None else None
+        self.header = []
+        self._data_start = 0
+        if self._mm is not None:
+            end = _record_end(self._mm, 0, self.size)
+            self.header = self._parse_record(0, end)
+            self._data_start = end
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:
+                pass  # a caller still holds a slice; the map closes once it is collected
+            self._mm = None
+        self._file.close()
+
+    def positions(self, column):
+        """Header positions of column, last first (a repeated name takes the last value present)."""
+        return [i for i in range(len(self.header) - 1, -1, -1) if self.header[i] == column]
+
+    def _parse_record(self, start, end):
+        rows = csv.reader(io.StringIO(self._mm[start:end].decode('utf-8'), newline=''))
+        return next(rows, [])
+
+    def _fields(self, start, end, count):
+        """(start, end) offsets of the first count fields of the line mm[start:end]."""
+        mm = self._mm
+        bounds = []
+        pos = start
+        while len(bounds) < count:
+            comma = mm.find(DELIMITER, pos, end)
+            if comma == -1:
+                bounds.append((pos, end))
+                break
+            bounds.append((pos, comma))
+            pos = comma + 1
+        return bounds
+
+    def _matches(self, a, b, target, target_bytes):
+        # Compare stripped, in place; only non-ASCII fields need decoding (str.strip is Unicode-aware)
+        view = self._view
+        while a < b and view[a] in WHITESPACE:
+            a += 1
+        while b > a and view[b - 1] in WHITESPACE:
+            b -= 1
+        if view[a:b] == target_bytes:
+            return True
+        return not self._mm[a:b].isascii() and text(view[a:b]).strip() == target
+
+    def scan(self, columns, where=None):
+        """
+        Yield a tuple of values for columns from each row whose where columns
+        equal the given strings after stripping whitespace (all must match).
+        """
+        if self._mm is None:
+            return
+        wanted = [self.positions(c) for c in columns]
+        conditions = [(self.positions(c), value, value.encode('utf-8')) for c, value in (where or {}).items()]
+        if any(not p for p, _, _ in conditions):
+            return  # filtering on a column the file doesn't have matches nothing
+        needed = max([p[0] for p in wanted if p] + [p[0] for p, _, _ in conditions] + [0]) + 1
+
+        mm, size = self._mm, self.size
+        if conditions and conditions[0][2] and mm.find(b'"', self._data_start) == -1:
+            # No quoting anywhere, so every record is one line: jump between
+            # occurrences of the first filter value instead of visiting each line
+            # (a field equal to it after stripping must contain it)
+            raw = conditions[0][2]
+            pos = self._data_start
+            while True:
+                hit = mm.find(raw, pos)
+                if hit == -1:
+                    return
+                start = max(mm.rfind(b"\n", self._data_start, hit) + 1, self._data_start)
+                nl = mm.find(b"\n", hit)
+                end = size if nl == -1 else nl
+                yield from self._line(start, end, wanted, conditions, needed)
+                pos = end + 1
+
+        pos = self._data_start
+        while pos < size:
+            nl = mm.find(b"\n", pos)
+            end = size if nl == -1 else nl
+            if mm.find(b'"', pos, end) != -1:
+                record_end = _record_end(mm, pos, size)
+                yield from self._slow(pos, record_end, wanted, conditions)
+                pos = record_end
+                continue
+            yield from self._line(pos, end, wanted, conditions, needed)
+            pos = end + 1
+
+    def _line(self, start, end, wanted, conditions, needed):
+        """Values from the unquoted line mm[start:end], if it is not blank or filtered out."""
+        mm = self._mm
+        stop = end - 1 if end > start and mm[end - 1] == 13 else end  # the \r of \r\n
+        if start == stop:
+            return
+        if mm.find(b"\r", start, stop) != -1:
+            # csv.reader ends a row at a bare \r too
+            yield from self._slow(start, end, wanted, conditions)
+            return
+        fields = self._fields(start, stop, needed)
+        n = len(fields)
+        for positions, value, raw in conditions:
+            i = _pick(positions, n)
+            if i is None or not self._matches(*fields[i], value, raw):
+                return
+        view = self._view
+        yield tuple(None if i is None else view[fields[i][0]:fields[i][1]]
+                    for i in (_pick(p, n) for p in wanted))
+
+    def _slow(self, start, end, wanted, conditions):
+        """Values (as str) from the rows of mm[start:end], parsed by the csv module."""
+        for row in csv.reader(io.StringIO(self._mm[start:end].decode('utf-8'), newline='')):
+            if not row:
+                continue
+            n = len(row)
+            checks = [(_pick(p, n), value) for p, value, _ in conditions]
+            if all(i is not None and row[i].strip() == value for i, value in checks):
+                yield tuple(None if i is None else row[i] for i in (_pick(p, n) for p in wanted))
@@ -0,0 +1,184 @@
+"""
+Chunked, multi-process parsing for large exams / difficulty / score files.
+
+Whole-school, multi-year exports use the same formats as programs/, but are far
+too big for a single csv.reader loop. Files of at least LARGE_FILE bytes are
+split into chunks on line boundaries (found by scanning an mmap of the file,
+never inside a quoted field) and each chunk is parsed in a process pool. The
+per-row parsing is the same function whether a chunk runs in a worker or, for
+small files, in-process, and chunk results are concatenated in file order, so
+the output is identical to a sequential parse.
+"""
+import csv
+import io
+import math
+import mmap
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from dates import parse_day
+
+LARGE_FILE = 8 * 1024 * 1024  # bytes; smaller files are parsed in-process
+CHUNKS_PER_WORKER = 4
+
+
+def _open_map(f):
+    """Read-only mmap of an open binary file, or None if it is empty."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return None
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _next_row_end(mm, pos, quotes):
+    """
+    Offset just past the first newline at or after pos that is not inside a
+    quoted field, given the number of quote bytes before pos. Returns
+    (offset, quotes before offset), or (None, quotes) at end of file.
+    """
+    nl = mm.find(b"\n", pos)
+    while nl != -1:
+        quotes += mm[pos:nl + 1].count(b'"')
+        pos = nl + 1
+        if quotes % 2 == 0:
+            return pos, quotes
+        nl = mm.find(b"\n", pos)
+    return None, quotes
+
+
+def read_header(path):
+    """(header row, byte offset of the first data row); ([], 0) for an empty file."""
+    with open(path, 'rb') as f:
+        mm = _open_map(f)
+        if mm is None:
+            return [], 0
+        with mm:
+            end, _ = _next_row_end(mm, 0, 0)
+            end = end or len(mm)
+            rows = list(csv.reader(io.StringIO(mm[:end].decode('utf-8'), newline='')))
+    return (rows[0] if rows else []), end
+
+
+def split_chunks(path, count, start=0):
+    """Split path[start:] into about count (start, end) byte ranges ending on row boundaries."""
+    with open(path, 'rb') as f:
+        mm = _open_map(f)
+        if mm is None:
+            return []
+        with mm:
+            size = len(mm)
+            if start >= size:
+                return []
+            step = max(1, math.ceil((size - start) / max(1, count)))
+            bounds = [start]
+            quotes = mm[:start].count(b'"')
+            scanned = start
+            while bounds[-1] + step < size:
+                # Count quotes up to the target so the boundary search knows if it is inside a field
+                target = bounds[-1] + step
+                quotes += mm[scanned:target].count(b'"')
+                end, quotes = _next_row_end(mm, target, quotes)
+                if end is None or end >= size:
+                    break
+                scanned = end
+                bounds.append(end)
+            bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _chunk_rows(path, start, end):
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = mm[start:end].decode('utf-8')
+    return csv.reader(io.StringIO(text, newline=''))
+
+
+def _parse_chunk(task):
+    parse_rows, path, start, end, header = task
+    return parse_rows(_chunk_rows(path, start, end), header)
+
+
+def _pool_context():
+    # fork is the cheapest start (nothing is re-imported), but forking a process
+    # that already runs other threads (the Tk app's executor, timers) can
+    # deadlock the child on a lock some thread held, and warns on Python 3.12+.
+    # So fork only while single-threaded (scripts, tests) on Linux; otherwise
+    # use a forkserver (children fork from a clean single-threaded server) or,
+    # where there is none (Windows), spawn. Both re-import main.py, whose
+    # startup is guarded by __main__.
+    methods = multiprocessing.get_all_start_methods()
+    if sys.platform.startswith("linux") and threading.active_count() == 1 and "fork" in methods:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def parse_file(path, parse_rows, has_header=False, workers=None, large_file=LARGE_FILE):
+    """
+    Run parse_rows(rows, header) over every chunk of path and return the
+    concatenated results in file order. parse_rows must be a module-level
+    function (it is sent to worker processes) returning a list.
+    """
+    header, start = read_header(path) if has_header else (None, 0)
+    size = os.path.getsize(path)
+    workers = workers or os.cpu_count() or 1
+    if size < large_file or workers == 1:
+        chunks = [(start, size)] if size > start else []
+        return [item for chunk in chunks
+                for item in _parse_chunk((parse_rows, path, chunk[0], chunk[1], header))]
+    chunks = split_chunks(path, workers * CHUNKS_PER_WORKER, start)
+    tasks = [(parse_rows, path, s, e, header) for s, e in chunks]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        for part in pool.map(_parse_chunk, tasks):
+            results.extend(part)
+    return results
+
+
+# Row parsers: each mirrors the loop of the loader it replaces, row for row
+
+def exam_rows(rows, header=None):
+    """exams.csv rows -> (name, day, difficulty, subject), as load_exams_from_csv keeps them."""
+    exams = []
+    for row in rows:
+        if len(row) == 4:
+            name, date_str, diff, subject = row
+            try:
+                day = parse_day(date_str)
+                difficulty = float(diff)
+                if math.isnan(difficulty):
+                    continue
+                exams.append((name, day, difficulty, subject))
+            except ValueError:
+                continue
+    return exams
+
+
+def difficulty_rows(rows, header):
+    """difficulty.csv rows -> (subject, difficulty) pairs, later pairs overriding earlier ones."""
+    pairs = []
+    for values in rows:
+        if not values:
+            continue  # csv.DictReader skips blank lines
+        row = dict(zip(header, values))
+        subj = row.get('subject') or row.get('Subject')
+        diff = row.get('difficulty') or row.get('Difficulty')
+        try:
+            difficulty = float(diff)
+            if math.isnan(difficulty):
+                continue
+            pairs.append((subj, difficulty))
+        except (TypeError, ValueError):
+            continue
+    return pairs
+
+
+def load_exam_rows(path, workers=None):
+    return parse_file(path, exam_rows, workers=workers)
+
+
+def load_difficulties(path, workers=None):
+    return dict(parse_file(path, difficulty_rows, has_header=True, workers=workers))
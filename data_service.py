@@ -0,0 +1,166 @@
+"""
+One in-process owner for the CSV files in programs/.
+
+main.py and the tool windows it hosts (studytime, testscore, subject
+difficulty, subject selection) get their paths, data and writes from the
+shared DataService instead of each parsing the files on its own:
+
+- load(path, parser) parses a file once per version (see
+  persistence.snapshot_version) and hands every caller the same result, so
+  treat it as read-only. It reads what is on disk: a coalesced write still
+  waiting in persistence shows up once it lands, which is also when its
+  subscribers are told. Loading never flushes it.
+- write()/append() go through persistence, and every completed write to a file
+  (including the Canvas sync's streamed writes) is pushed to the callbacks
+  subscribed to it, on the Tk thread when a widget is given. Nothing polls.
+- check() re-stats the subscribed files and notifies for any that another
+  process changed; the windows call it when they regain focus.
+"""
+import csv
+import math
+import os
+import threading
+
+import persistence
+
+PROGRAMS_DIR = "programs"
+EXAMS_FILE = os.path.join(PROGRAMS_DIR, "exams.csv")
+SUBJECTS_FILE = os.path.join(PROGRAMS_DIR, "selected_subjects.csv")
+SCORES_FILE = os.path.join(PROGRAMS_DIR, "study_scores.csv")
+DIFFICULTY_FILE = os.path.join(PROGRAMS_DIR, "difficulty.csv")
+TARGET_SCORES_FILE = os.path.join(PROGRAMS_DIR, "target_scores.csv")
+STUDYTIME_FILE = os.path.join(PROGRAMS_DIR, "studytime.csv")
+CACHE_FILE = os.path.join(PROGRAMS_DIR, "cache_timestamp.txt")
+
+
+# Parsers shared by the tools; each takes a path and returns the parsed data
+
+def read_rows(path):
+    """All rows, header included."""
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def read_subjects(path):
+    """selected_subjects.csv -> subjects in file order (blank rows skipped)."""
+    return [subject for row in read_rows(path) for subject in row]
+
+
+def read_target_scores(path):
+    """target_scores.csv -> {subject: target}, keeping valid targets (0-50) only."""
+    target_scores = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            subject = row.get('Subject', '')
+            target_score = row.get('Target_Score', '')
+            try:
+                score = float(target_score)
+                if not math.isnan(score) and 0 <= score <= 50:
+                    target_scores[subject] = score
+            except (TypeError, ValueError):
+                continue
+    return target_scores
+
+
+class DataService:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._cache = {}        # (abs path, parser) -> (version, data)
+        self._subscribers = {}  # abs path -> [(callback, tk_widget)]
+        self._seen = {}         # abs path -> version last notified, for check()
+        persistence.add_listener(self._on_write)
+
+    def close(self):
+        persistence.remove_listener(self._on_write)
+
+    def load(self, path, parser=read_rows):
+        """
+        parser(path), reparsed only when the file has changed. parser is part
+        of the cache key, so pass a module-level function rather than a lambda.
+        Raises FileNotFoundError if path doesn't exist.
+        """
+        key = os.path.abspath(path)
+        version = persistence.snapshot_version(path)
+        if version is None:
+            raise FileNotFoundError(f"File '{path}' not found.")
+        with self._lock:
+            cached = self._cache.get((key, parser))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        data = parser(path)
+        with self._lock:
+            self._cache[(key, parser)] = (version, data)
+        return data
+
+    def write(self, path, rows, header=None, coalesce=False):
+        persistence.write_rows(path, rows, header=header, coalesce=coalesce)
+
+    def append(self, path, rows):
+        persistence.append_rows(path, rows)
+
+    def subscribe(self, path, callback, tk_widget=None):
+        """
+        Call callback(path) whenever path is rewritten. With tk_widget the call
+        is handed to the Tk thread and dropped once the widget is destroyed.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            self._subscribers.setdefault(key, []).append((callback, tk_widget))
+            self._seen.setdefault(key, persistence.snapshot_version(path))
+
+    def unsubscribe(self, path, callback):
+        key = os.path.abspath(path)
+        with self._lock:
+            subscribers = self._subscribers.get(key, [])
+            subscribers[:] = [s for s in subscribers if s[0] != callback]
+
+    def check(self):
+        """Notify subscribers of files changed behind our back (e.g. by another process)."""
+        with self._lock:
+            keys = list(self._subscribers)
+        for key in keys:
+            version = persistence.snapshot_version(key)
+            with self._lock:
+                changed = version != self._seen.get(key)
+                self._seen[key] = version
+            if changed:
+                self._publish(key)
+
+    def _on_write(self, key):
+        with self._lock:
+            if key not in self._subscribers:
+                return
+            self._seen[key] = persistence.snapshot_version(key)
+        self._publish(key)
+
+    def _publish(self, key):
+        with self._lock:
+            subscribers = list(self._subscribers.get(key, []))
+        for callback, tk_widget in subscribers:
+            if tk_widget is None:
+                callback(key)
+                continue
+            try:
+                tk_widget.after(0, self._deliver, callback, tk_widget, key)
+            except RuntimeError:
+                pass  # the Tk main loop has already gone
+            except Exception:
+                self.unsubscribe(key, callback)  # TclError: widget destroyed
+
+    def _deliver(self, callback, tk_widget, key):
+        if tk_widget.winfo_exists():
+            callback(key)
+        else:
+            self.unsubscribe(key, callback)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_service():
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = DataService()
+        return _service
@@ -0,0 +1,45 @@
+"""
+Shared, memoized date parsing for the CSV loaders and the Canvas sync.
+
+Exam files repeat the same handful of due dates over and over, so each
+distinct string is parsed once. YYYY-MM-DD strings take the date.fromisoformat
+fast path; anything else falls back to strptime("%Y-%m-%d"), so the accepted
+inputs (e.g. unpadded "2025-8-4") are exactly those of the old loader.
+"""
+import datetime
+from functools import lru_cache
+
+DATE_FORMAT = "%Y-%m-%d"
+CACHE_SIZE = 4096  # distinct strings kept; a school year has a few hundred due dates
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(text):
+    """'2025-08-04' -> date(2025, 8, 4); raises ValueError like strptime."""
+    if len(text) == 10 and text[4] == "-" and text[7] == "-" and text.isascii():
+        try:
+            return datetime.date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(text, DATE_FORMAT).date()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_day(text):
+    """Proleptic ordinal of parse_date(text), as stored in ExamRecord.day."""
+    return parse_date(text).toordinal()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_canvas_date(timestamp):
+    """
+    Calendar date of a Canvas ISO 8601 timestamp such as '2025-08-04T13:59:59Z',
+    in the timestamp's own offset (UTC for Canvas).
+    """
+    return datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00")).date()
+
+
+def clear_cache():
+    parse_date.cache_clear()
+    parse_day.cache_clear()
+    parse_canvas_date.cache_clear()
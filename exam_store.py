@@ -0,0 +1,146 @@
+"""
+Exam store keyed by (subject, name, date).
+
+Reloading exams.csv upserts into the store instead of appending to a list, so
+a reload never duplicates exams, and each reload reports which keys were added,
+changed or removed so the UI can recompute priorities for just those.
+
+Exams are held as compact ExamRecords: slotted, immutable, with the subject
+string interned (a handful of subjects is shared by every exam) and the due
+date stored as a proleptic ordinal day instead of a full datetime object.
+"""
+import sys
+from datetime import datetime
+
+
+class ExamRecord:
+    __slots__ = ("name", "subject", "day", "difficulty")
+
+    def __init__(self, name, day, difficulty, subject):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "subject", sys.intern(subject))
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "difficulty", difficulty)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    @property
+    def datetime(self):
+        """Midnight at the start of the due date, as the CSV loader used to store it"""
+        return datetime.fromordinal(self.day)
+
+    def days_until(self, now):
+        """Same as (self.datetime - now).days without building the datetime"""
+        days = self.day - now.toordinal()
+        if now.hour or now.minute or now.second or now.microsecond:
+            days -= 1
+        return days
+
+    def _fields(self):
+        return (self.name, self.subject, self.day, self.difficulty)
+
+    def __eq__(self, other):
+        if not isinstance(other, ExamRecord):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        return (f"ExamRecord(name={self.name!r}, date={self.datetime.date()}, "
+                f"difficulty={self.difficulty!r}, subject={self.subject!r})")
+
+
+def exam_key(exam):
+    return (exam.subject, exam.name, exam.day)
+
+
+class ExamDelta:
+    def __init__(self):
+        self.added = []
+        self.changed = []
+        self.removed = []
+        self.subjects = set()  # subjects whose exam count or exams changed
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self):
+        return (f"ExamDelta(added={len(self.added)}, changed={len(self.changed)}, "
+                f"removed={len(self.removed)})")
+
+
+class ExamStore:
+    def __init__(self):
+        self._exams = {}           # key -> exam, in first-seen order
+        self._subject_counts = {}
+
+    def __len__(self):
+        return len(self._exams)
+
+    def __iter__(self):
+        return iter(self._exams.values())
+
+    def __contains__(self, key):
+        return key in self._exams
+
+    def items(self):
+        return self._exams.items()
+
+    def values(self):
+        return list(self._exams.values())
+
+    def subject_counts(self):
+        return dict(self._subject_counts)
+
+    def upsert(self, exam, delta=None):
+        """Insert or update one exam; returns its key."""
+        key = exam_key(exam)
+        old = self._exams.get(key)
+        if old is None:
+            self._exams[key] = exam
+            self._subject_counts[exam.subject] = self._subject_counts.get(exam.subject, 0) + 1
+            if delta is not None:
+                delta.added.append(key)
+                delta.subjects.add(exam.subject)
+        elif old != exam:
+            self._exams[key] = exam
+            if delta is not None:
+                delta.changed.append(key)
+                delta.subjects.add(exam.subject)
+        return key
+
+    def remove(self, key, delta=None):
+        exam = self._exams.pop(key, None)
+        if exam is None:
+            return
+        subject = exam.subject
+        self._subject_counts[subject] -= 1
+        if not self._subject_counts[subject]:
+            del self._subject_counts[subject]
+        if delta is not None:
+            delta.removed.append(key)
+            delta.subjects.add(subject)
+
+    def replace_all(self, exams):
+        """
+        Make the store hold exactly exams (e.g. a fresh read of exams.csv);
+        rows sharing a key collapse to the last one. Returns the ExamDelta.
+        """
+        delta = ExamDelta()
+        seen = set()
+        for exam in exams:
+            seen.add(self.upsert(exam, delta))
+        for key in [k for k in self._exams if k not in seen]:
+            self.remove(key, delta)
+        return delta
+
+    def clear(self):
+        delta = ExamDelta()
+        for key in list(self._exams):
+            self.remove(key, delta)
+        return delta
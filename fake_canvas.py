@@ -0,0 +1,255 @@
+"""
+Local stand-in for the parts of the Canvas REST API that API.py uses, for
+offline load and latency testing. Standard library only.
+
+    python fake_canvas.py --courses 300 --assignments 40 --latency 50 --rate-limit 20 --burst 100
+    CANVAS_API_URL=http://127.0.0.1:8765/api/v1 python API.py
+
+Serves, under /api/v1 (any Bearer token is accepted, a missing one gets 401):
+
+    GET /courses[?include[]=total_scores]
+    GET /courses/<id>/enrollments
+    GET /courses/<id>/assignment_groups?include[]=assignments
+
+List endpoints are paginated like Canvas (page/per_page query parameters and a
+Link header with rel="next"). Every response can be delayed (latency + random
+jitter), requests beyond the per-token rate limit get 429 with Retry-After,
+and a fraction of requests can be made to fail with 500 (or every per-course
+request of the course ids in server.forbidden with 403, like an
+access-restricted course). Like Canvas, each
+token has a bucket of quota (--burst, 700 by default) that refills at
+--rate-limit per second, and every response carries X-Rate-Limit-Remaining.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+API_PREFIX = "/api/v1"
+DEFAULT_PORT = 8765
+DEFAULT_PER_PAGE = 10  # Canvas's default page size
+DEFAULT_BURST = 700    # Canvas's per-token quota
+MAX_PER_PAGE = 100
+
+COURSE_PATH = re.compile(r"^/courses/(\d+)/(enrollments|assignment_groups)$")
+
+
+class FakeCanvasData:
+    """Deterministic synthetic courses, enrollments and assignment groups."""
+
+    def __init__(self, courses=8, assignments=12, seed=0, today=None):
+        rng = random.Random(seed)
+        today = today or date.today()
+        self.courses = []
+        self.enrollments = {}
+        self.groups = {}
+        for i in range(1, courses + 1):
+            course_id = 1000 + i
+            self.courses.append({"id": course_id, "name": f"Subject {i:03d}"})
+            self.enrollments[course_id] = [{
+                "type": "StudentEnrollment",
+                "grades": {"current_score": round(rng.uniform(40, 100), 1)},
+            }]
+            sacs, homework = [], []
+            for j in range(1, assignments + 1):
+                due = datetime.combine(today + timedelta(days=rng.randint(-60, 120)),
+                                       datetime.min.time(), timezone.utc)
+                assignment = {
+                    "id": course_id * 1000 + j,
+                    "name": f"{'SAC' if j % 3 == 0 else 'Task'} {j}",
+                    "due_at": due.isoformat().replace("+00:00", "Z"),
+                    "points_possible": 100,
+                    "score": round(rng.uniform(30, 100), 1) if rng.random() < 0.7 else None,
+                }
+                (sacs if j % 3 == 0 else homework).append(assignment)
+            self.groups[course_id] = [
+                {"id": course_id * 10 + 1, "name": "Assessed Coursework", "assignments": sacs},
+                {"id": course_id * 10 + 2, "name": "Homework", "assignments": homework},
+            ]
+
+
+class FakeCanvasServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data, latency=0.0, jitter=0.0, rate_limit=0,
+                 error_rate=0.0, seed=0, burst=DEFAULT_BURST, bulk_scores=True):
+        super().__init__(address, FakeCanvasHandler)
+        self.data = data
+        self.latency = latency          # seconds added to every response
+        self.jitter = jitter            # extra random delay, 0..jitter seconds
+        self.rate_limit = rate_limit    # quota refilled per second per token, 0 = unlimited
+        self.burst = burst              # quota bucket size
+        self.error_rate = error_rate    # fraction of requests answered with 500
+        self.bulk_scores = bulk_scores  # honour include[]=total_scores on /courses
+        self.forbidden = set()          # course ids whose per-course requests get 403
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.buckets = {}               # token -> [tokens_left, last_refill]
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0}
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def take_token(self, token):
+        """Token bucket per access token; returns requests remaining, or -1 if throttled."""
+        if not self.rate_limit:
+            return float(self.burst)
+        with self.lock:
+            now = time.monotonic()
+            bucket = self.buckets.setdefault(token, [float(self.burst), now])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_limit)
+            bucket[1] = now
+            if bucket[0] < 1:
+                return -1
+            bucket[0] -= 1
+            return bucket[0]
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+
+class FakeCanvasHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # keep benchmark output quiet
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Bearer "):
+            return self.send_json(401, {"errors": [{"message": "Invalid access token."}]})
+
+        delay = server.latency + (server.rng.uniform(0, server.jitter) if server.jitter else 0)
+        if delay:
+            time.sleep(delay)
+
+        remaining = server.take_token(auth)
+        if remaining < 0:
+            server.count("throttled")
+            return self.send_json(429, {"errors": [{"message": "Rate Limit Exceeded"}]},
+                                  {"Retry-After": "1", "X-Rate-Limit-Remaining": "0"})
+        rate_headers = {"X-Rate-Limit-Remaining": f"{remaining:.1f}"}
+
+        if server.error_rate and server.rng.random() < server.error_rate:
+            server.count("errors")
+            return self.send_json(500, {"errors": [{"message": "Internal server error"}]}, rate_headers)
+
+        if not url.path.startswith(API_PREFIX):
+            return self.send_json(404, {"errors": [{"message": "Not found"}]}, rate_headers)
+        path = url.path[len(API_PREFIX):]
+        data = server.data
+
+        if path == "/courses":
+            with_scores = server.bulk_scores and "total_scores" in query.get("include[]", [])
+            items = [self.course_with_enrollment(course, with_scores) for course in data.courses]
+        else:
+            match = COURSE_PATH.match(path)
+            course_id = int(match.group(1)) if match else None
+            if course_id not in data.enrollments:
+                return self.send_json(404, {"errors": [{"message": "The specified resource does not exist."}]},
+                                      rate_headers)
+            if course_id in server.forbidden:
+                return self.send_json(403, {"errors": [{"message": "user not authorized to perform that action"}]},
+                                      rate_headers)
+            if match.group(2) == "enrollments":
+                items = data.enrollments[course_id]
+            else:
+                include = query.get("include[]", [])
+                items = [group if "assignments" in include else
+                         {k: v for k, v in group.items() if k != "assignments"}
+                         for group in data.groups[course_id]]
+
+        self.send_page(url.path, query, items, rate_headers)
+
+    def course_with_enrollment(self, course, with_scores):
+        """Courses list the student's enrollment inline, with scores if asked for."""
+        enrollment = {"type": "student", "enrollment_state": "active"}
+        if with_scores:
+            score = self.server.data.enrollments[course["id"]][0]["grades"]["current_score"]
+            enrollment.update(computed_current_score=score, computed_final_score=score)
+        return dict(course, enrollments=[enrollment])
+
+    def send_page(self, path, query, items, headers):
+        try:
+            page = max(1, int(query.get("page", ["1"])[0]))
+            per_page = min(MAX_PER_PAGE, max(1, int(query.get("per_page", [DEFAULT_PER_PAGE])[0])))
+        except ValueError:
+            return self.send_json(400, {"errors": [{"message": "Invalid page"}]}, headers)
+        start = (page - 1) * per_page
+        links = []
+        if start + per_page < len(items):
+            params = {k: v for k, v in query.items() if k not in ("page", "per_page")}
+            params.update(page=[str(page + 1)], per_page=[str(per_page)])
+            host, port = self.server.server_address[:2]
+            next_url = f"http://{host}:{port}{path}?{urlencode(params, doseq=True)}"
+            links.append(f'<{next_url}>; rel="next"')
+        headers = dict(headers)
+        if links:
+            headers["Link"] = ", ".join(links)
+        self.send_json(200, items[start:start + per_page], headers)
+
+    def send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def serve(host="127.0.0.1", port=0, courses=8, assignments=12, latency=0.0, jitter=0.0,
+          rate_limit=0, error_rate=0.0, seed=0, burst=DEFAULT_BURST, bulk_scores=True):
+    """
+    Start a fake Canvas server on a background thread and return it; port 0
+    picks a free port (see server.base_url). Stop it with server.shutdown().
+    """
+    data = FakeCanvasData(courses, assignments, seed)
+    server = FakeCanvasServer((host, port), data, latency, jitter, rate_limit, error_rate, seed,
+                              burst, bulk_scores)
+    threading.Thread(target=server.serve_forever, name="fake-canvas", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline fake Canvas API for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--courses", type=int, default=8)
+    parser.add_argument("--assignments", type=int, default=12, help="assignments per course")
+    parser.add_argument("--latency", type=float, default=0.0, help="ms added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random ms, 0..jitter")
+    parser.add_argument("--rate-limit", type=float, default=0, help="quota refill/s per token (0 = off)")
+    parser.add_argument("--burst", type=float, default=DEFAULT_BURST, help="quota bucket size per token")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-bulk-scores", action="store_true",
+                        help="ignore include[]=total_scores (exercises the per-course fallback)")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.courses, args.assignments, args.latency / 1000,
+                   args.jitter / 1000, args.rate_limit, args.error_rate, args.seed, args.burst,
+                   not args.no_bulk_scores)
+    print(f"Fake Canvas serving {args.courses} courses at {server.base_url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"Stopped. {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,26 +4,36 @@ import customtkinter as ctk
 from datetime import datetime, timedelta
 import csv
 import os
-import subprocess
 import math
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import importlib.util
-import threading
 import time
 
+from data_service import get_service, read_subjects, read_target_scores
+import data_service
+from workers import API_REFRESH_KEY, API_REFRESH_TIMEOUT, JobCancelled, JobTimeout, get_executor
+from ui_styles import styles
+from score_index import ScoreIndex
+from priority_schedule import next_change_delay_ms
+from priority_index import PriorityIndex
+from exam_store import ExamStore, ExamRecord
+import csv_loader
+import perf
+
 # Set the appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
-# File paths
-CSV_FILE = "programs/exams.csv"
-SUBJECTS_FILE = "programs/selected_subjects.csv"
-TEST_SCORES_FILE = "programs/study_scores.csv"
-DIFFICULTY_FILE = "programs/difficulty.csv"
-TARGET_SCORES_FILE = "programs/target_scores.csv"
-CACHE_FILE = "programs/cache_timestamp.txt"
-CHECK_INTERVAL = 1000
+# File paths (owned by data_service, which the tool windows share)
+CSV_FILE = data_service.EXAMS_FILE
+SUBJECTS_FILE = data_service.SUBJECTS_FILE
+TEST_SCORES_FILE = data_service.SCORES_FILE
+DIFFICULTY_FILE = data_service.DIFFICULTY_FILE
+TARGET_SCORES_FILE = data_service.TARGET_SCORES_FILE
+CACHE_FILE = data_service.CACHE_FILE
+NEXT_UP_COUNT = 3  # exams shown in the sidebar's "Next Up" view
+PERF_PANEL_MS = 2000  # refresh interval of the sidebar performance panel (SAC_PERF=1)
+PERF_STATS_FILE = os.path.join("programs", "perf_stats.jsonl")
 CACHE_DURATION = 300  # 5 minutes in seconds
 
 def should_refresh_cache():
@@ -47,37 +57,40 @@ def update_cache_timestamp():
     except:
         pass
 
-def update_scores_from_api():
+@perf.timed()
+def update_scores_from_api(cancel_event=None, engine=None):
     """
-    Calls API.py's fetch_and_save_scores and fetch_and_save_exams to update CSVs before UI loads.
+    Syncs study_scores.csv and exams.csv from the Canvas API through the shared client
+    (engine as in API.get_client; CANVAS_SYNC_ENGINE sets the default).
+    Returns the refresh metrics (duration, per-step timings, request count, status).
+    In a partial sync the failed courses keep their previous rows, and the cache
+    timestamp is left alone so the next launch tries again. Errors propagate, so
+    the background executor reports them through on_error.
     """
-    try:
-        api_path = os.path.join(os.path.dirname(__file__), "API.py")
-        spec = importlib.util.spec_from_file_location("API", api_path)
-        api = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(api)
-        api.fetch_and_save_scores(TEST_SCORES_FILE)
-        api.fetch_and_save_exams(CSV_FILE)
+    # API.py (and requests) are imported on first use only
+    import API
+    metrics = API.get_client(engine).refresh(TEST_SCORES_FILE, CSV_FILE, cancel_event=cancel_event)
+    if metrics["status"] == "ok":
         update_cache_timestamp()
+    print(f"API refresh {metrics['status']}: {metrics['duration']}s, "
+          f"{metrics['requests']} requests, {metrics['retries']} retries")
+    for failure in metrics["failures"]:
+        print(f"  Failed: {failure}")
+    return metrics
+
+def sync_startup():
+    """Blocking sync before the UI loads; a failure only means starting on cached data"""
+    try:
+        update_scores_from_api()
     except Exception as e:
         print(f"Warning: Could not update scores/exams from API: {e}")
 
+@perf.timed()
 def load_difficulties():
     difficulties = {}
     if os.path.exists(DIFFICULTY_FILE):
         try:
-            with open(DIFFICULTY_FILE, mode='r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    subj = row.get('subject') or row.get('Subject')
-                    diff = row.get('difficulty') or row.get('Difficulty')
-                    try:
-                        difficulty = float(diff)
-                        if math.isnan(difficulty):
-                            continue
-                        difficulties[subj] = difficulty
-                    except (TypeError, ValueError):
-                        continue
+            difficulties = get_service().load(DIFFICULTY_FILE, csv_loader.load_difficulties)
         except Exception as e:
             messagebox.showerror("Error", f"Error loading difficulties: {e}")
     elif os.path.exists(TEST_SCORES_FILE):
@@ -96,22 +109,13 @@ def load_difficulties():
             messagebox.showerror("Error", f"Error loading test scores: {e}")
     return difficulties
 
+@perf.timed()
 def load_target_scores():
     """Load target study scores from CSV file"""
     target_scores = {}
     if os.path.exists(TARGET_SCORES_FILE):
         try:
-            with open(TARGET_SCORES_FILE, mode='r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    subject = row.get('Subject', '')
-                    target_score = row.get('Target_Score', '')
-                    try:
-                        score = float(target_score)
-                        if not math.isnan(score) and 0 <= score <= 50:
-                            target_scores[subject] = score
-                    except (TypeError, ValueError):
-                        continue
+            target_scores = get_service().load(TARGET_SCORES_FILE, read_target_scores)
         except Exception as e:
             messagebox.showerror("Error", f"Error loading target scores: {e}")
     return target_scores
@@ -130,6 +134,10 @@ class ExamTodoApp(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         
         # Initialize theme colors first
+        self.styles = styles
+        self.score_index = ScoreIndex(TEST_SCORES_FILE)
+        self.priority_index = PriorityIndex()
+        self.exam_store = ExamStore()
         self.update_theme_colors()
         
         # Load all data
@@ -139,85 +147,113 @@ class ExamTodoApp(ctk.CTk):
         self.create_sidebar()
         self.create_main_content()
         
-        # Load exams and start periodic check
+        # Load exams and follow data changes
+        self.priority_cache = {}  # exam key -> (days_until, priority)
+        self.refresh_job = None  # last API sync job the data reload was attached to
+        self.reload_scheduled = False  # see on_data_changed
+        self.priority_job = None
+        self.tool_windows = {}  # key -> (CTkToplevel, tool object), see open_tool_window
         self.load_exams_from_csv()
-        self.periodic_check()
+        self.subscribe_to_data()
         
         # Schedule API refresh in background after UI is ready
         self.after(1000, self.check_and_refresh_api)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Cancel background work before the window goes away"""
+        get_executor().cancel_all()
+        self.destroy()
 
     def check_and_refresh_api(self):
         """Check if API refresh is needed and do it in background"""
         if should_refresh_cache():
             self.last_update_label.configure(text="Checking for updates...")
-            # Run API update in background thread
-            def update_in_background():
-                try:
-                    update_scores_from_api()
-                    # Update UI in main thread
-                    self.after(0, self.on_api_refresh_complete)
-                except Exception as e:
-                    print(f"Background API update failed: {e}")
-                    self.after(0, lambda: self.last_update_label.configure(text="Update failed"))
-            
-            thread = threading.Thread(target=update_in_background, daemon=True)
-            thread.start()
+            self.start_api_refresh()
         else:
             current_time = datetime.now().strftime("%H:%M:%S")
             self.last_update_label.configure(text=f"Last Updated: {current_time} (cached)")
 
-    def on_api_refresh_complete(self):
+    def start_api_refresh(self, on_success=None, on_error=None):
+        """
+        Run the API sync on the shared background executor.
+
+        If a sync is already in flight (from this window or a hosted tool) this
+        joins it rather than starting another. The data reload is attached once
+        per job, whoever started it, then on_success/on_error are called on the
+        Tk thread.
+        """
+        job = get_executor().submit(
+            API_REFRESH_KEY,
+            update_scores_from_api,
+            timeout=API_REFRESH_TIMEOUT,
+            tk_widget=self
+        )
+        if job is not self.refresh_job:
+            self.refresh_job = job
+            job.add_callbacks(self, self.on_api_refresh_complete, self.on_api_refresh_failed)
+        job.add_callbacks(self, on_success, on_error)
+        return job
+
+    def on_api_refresh_failed(self, error):
+        """Called on the Tk thread when a background API refresh fails or is cancelled"""
+        current_time = datetime.now().strftime("%H:%M:%S")
+        if isinstance(error, JobTimeout):
+            self.last_update_label.configure(text=f"Sync timed out at {current_time}")
+        elif isinstance(error, JobCancelled):
+            self.last_update_label.configure(text=f"Sync cancelled at {current_time}")
+        else:
+            print(f"Background API update failed: {error}")
+            self.last_update_label.configure(text="Update failed")
+
+    def on_api_refresh_complete(self, metrics=None):
         """Called when background API refresh completes"""
-        # Reload all data
-        self.load_all_data()
-        
-        # Update UI components
-        self.create_progress_cards()
-        self.load_exams_from_csv()
+        # Reload all data (shared with the reload for the sync's own file writes)
+        self.on_data_changed()
         
         # Update timestamp
         current_time = datetime.now().strftime("%H:%M:%S")
-        self.last_update_label.configure(text=f"Last Updated: {current_time}")
+        if metrics and metrics["status"] == "partial":
+            self.last_update_label.configure(
+                text=f"Partial sync at {current_time}: {len(metrics['failures'])} failed, kept their previous data"
+            )
+        elif metrics:
+            self.last_update_label.configure(
+                text=f"Last Updated: {current_time} ({metrics['duration']:.1f}s, {metrics['requests']} requests)"
+            )
+        else:
+            self.last_update_label.configure(text=f"Last Updated: {current_time}")
 
+    @perf.timed()
     def load_all_data(self):
         """Load all application data in one method"""
         self.available_subjects = self.load_available_subjects()
         self.test_scores = load_difficulties()
         self.target_scores = load_target_scores()
-        self.last_modified_time = self.get_modified_time()
-        self.exams = []
+        # Scores/targets may have changed, so the next redraw recomputes every priority
+        self.priorities_stale = True
 
-    def get_modified_time(self):
-        return os.path.getmtime(DIFFICULTY_FILE) if os.path.exists(DIFFICULTY_FILE) else None
+    @property
+    def exams(self):
+        """Current exams, in first-seen order"""
+        return self.exam_store.values()
 
+    @perf.timed()
     def load_available_subjects(self):
         subjects = []
         
         # Load subjects from selected subjects file
         if os.path.exists(SUBJECTS_FILE):
             try:
-                with open(SUBJECTS_FILE, mode='r', newline='', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    for row in reader:
-                        if row:
-                            subjects.extend(row)
+                subjects.extend(get_service().load(SUBJECTS_FILE, read_subjects))
             except Exception as e:
                 messagebox.showerror("Error", f"Error loading subjects: {e}")
         
-        # Also load subjects from API data (study scores file)
-        if os.path.exists(TEST_SCORES_FILE):
-            try:
-                with open(TEST_SCORES_FILE, mode='r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        subject = row.get('Subject', '').strip()
-                        if subject and subject not in ['SAC', 'Total', 'Assessed Coursework']:
-                            # Check if this is a "Total" row (contains actual course names)
-                            sac_type = row.get('SAC', '').strip()
-                            if sac_type == 'Total':
-                                subjects.append(subject)
-            except Exception as e:
-                print(f"Warning: Error loading subjects from API data: {e}")
+        # Also load subjects from API data (courses with a "Total" row in the score index)
+        subjects.extend(
+            s for s in self.score_index.subjects()
+            if s not in ['SAC', 'Total', 'Assessed Coursework']
+        )
         
         return sorted(set(subjects))
 
@@ -231,7 +267,7 @@ class ExamTodoApp(ctk.CTk):
         self.logo_label = ctk.CTkLabel(
             self.sidebar_frame, 
             text="📚 Exam Manager", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.styles.font("dialog_title")
         )
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
         
@@ -257,7 +293,7 @@ class ExamTodoApp(ctk.CTk):
         self.api_title = ctk.CTkLabel(
             self.api_frame, 
             text="📡 API Status", 
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.styles.font("section")
         )
         self.api_title.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
         
@@ -265,8 +301,8 @@ class ExamTodoApp(ctk.CTk):
         self.last_update_label = ctk.CTkLabel(
             self.api_frame, 
             text="Last Updated: Loading...",
-            font=ctk.CTkFont(size=12),
-            text_color=("gray70", "gray30")
+            font=self.styles.font("caption"),
+            text_color=self.styles.color("muted")
         )
         self.last_update_label.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
         
@@ -287,7 +323,7 @@ class ExamTodoApp(ctk.CTk):
         self.actions_title = ctk.CTkLabel(
             self.actions_frame, 
             text="Quick Actions", 
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.styles.font("section")
         )
         self.actions_title.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
         
@@ -309,9 +345,78 @@ class ExamTodoApp(ctk.CTk):
             )
             btn.grid(row=i+1, column=0, padx=20, pady=3, sticky="ew")
         
+        # Next up: the highest priority exams
+        self.next_up_frame = ctk.CTkFrame(self.sidebar_frame)
+        self.next_up_frame.grid(row=4, column=0, padx=20, pady=10, sticky="new")
+        
+        self.next_up_title = ctk.CTkLabel(
+            self.next_up_frame, 
+            text="⏭️ Next Up", 
+            font=self.styles.font("section")
+        )
+        self.next_up_title.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
+        
+        self.next_up_label = ctk.CTkLabel(
+            self.next_up_frame,
+            text="No exams scheduled",
+            font=self.styles.font("caption"),
+            justify="left",
+            anchor="w"
+        )
+        self.next_up_label.grid(row=1, column=0, padx=20, pady=(0, 15), sticky="w")
+        
+        if perf.enabled():
+            self.create_perf_panel()
+        
         # Make the frames expand
         self.api_frame.grid_columnconfigure(0, weight=1)
         self.actions_frame.grid_columnconfigure(0, weight=1)
+        self.next_up_frame.grid_columnconfigure(0, weight=1)
+
+    def create_perf_panel(self):
+        """Debug panel with live span timings, shown when started with SAC_PERF=1"""
+        self.perf_frame = ctk.CTkFrame(self.sidebar_frame)
+        self.perf_frame.grid(row=5, column=0, padx=20, pady=10, sticky="ew")
+        self.perf_frame.grid_columnconfigure(0, weight=1)
+        
+        perf_title = ctk.CTkLabel(
+            self.perf_frame,
+            text="🐞 Performance",
+            font=self.styles.font("section")
+        )
+        perf_title.grid(row=0, column=0, padx=20, pady=(15, 10), sticky="w")
+        
+        self.perf_label = ctk.CTkLabel(
+            self.perf_frame,
+            text="No spans recorded yet",
+            font=self.styles.font("caption"),
+            justify="left",
+            anchor="w"
+        )
+        self.perf_label.grid(row=1, column=0, padx=20, pady=5, sticky="w")
+        
+        export_btn = ctk.CTkButton(
+            self.perf_frame,
+            text="💾 Export Stats",
+            command=self.export_perf_stats
+        )
+        export_btn.grid(row=2, column=0, padx=20, pady=(5, 15), sticky="ew")
+        
+        self.update_perf_panel()
+
+    def update_perf_panel(self):
+        lines = perf.summary_lines()
+        counters = perf.snapshot()["counters"]
+        lines += [f"{name}: {value}" for name, value in sorted(counters.items())]
+        self.perf_label.configure(text="\n".join(lines) or "No spans recorded yet")
+        self.after(PERF_PANEL_MS, self.update_perf_panel)
+
+    def export_perf_stats(self):
+        try:
+            perf.export_snapshot(PERF_STATS_FILE)
+            messagebox.showinfo("Exported", f"Stats appended to {PERF_STATS_FILE}", parent=self)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not export stats: {e}", parent=self)
 
     def toggle_theme(self):
         """Toggle between dark and light themes"""
@@ -319,19 +424,14 @@ class ExamTodoApp(ctk.CTk):
             ctk.set_appearance_mode("dark")
         else:
             ctk.set_appearance_mode("light")
+        self.styles.invalidate()
         self.update_theme_colors()
     
     def update_theme_colors(self):
         """Update matplotlib colors based on current theme"""
-        appearance_mode = ctk.get_appearance_mode()
-        if appearance_mode == "Dark":
-            plt.style.use('dark_background')
-            self.bg_color = "#2b2b2b"
-            self.text_color = "white"
-        else:
-            plt.style.use('default')
-            self.bg_color = "white"
-            self.text_color = "black"
+        plt.style.use(self.styles.chart("mpl_style"))
+        self.bg_color = self.styles.chart("bg")
+        self.text_color = self.styles.chart("text")
         
         # Update all visualizations if they exist
         if hasattr(self, 'pie_canvas'):
@@ -357,7 +457,7 @@ class ExamTodoApp(ctk.CTk):
         self.main_title = ctk.CTkLabel(
             self.main_frame, 
             text="Exam Priority Dashboard", 
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self.styles.font("page_title")
         )
         self.main_title.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
         
@@ -439,126 +539,140 @@ class ExamTodoApp(ctk.CTk):
         
         self.create_progress_cards()
 
-    def create_progress_cards(self):
-        """Create progress cards for each subject with VCE projections"""
-        # Clear existing cards
-        if hasattr(self, 'progress_cards'):
-            for card in self.progress_cards.values():
-                card.destroy()
-        
-        self.progress_cards = {}
-        
-        for i, subject in enumerate(self.available_subjects):
-            # Create card frame
-            card = ctk.CTkFrame(self.progress_scroll_frame)
-            card.grid(row=i, column=0, padx=10, pady=8, sticky="ew")
-            card.grid_columnconfigure(1, weight=1)
-            
-            # Subject name
-            subject_label = ctk.CTkLabel(
-                card, 
-                text=subject, 
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            subject_label.grid(row=0, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
-            
-            # Current score and target
+    def build_progress_snapshot(self):
+        """Current score, target and projection per subject, computed once per redraw"""
+        snapshot = {}
+        for subject in self.available_subjects:
             current_score = self.get_current_score(subject)
             target_score = self.target_scores.get(subject, 50)  # Default to max study score
-            
-            # Current score display
-            current_label = ctk.CTkLabel(
-                card, 
-                text=f"📊 Current Study Score: {current_score}/50",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=("#1f538d", "#3d8bff")
-            )
-            current_label.grid(row=1, column=0, columnspan=2, padx=20, pady=5, sticky="w")
-            
-            # Target score display
-            target_label = ctk.CTkLabel(
-                card, 
-                text=f"🎯 Target Study Score: {target_score}/50",
-                font=ctk.CTkFont(size=14)
-            )
-            target_label.grid(row=2, column=0, columnspan=2, padx=20, pady=5, sticky="w")
-            
-            # VCE Projection
-            projection = self.calculate_projected_sac_score(subject, target_score)
-            projection_label = ctk.CTkLabel(
-                card,
-                text=f"📈 VCE Projection: {projection}",
-                font=ctk.CTkFont(size=14),
-                text_color=("#d63031", "#ff6b6b") if "Need" in projection else ("#00b894", "#00cec9")
-            )
-            projection_label.grid(row=3, column=0, columnspan=2, padx=20, pady=5, sticky="w")
-            
-            # Progress bar
-            if current_score != "No data" and target_score != "Not set":
-                try:
-                    current_val = float(current_score)
-                    target_val = float(target_score)
-                    progress = min(current_val / target_val, 1.0) if target_val > 0 else 0
-                    
-                    progress_bar = ctk.CTkProgressBar(card, width=300, height=15)
-                    progress_bar.set(progress)
-                    progress_bar.grid(row=4, column=0, columnspan=2, padx=20, pady=(10, 5), sticky="ew")
-                    
-                    # Progress percentage
-                    progress_text = ctk.CTkLabel(
-                        card, 
-                        text=f"{progress*100:.1f}% of target achieved",
-                        font=ctk.CTkFont(size=12),
-                        text_color=("gray70", "gray30")
-                    )
-                    progress_text.grid(row=5, column=0, columnspan=2, padx=20, pady=(0, 10))
-                    
-                    # SAC breakdown button
-                    sac_btn = ctk.CTkButton(
-                        card,
-                        text="📋 View SAC Breakdown",
-                        width=200,
-                        height=30,
-                        command=lambda s=subject: self.show_sac_breakdown(s),
-                        fg_color=("gray70", "gray30")
-                    )
-                    sac_btn.grid(row=6, column=0, columnspan=2, padx=20, pady=(5, 20))
-                    
-                except Exception as e:
-                    error_label = ctk.CTkLabel(
-                        card,
-                        text=f"Error calculating progress: {e}",
-                        font=ctk.CTkFont(size=12),
-                        text_color="red"
-                    )
-                    error_label.grid(row=4, column=0, columnspan=2, padx=20, pady=(10, 20))
-            
-            self.progress_cards[subject] = card
+            projection = self.calculate_projected_sac_score(subject, target_score, current_score)
+            snapshot[subject] = (current_score, target_score, projection)
+        return snapshot
+
+    @perf.timed()
+    def create_progress_cards(self):
+        """Create or update progress cards for each subject with VCE projections"""
+        if not hasattr(self, 'progress_cards'):
+            self.progress_cards = {}
+        snapshot = self.build_progress_snapshot()
+
+        # Drop cards for subjects that are no longer tracked
+        for subject in list(self.progress_cards):
+            if subject not in snapshot:
+                self.progress_cards.pop(subject)["frame"].destroy()
+
+        for i, (subject, values) in enumerate(snapshot.items()):
+            card = self.progress_cards.get(subject)
+            if card is None:
+                card = self.build_progress_card(subject)
+                self.progress_cards[subject] = card
+            if card["row"] != i:
+                card["frame"].grid(row=i, column=0, padx=10, pady=8, sticky="ew")
+                card["row"] = i
+            if card["values"] != values:
+                self.update_progress_card(card, values)
+
+    def build_progress_card(self, subject):
+        """Create the (empty) widgets for one subject's progress card"""
+        card = {"row": None, "values": None}
+        frame = ctk.CTkFrame(self.progress_scroll_frame)
+        frame.grid_columnconfigure(1, weight=1)
+        card["frame"] = frame
+
+        # Subject name
+        subject_label = ctk.CTkLabel(
+            frame, 
+            text=subject, 
+            font=self.styles.font("section")
+        )
+        subject_label.grid(row=0, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
+
+        # Current score display
+        card["current_label"] = ctk.CTkLabel(
+            frame, 
+            font=self.styles.font("body_bold"),
+            text_color=self.styles.color("score")
+        )
+        card["current_label"].grid(row=1, column=0, columnspan=2, padx=20, pady=5, sticky="w")
+
+        # Target score display
+        card["target_label"] = ctk.CTkLabel(frame, font=self.styles.font("body"))
+        card["target_label"].grid(row=2, column=0, columnspan=2, padx=20, pady=5, sticky="w")
+
+        # VCE Projection
+        card["projection_label"] = ctk.CTkLabel(frame, font=self.styles.font("body"))
+        card["projection_label"].grid(row=3, column=0, columnspan=2, padx=20, pady=5, sticky="w")
+
+        # Progress bar, percentage and SAC breakdown button; only shown with score data
+        card["progress_bar"] = ctk.CTkProgressBar(frame, width=300, height=15)
+        card["progress_text"] = ctk.CTkLabel(
+            frame, 
+            font=self.styles.font("caption"),
+            text_color=self.styles.color("muted")
+        )
+        card["sac_btn"] = ctk.CTkButton(
+            frame,
+            text="📋 View SAC Breakdown",
+            width=200,
+            height=30,
+            command=lambda s=subject: self.show_sac_breakdown(s),
+            fg_color=self.styles.color("muted")
+        )
+        card["error_label"] = ctk.CTkLabel(
+            frame,
+            font=self.styles.font("caption"),
+            text_color="red"
+        )
+        return card
+
+    def update_progress_card(self, card, values):
+        """Push a subject's new snapshot values into its existing card widgets"""
+        current_score, target_score, projection = values
+        card["values"] = values
+        card["current_label"].configure(text=f"📊 Current Study Score: {current_score}/50")
+        card["target_label"].configure(text=f"🎯 Target Study Score: {target_score}/50")
+        card["projection_label"].configure(
+            text=f"📈 VCE Projection: {projection}",
+            text_color=self.styles.color("bad" if "Need" in projection else "good")
+        )
+
+        for key in ("progress_bar", "progress_text", "sac_btn", "error_label"):
+            card[key].grid_remove()
+
+        # Progress bar
+        if current_score != "No data" and target_score != "Not set":
+            try:
+                current_val = float(current_score)
+                target_val = float(target_score)
+                progress = min(current_val / target_val, 1.0) if target_val > 0 else 0
+
+                card["progress_bar"].set(progress)
+                card["progress_bar"].grid(row=4, column=0, columnspan=2, padx=20, pady=(10, 5), sticky="ew")
+
+                # Progress percentage
+                card["progress_text"].configure(text=f"{progress*100:.1f}% of target achieved")
+                card["progress_text"].grid(row=5, column=0, columnspan=2, padx=20, pady=(0, 10))
+
+                # SAC breakdown button
+                card["sac_btn"].grid(row=6, column=0, columnspan=2, padx=20, pady=(5, 20))
+
+            except Exception as e:
+                card["error_label"].configure(text=f"Error calculating progress: {e}")
+                card["error_label"].grid(row=4, column=0, columnspan=2, padx=20, pady=(10, 20))
 
     def get_current_score(self, subject):
         """Get current study score for a subject from API data"""
-        if os.path.exists(TEST_SCORES_FILE):
-            try:
-                with open(TEST_SCORES_FILE, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if (row.get('Subject') == subject and 
-                            row.get('SAC', '').strip() == 'Total'):
-                            score = row.get('Score', '')
-                            if score and score != '':
-                                return f"{float(score):.1f}"
-            except:
-                pass
-        return "No data"
+        return self.score_index.current_score(subject)
     
-    def calculate_projected_sac_score(self, subject, target_study_score=50):
+    def calculate_projected_sac_score(self, subject, target_study_score=50, current_score_str=None):
         """
         Calculate projected SAC score needed based on VCE algorithm
         VCE Study Score = 0.5 * (School-based Assessment) + 0.5 * (External Exam)
         Assumes external exam score will be equal to current SAC performance
         """
         try:
-            current_score_str = self.get_current_score(subject)
+            if current_score_str is None:
+                current_score_str = self.get_current_score(subject)
             if current_score_str == "No data":
                 return "No data available"
             
@@ -583,26 +697,7 @@ class ExamTodoApp(ctk.CTk):
     
     def get_sac_breakdown(self, subject):
         """Get detailed SAC breakdown for a subject"""
-        sac_data = []
-        if os.path.exists(TEST_SCORES_FILE):
-            try:
-                with open(TEST_SCORES_FILE, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if (row.get('Subject') == subject and 
-                            row.get('SAC', '').strip() != 'Total' and
-                            row.get('SAC', '').strip() != ''):
-                            sac_name = row.get('SAC', '')
-                            score = row.get('Score', '')
-                            if score and score != '':
-                                sac_data.append({
-                                    'name': sac_name,
-                                    'score': float(score),
-                                    'percentage': row.get('Percentage', 'N/A')
-                                })
-            except Exception as e:
-                print(f"Error loading SAC breakdown: {e}")
-        return sac_data
+        return self.score_index.breakdown(subject)
 
     def setup_charts(self):
         """Setup matplotlib charts"""
@@ -638,18 +733,19 @@ class ExamTodoApp(ctk.CTk):
             self.progress_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)
             self.update_progress_chart()
 
+    @perf.timed()
     def update_pie_chart(self):
         """Update the priority distribution pie chart"""
         self.pie_ax.clear()
         
         if self.exams:
-            subject_counts = {}
-            for exam in self.exams:
-                subj = exam['subject']
-                subject_counts[subj] = subject_counts.get(subj, 0) + 1
+            subject_counts = self.exam_store.subject_counts()
 
-            priorities = [self.compute_priority(e, subject_counts) for e in self.exams]
-            labels = [e['name'] for e in self.exams]
+            if self.priority_index_in_sync():
+                priorities = [self.priority_index.priority(key) for key, _ in self.exam_store.items()]
+            else:
+                priorities = [self.compute_priority(e, subject_counts) for e in self.exams]
+            labels = [e.name for e in self.exams]
             
             # Modern color palette
             colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8C8']
@@ -673,18 +769,22 @@ class ExamTodoApp(ctk.CTk):
         self.pie_ax.set_facecolor(self.bg_color)
         self.pie_canvas.draw()
 
+    @perf.timed()
     def update_timeline_chart(self):
         """Update the timeline chart"""
         self.timeline_ax.clear()
         
         if self.exams:
-            sorted_exams = sorted(self.exams, key=lambda x: x['datetime'])
-            names = [e['name'] for e in sorted_exams]
+            if self.priority_index_in_sync():
+                sorted_exams = self.priority_index.date_range()
+            else:
+                sorted_exams = sorted(self.exams, key=lambda x: x.day)
+            names = [e.name for e in sorted_exams]
             
             # Color code by urgency
             colors = []
             for exam in sorted_exams:
-                days_left = (exam['datetime'] - datetime.now()).days
+                days_left = (exam.datetime - datetime.now()).days
                 if days_left <= 0:
                     colors.append('#FF6B6B')  # Red - overdue
                 elif days_left <= 3:
@@ -705,7 +805,7 @@ class ExamTodoApp(ctk.CTk):
             
             # Add date labels
             for i, (bar, exam) in enumerate(zip(bars, sorted_exams)):
-                date_str = exam['datetime'].strftime('%m/%d')
+                date_str = exam.datetime.strftime('%m/%d')
                 self.timeline_ax.text(bar.get_width() + 0.05, bar.get_y() + bar.get_height()/2,
                                     date_str, ha='left', va='center', color=self.text_color)
         else:
@@ -718,6 +818,7 @@ class ExamTodoApp(ctk.CTk):
         self.timeline_ax.tick_params(colors=self.text_color)
         self.timeline_canvas.draw()
 
+    @perf.timed()
     def update_progress_chart(self):
         """Update the subject progress chart"""
         self.progress_ax.clear()
@@ -773,8 +874,52 @@ class ExamTodoApp(ctk.CTk):
         self.update_all_charts()
         self.show_priority()
 
-    def show_priority(self):
-        """Display exams in priority order using modern cards"""
+    def priority_index_in_sync(self):
+        """True when the priority index holds exactly the current exams"""
+        return len(self.priority_index) == len(self.exam_store) and all(
+            key in self.priority_index for key, _ in self.exam_store.items()
+        )
+
+    def update_next_up(self):
+        """Show the top few exams from the priority index in the sidebar"""
+        top = self.priority_index.top(NEXT_UP_COUNT)
+        if top:
+            lines = [f"{i}. {exam.name} ({exam.subject})" for i, (_, exam) in enumerate(top, start=1)]
+            self.next_up_label.configure(text="\n".join(lines))
+        else:
+            self.next_up_label.configure(text="No exams scheduled")
+
+    def schedule_priority_refresh(self):
+        """
+        Set one timer for the next instant any exam's day count (and so its
+        urgency, band or rank) changes, replacing any earlier timer.
+        """
+        if self.priority_job is not None:
+            self.after_cancel(self.priority_job)
+            self.priority_job = None
+        delay = next_change_delay_ms((e.datetime for e in self.exams), datetime.now())
+        if delay is not None:
+            self.priority_job = self.after(delay, self.on_priority_rollover)
+
+    def on_priority_rollover(self):
+        """Timer callback: re-rank with only the exams whose day count changed recomputed"""
+        self.priority_job = None
+        self.show_priority(reuse_priorities=True)
+        if hasattr(self, 'timeline_canvas'):
+            self.update_timeline_chart()
+
+    @perf.timed()
+    def show_priority(self, reuse_priorities=False, delta=None):
+        """
+        Display exams in priority order using modern cards.
+        With reuse_priorities, exams whose day count is unchanged keep their
+        cached priority instead of being recomputed. With an ExamDelta from a
+        reload, only added/changed exams and exams in affected subjects are
+        recomputed, and nothing is redrawn if the reload changed nothing.
+        """
+        if delta is not None and not delta and self.exam_widgets:
+            return
+        
         # Clear existing widgets
         for widget in self.exam_widgets:
             widget.destroy()
@@ -784,47 +929,64 @@ class ExamTodoApp(ctk.CTk):
             no_exams_label = ctk.CTkLabel(
                 self.exam_scroll_frame, 
                 text="No exams scheduled. Add an exam to get started!",
-                font=ctk.CTkFont(size=16),
-                text_color=("gray70", "gray30")
+                font=self.styles.font("message"),
+                text_color=self.styles.color("muted")
             )
             no_exams_label.grid(row=0, column=0, padx=20, pady=50)
             self.exam_widgets.append(no_exams_label)
+            self.priority_index.clear()
+            self.update_next_up()
+            self.schedule_priority_refresh()
             return
         
         # Calculate priorities
-        subject_counts = {}
-        for exam in self.exams:
-            subj = exam['subject']
-            subject_counts[subj] = subject_counts.get(subj, 0) + 1
-        
-        prioritized_with_pr = []
-        for exam in self.exams:
-            pr = self.compute_priority(exam, subject_counts)
-            prioritized_with_pr.append((pr, exam))
-        
-        prioritized_with_pr.sort(key=lambda x: x[0], reverse=True)
+        subject_counts = self.exam_store.subject_counts()
+        
+        stale = set()  # keys to recompute even if their day count is unchanged
+        if delta is not None:
+            for key in delta.removed:
+                self.priority_index.remove(key)
+                self.priority_cache.pop(key, None)
+            stale.update(delta.added, delta.changed)
+            # The subject count factor changes for every exam in a touched subject
+            stale.update(key for key, exam in self.exam_store.items() if exam.subject in delta.subjects)
+        elif not reuse_priorities:
+            self.priority_cache = {}
+            self.priority_index.clear()
+        now = datetime.now()
+        computed = 0
+        with perf.span("compute_priority_batch"):
+            for key, exam in self.exam_store.items():
+                days = exam.days_until(now)
+                cached = self.priority_cache.get(key)
+                if key not in stale and cached is not None and cached[0] == days:
+                    continue
+                pr = self.compute_priority(exam, subject_counts)
+                self.priority_cache[key] = (days, pr)
+                self.priority_index.upsert(key, exam, pr, exam.day)
+                computed += 1
+        perf.incr("priorities_computed", computed)
+        perf.incr("priorities_reused", len(self.exam_store) - computed)
+        
+        prioritized_with_pr = self.priority_index.ranked()
+        self.update_next_up()
         
         # Create exam cards
         for i, (pr, exam) in enumerate(prioritized_with_pr):
-            days_left = (exam['datetime'] - datetime.now()).days
+            days_left = (exam.datetime - datetime.now()).days
             
             # Determine urgency color
             if days_left <= 0:
-                card_color = ("red", "darkred")
-                urgency_text = "OVERDUE"
-                urgency_color = "white"
+                card_style = self.styles.card("overdue")
             elif days_left <= 3:
-                card_color = ("orange", "darkorange")
-                urgency_text = "URGENT"
-                urgency_color = "white"
+                card_style = self.styles.card("urgent")
             elif days_left <= 7:
-                card_color = ("yellow", "gold")
-                urgency_text = "SOON"
-                urgency_color = "black"
+                card_style = self.styles.card("soon")
             else:
-                card_color = ("lightblue", "blue")
-                urgency_text = "LATER"
-                urgency_color = "white"
+                card_style = self.styles.card("later")
+            card_color = card_style["fg_color"]
+            urgency_text = card_style["label"]
+            urgency_color = card_style["text_color"]
             
             # Create exam card
             exam_card = ctk.CTkFrame(self.exam_scroll_frame, fg_color=card_color)
@@ -835,7 +997,7 @@ class ExamTodoApp(ctk.CTk):
             urgency_label = ctk.CTkLabel(
                 exam_card,
                 text=urgency_text,
-                font=ctk.CTkFont(size=12, weight="bold"),
+                font=self.styles.font("badge"),
                 text_color=urgency_color,
                 width=80
             )
@@ -844,24 +1006,24 @@ class ExamTodoApp(ctk.CTk):
             # Exam name
             name_label = ctk.CTkLabel(
                 exam_card,
-                text=exam['name'],
-                font=ctk.CTkFont(size=18, weight="bold"),
+                text=exam.name,
+                font=self.styles.font("section"),
                 text_color=urgency_color
             )
             name_label.grid(row=0, column=1, padx=10, pady=(15, 5), sticky="w")
             
             # Exam details
-            date_str = exam['datetime'].strftime("%B %d, %Y")
-            target_score = self.target_scores.get(exam['subject'], "Not set")
+            date_str = exam.datetime.strftime("%B %d, %Y")
+            target_score = self.target_scores.get(exam.subject, "Not set")
             target_display = f"{target_score}/50" if target_score != "Not set" else "Not set"
             
             details_text = (f"📅 {date_str} | 🎯 Priority: {pr:.2f} | "
-                          f"📚 {exam['subject']} | 🏆 Target: {target_display}")
+                          f"📚 {exam.subject} | 🏆 Target: {target_display}")
             
             details_label = ctk.CTkLabel(
                 exam_card,
                 text=details_text,
-                font=ctk.CTkFont(size=14),
+                font=self.styles.font("body"),
                 text_color=urgency_color
             )
             details_label.grid(row=1, column=1, padx=10, pady=5, sticky="w")
@@ -871,77 +1033,62 @@ class ExamTodoApp(ctk.CTk):
             days_label = ctk.CTkLabel(
                 exam_card,
                 text=days_text,
-                font=ctk.CTkFont(size=12),
+                font=self.styles.font("caption"),
                 text_color=urgency_color
             )
             days_label.grid(row=2, column=1, padx=10, pady=(5, 15), sticky="w")
             
             self.exam_widgets.append(exam_card)
+        
+        self.schedule_priority_refresh()
 
     def refresh_api_data(self):
-        """Refresh data from API"""
-        try:
-            self.last_update_label.configure(text="Updating...")
-            self.refresh_button.configure(state="disabled")
-            
-            # Update scores and exams from API
-            update_scores_from_api()
-            
-            # Reload all data
-            self.load_all_data()
-            
-            # Update UI
-            if hasattr(self, 'subject_combo'):
-                self.subject_combo.configure(values=self.available_subjects)
-            
-            self.create_progress_cards()
-            self.load_exams_from_csv()
-            
-            # Update timestamp
-            from datetime import datetime
-            current_time = datetime.now().strftime("%H:%M:%S")
-            self.last_update_label.configure(text=f"Last Updated: {current_time}")
-            
-            messagebox.showinfo("Success", "Data refreshed from API!", parent=self)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to refresh data: {e}", parent=self)
-        finally:
+        """Refresh data from API without blocking the window"""
+        self.last_update_label.configure(text="Updating...")
+        self.refresh_button.configure(state="disabled")
+
+        def on_success(metrics):
             self.refresh_button.configure(state="normal")
+            import API
+            warning = API.sync_warning(metrics)
+            if warning:
+                messagebox.showwarning("Sync Incomplete", warning, parent=self)
+            else:
+                messagebox.showinfo("Success", "Data refreshed from API!", parent=self)
 
+        def on_error(e):
+            self.refresh_button.configure(state="normal")
+            if isinstance(e, JobCancelled):
+                import API
+                messagebox.showwarning("Sync Incomplete", f"{API.sync_warning({'status': 'cancelled'})}\n({e})", parent=self)
+            else:
+                messagebox.showerror("Error", f"Failed to refresh data: {e}", parent=self)
+
+        self.start_api_refresh(on_success, on_error)
+
+    @perf.timed()
     def load_exams_from_csv(self):
         if not os.path.exists(CSV_FILE):
             return
         try:
-            with open(CSV_FILE, mode='r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) == 4:
-                        name, date_str, diff, subject = row
-                        try:
-                            exam_dt = datetime.strptime(date_str, "%Y-%m-%d")
-                            difficulty = float(diff)
-                            if math.isnan(difficulty):
-                                continue
-                            self.exams.append({
-                                "name": name,
-                                "datetime": exam_dt,
-                                "difficulty": difficulty,
-                                "subject": subject
-                            })
-                        except ValueError:
-                            continue
-            self.show_priority()
+            # Large exports are split into chunks and parsed in worker processes
+            exams = [ExamRecord(*row) for row in get_service().load(CSV_FILE, csv_loader.load_exam_rows)]
+            # Upsert into the store; only the rows that changed need new priorities
+            delta = self.exam_store.replace_all(exams)
+            if self.priorities_stale:
+                self.priorities_stale = False
+                self.show_priority()
+            else:
+                self.show_priority(delta=delta)
         except Exception as e:
             messagebox.showerror("Load Error", f"Error loading exams: {e}", parent=self)
 
     def clear_exams(self):
         """Clear all exams - API will repopulate on next refresh"""
         if messagebox.askyesno("Confirm", "Clear all exam data? (Will be repopulated from API on next refresh)", parent=self):
-            self.exams.clear()
+            self.exam_store.clear()
             if os.path.exists(CSV_FILE):
-                with open(CSV_FILE, 'w', newline='', encoding='utf-8') as f:
-                    pass
+                get_service().write(CSV_FILE, [])
             self.show_priority()
             self.update_visualizations()
 
@@ -982,15 +1129,15 @@ class ExamTodoApp(ctk.CTk):
         """
         try:
             now = datetime.now()
-            days_until = (exam['datetime'] - now).days
+            days_until = exam.days_until(now)
             
             if days_until <= 0:
                 return float('inf')  # Overdue exams get highest priority
             
             # Get current and target study scores
-            current_score_str = self.get_current_score(exam['subject'])
+            current_score_str = self.get_current_score(exam.subject)
             current_score = float(current_score_str) if current_score_str != "No data" else 0
-            target_score = self.target_scores.get(exam['subject'], 50)
+            target_score = self.target_scores.get(exam.subject, 50)
             
             # Calculate difficulty using new algorithm
             difficulty = self.calculate_difficulty(
@@ -1007,30 +1154,80 @@ class ExamTodoApp(ctk.CTk):
             priority = self.calculate_priority_score(difficulty, urgency)
             
             # Apply subject count factor
-            subject_factor = subject_counts.get(exam['subject'], 1)
+            subject_factor = subject_counts.get(exam.subject, 1)
             final_priority = priority * (1 + (subject_factor - 1) * 0.1)  # Small boost for multiple exams
             
             return round(max(final_priority, 0.001), 3)  # Minimum priority with rounding
             
         except Exception as e:
-            print(f"Error computing priority for {exam.get('name', 'Unknown')}: {e}")
+            print(f"Error computing priority for {getattr(exam, 'name', 'Unknown')}: {e}")
             return 1.0  # Default priority
 
-    def periodic_check(self):
-        current_mod = self.get_modified_time()
-        if current_mod and current_mod != self.last_modified_time:
-            self.test_scores = load_difficulties()
-            self.target_scores = load_target_scores()
-            self.available_subjects = self.load_available_subjects()
-            self.last_modified_time = current_mod
-        self.after(CHECK_INTERVAL, self.periodic_check)
+    def subscribe_to_data(self):
+        """
+        Reload when a tool window, a sync (or anything else) rewrites one of
+        the files the dashboard is built from, instead of polling them; files
+        changed by other processes are picked up whenever a window of the app
+        regains focus.
+        """
+        service = get_service()
+        for path in (CSV_FILE, TEST_SCORES_FILE, DIFFICULTY_FILE, TARGET_SCORES_FILE, SUBJECTS_FILE):
+            service.subscribe(path, self.on_data_changed, tk_widget=self)
+        self.bind("<FocusIn>", lambda event: service.check(), add="+")
+
+    def on_data_changed(self, path=None):
+        """Schedule one reload for however many files changed in this burst (a sync writes two)"""
+        if not self.reload_scheduled:
+            self.reload_scheduled = True
+            self.after_idle(self.reload_data)
+
+    def reload_data(self):
+        self.reload_scheduled = False
+        self.load_all_data()
+        self.create_progress_cards()
+        self.load_exams_from_csv()
+        if hasattr(self, 'subject_combo'):
+            self.subject_combo.configure(values=self.available_subjects)
+
+    def show_cached_dialog(self, dialog):
+        """Re-show a dialog that was hidden with hide_cached_dialog"""
+        dialog.deiconify()
+        dialog.lift()
+        dialog.after(100, dialog.grab_set)
+        dialog.focus_set()
+
+    def hide_cached_dialog(self, dialog):
+        """Hide a dialog for reuse instead of destroying it"""
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def get_target_subjects(self):
+        """Subjects shown in the target scores dialog: selected plus API courses"""
+        all_subjects = set(self.available_subjects)
+        all_subjects.update(
+            s for s in self.score_index.subjects()
+            if s not in ['SAC', 'Total', 'Assessed Coursework']
+        )
+        return sorted(all_subjects)
 
     def open_target_scores_dialog(self):
         """Opens a modern dialog window for setting target study scores"""
+        dialog = getattr(self, 'target_dialog', None)
+        if dialog is None or not dialog.winfo_exists():
+            self.build_target_scores_dialog()
+        else:
+            self.show_cached_dialog(dialog)
+        self.refresh_target_scores_dialog()
+
+    def build_target_scores_dialog(self):
+        """Build the target scores dialog once; later opens reuse it"""
         dialog = ctk.CTkToplevel(self)
         dialog.title("🎯 Set Target Study Scores")
         dialog.geometry("600x700")
         dialog.transient(self)
+        self.target_dialog = dialog
+        self.target_cards = {}  # subject -> (card, target_var, current_label, current_score)
+        self.target_card_order = []
         
         # Center the dialog
         dialog.update_idletasks()
@@ -1041,32 +1238,11 @@ class ExamTodoApp(ctk.CTk):
         # Set grab after window is visible
         dialog.after(100, dialog.grab_set)
         
-        # Get all subjects from both selected subjects and API data
-        all_subjects = set(self.available_subjects)
-        
-        # Add subjects from API data (study scores file)
-        if os.path.exists(TEST_SCORES_FILE):
-            try:
-                with open(TEST_SCORES_FILE, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        subject = row.get('Subject', '').strip()
-                        if subject and subject not in ['SAC', 'Total', 'Assessed Coursework']:
-                            # Check if this is a "Total" row (contains actual course names)
-                            sac_type = row.get('SAC', '').strip()
-                            if sac_type == 'Total':
-                                all_subjects.add(subject)
-            except Exception as e:
-                print(f"Error reading API subjects: {e}")
-        
-        # Convert to sorted list
-        all_subjects = sorted(list(all_subjects))
-        
         # Main title
         title_label = ctk.CTkLabel(
             dialog, 
             text="🎯 Target Study Scores", 
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.styles.font("dialog_title")
         )
         title_label.pack(pady=(20, 10))
         
@@ -1074,129 +1250,29 @@ class ExamTodoApp(ctk.CTk):
         instructions = ctk.CTkLabel(
             dialog, 
             text="Set your target study score for each subject (0-50)\nThese will help prioritize your study schedule",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray70", "gray30")
+            font=self.styles.font("body"),
+            text_color=self.styles.color("muted")
         )
         instructions.pack(pady=(0, 20))
         
         # Scrollable frame for subjects
-        scroll_frame = ctk.CTkScrollableFrame(
+        self.target_scroll_frame = ctk.CTkScrollableFrame(
             dialog, 
             width=550, 
             height=400,
             label_text="Subject Targets"
         )
-        scroll_frame.pack(padx=20, pady=10, fill="both", expand=True)
-        
-        # Subject entry fields
-        target_vars = {}
-        
-        for i, subject in enumerate(all_subjects):
-            # Subject card
-            subject_card = ctk.CTkFrame(scroll_frame)
-            subject_card.pack(fill='x', padx=10, pady=5)
-            subject_card.grid_columnconfigure(1, weight=1)
-            
-            # Subject name
-            subject_label = ctk.CTkLabel(
-                subject_card, 
-                text=subject, 
-                font=ctk.CTkFont(size=16, weight="bold"),
-                width=200,
-                anchor="w"
-            )
-            subject_label.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
-            
-            # Current target score (if any)
-            current_target = self.target_scores.get(subject, "")
-            target_var = tk.StringVar(value=str(current_target) if current_target else "")
-            target_vars[subject] = target_var
-            
-            # Entry field
-            entry = ctk.CTkEntry(
-                subject_card, 
-                textvariable=target_var,
-                placeholder_text="Target (0-50)",
-                width=100
-            )
-            entry.grid(row=0, column=1, padx=15, pady=(15, 5), sticky="e")
-            
-            # Current score display (if available from API)
-            current_score = self.get_current_score(subject)
-            current_label = ctk.CTkLabel(
-                subject_card,
-                text=f"Current Score: {current_score}",
-                font=ctk.CTkFont(size=12),
-                text_color=("gray70", "gray30")
-            )
-            current_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 15))
+        self.target_scroll_frame.pack(padx=20, pady=10, fill="both", expand=True)
         
         # Button frame
         button_frame = ctk.CTkFrame(dialog)
         button_frame.pack(fill='x', padx=20, pady=(10, 20))
         
-        def save_target_scores():
-            """Save the target scores to CSV file"""
-            try:
-                # Ensure the programs directory exists
-                os.makedirs("programs", exist_ok=True)
-                
-                # Validate and save scores
-                valid_scores = {}
-                for subject, var in target_vars.items():
-                    score_str = var.get().strip()
-                    if score_str:  # Only save non-empty scores
-                        try:
-                            score = float(score_str)
-                            if 0 <= score <= 50:
-                                valid_scores[subject] = score
-                            else:
-                                messagebox.showerror(
-                                    "Invalid Score", 
-                                    f"Score for {subject} must be between 0 and 50."
-                                )
-                                return
-                        except ValueError:
-                            messagebox.showerror(
-                                "Invalid Score", 
-                                f"Please enter a valid number for {subject}."
-                            )
-                            return
-                
-                # Write to CSV
-                with open(TARGET_SCORES_FILE, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Subject', 'Target_Score'])
-                    for subject, score in valid_scores.items():
-                        writer.writerow([subject, score])
-                
-                # Update the main app's target scores
-                self.target_scores = valid_scores
-                
-                # Refresh the UI
-                self.create_progress_cards()
-                self.update_visualizations()
-                
-                messagebox.showinfo(
-                    "Success", 
-                    f"Target scores saved for {len(valid_scores)} subjects."
-                )
-                dialog.destroy()
-                
-            except Exception as e:
-                messagebox.showerror(
-                    "Error", 
-                    f"Failed to save target scores: {e}"
-                )
-        
-        def cancel_dialog():
-            dialog.destroy()
-        
         # Buttons
         cancel_btn = ctk.CTkButton(
             button_frame, 
             text="Cancel", 
-            command=cancel_dialog,
+            command=lambda: self.hide_cached_dialog(dialog),
             fg_color="gray"
         )
         cancel_btn.pack(side='left', padx=(20, 10), pady=15)
@@ -1204,20 +1280,150 @@ class ExamTodoApp(ctk.CTk):
         save_btn = ctk.CTkButton(
             button_frame, 
             text="💾 Save Target Scores", 
-            command=save_target_scores,
+            command=self.save_target_scores,
             fg_color="green"
         )
         save_btn.pack(side='right', padx=(10, 20), pady=15)
         
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self.hide_cached_dialog(dialog))
+        
         # Focus on the dialog
         dialog.focus_set()
 
+    def build_target_card(self, subject):
+        """Create the card for one subject in the target scores dialog"""
+        # Subject card
+        subject_card = ctk.CTkFrame(self.target_scroll_frame)
+        subject_card.grid_columnconfigure(1, weight=1)
+        
+        # Subject name
+        subject_label = ctk.CTkLabel(
+            subject_card, 
+            text=subject, 
+            font=self.styles.font("card_title"),
+            width=200,
+            anchor="w"
+        )
+        subject_label.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
+        
+        target_var = tk.StringVar()
+        
+        # Entry field
+        entry = ctk.CTkEntry(
+            subject_card, 
+            textvariable=target_var,
+            placeholder_text="Target (0-50)",
+            width=100
+        )
+        entry.grid(row=0, column=1, padx=15, pady=(15, 5), sticky="e")
+        
+        # Current score display (if available from API)
+        current_label = ctk.CTkLabel(
+            subject_card,
+            font=self.styles.font("caption"),
+            text_color=self.styles.color("muted")
+        )
+        current_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 15))
+        return [subject_card, target_var, current_label, None]
+
+    def refresh_target_scores_dialog(self):
+        """Sync the cached dialog with the current subjects, targets and scores"""
+        subjects = self.get_target_subjects()
+        
+        for subject in list(self.target_cards):
+            if subject not in subjects:
+                self.target_cards.pop(subject)[0].destroy()
+        for subject in subjects:
+            if subject not in self.target_cards:
+                self.target_cards[subject] = self.build_target_card(subject)
+        
+        # Only re-pack when the subject list itself changed
+        if subjects != self.target_card_order:
+            for subject in subjects:
+                self.target_cards[subject][0].pack_forget()
+            for subject in subjects:
+                self.target_cards[subject][0].pack(fill='x', padx=10, pady=5)
+            self.target_card_order = subjects
+        
+        for subject in subjects:
+            card = self.target_cards[subject]
+            # Reset entries to the saved target (discards unsaved edits from last time)
+            current_target = self.target_scores.get(subject, "")
+            card[1].set(str(current_target) if current_target else "")
+            current_score = self.get_current_score(subject)
+            if card[3] != current_score:
+                card[2].configure(text=f"Current Score: {current_score}")
+                card[3] = current_score
+
+    def save_target_scores(self):
+        """Save the target scores to CSV file"""
+        try:
+            # Validate and save scores
+            valid_scores = {}
+            for subject, card in self.target_cards.items():
+                score_str = card[1].get().strip()
+                if score_str:  # Only save non-empty scores
+                    try:
+                        score = float(score_str)
+                        if 0 <= score <= 50:
+                            valid_scores[subject] = score
+                        else:
+                            messagebox.showerror(
+                                "Invalid Score", 
+                                f"Score for {subject} must be between 0 and 50."
+                            )
+                            return
+                    except ValueError:
+                        messagebox.showerror(
+                            "Invalid Score", 
+                            f"Please enter a valid number for {subject}."
+                        )
+                        return
+            
+            # Write to CSV now (not coalesced), so a failed write reaches the
+            # error box below instead of a deferred print after "saved"
+            get_service().write(
+                TARGET_SCORES_FILE,
+                [[subject, score] for subject, score in valid_scores.items()],
+                header=['Subject', 'Target_Score']
+            )
+            
+            # Update the main app's target scores
+            self.target_scores = valid_scores
+            
+            # Refresh the UI
+            self.create_progress_cards()
+            self.update_visualizations()
+            
+            messagebox.showinfo(
+                "Success", 
+                f"Target scores saved for {len(valid_scores)} subjects."
+            )
+            self.hide_cached_dialog(self.target_dialog)
+            
+        except Exception as e:
+            messagebox.showerror(
+                "Error", 
+                f"Failed to save target scores: {e}"
+            )
+
     def show_sac_breakdown(self, subject):
         """Show detailed SAC breakdown for a subject"""
+        dialog = getattr(self, 'breakdown_dialog', None)
+        if dialog is None or not dialog.winfo_exists():
+            self.build_sac_breakdown_dialog()
+        else:
+            self.show_cached_dialog(dialog)
+        self.refresh_sac_breakdown(subject)
+
+    def build_sac_breakdown_dialog(self):
+        """Build the SAC breakdown dialog once; it is reused for every subject"""
         breakdown_dialog = ctk.CTkToplevel(self)
-        breakdown_dialog.title(f"📋 SAC Breakdown - {subject}")
         breakdown_dialog.geometry("600x500")
         breakdown_dialog.transient(self)
+        self.breakdown_dialog = breakdown_dialog
+        self.breakdown_pages = {}  # subject -> (score data, page frame)
+        self.breakdown_subject = None
         
         # Center the dialog
         breakdown_dialog.update_idletasks()
@@ -1229,59 +1435,94 @@ class ExamTodoApp(ctk.CTk):
         breakdown_dialog.after(100, breakdown_dialog.grab_set)
         
         # Title
-        title_label = ctk.CTkLabel(
+        self.breakdown_title = ctk.CTkLabel(
             breakdown_dialog,
-            text=f"📋 {subject} - SAC Breakdown",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.styles.font("dialog_title")
         )
-        title_label.pack(pady=(20, 10))
-        
-        # Overall score
-        current_score = self.get_current_score(subject)
-        target_score = self.target_scores.get(subject, 50)
+        self.breakdown_title.pack(pady=(20, 10))
         
         overall_frame = ctk.CTkFrame(breakdown_dialog)
         overall_frame.pack(pady=10, padx=20, fill="x")
         
-        overall_label = ctk.CTkLabel(
+        self.breakdown_overall = ctk.CTkLabel(
             overall_frame,
-            text=f"Overall Study Score: {current_score}/50 (Target: {target_score}/50)",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=self.styles.font("section")
         )
-        overall_label.pack(pady=15)
+        self.breakdown_overall.pack(pady=15)
         
         # VCE projection
-        projection = self.calculate_projected_sac_score(subject, target_score)
-        projection_label = ctk.CTkLabel(
+        self.breakdown_projection = ctk.CTkLabel(
             overall_frame,
-            text=f"VCE Projection: {projection}",
-            font=ctk.CTkFont(size=14),
-            text_color=("#d63031", "#ff6b6b") if "Need" in projection else ("#00b894", "#00cec9")
+            font=self.styles.font("body")
         )
-        projection_label.pack(pady=(0, 15))
+        self.breakdown_projection.pack(pady=(0, 15))
         
         # SAC details
-        sac_frame = ctk.CTkScrollableFrame(
+        self.breakdown_sac_frame = ctk.CTkScrollableFrame(
             breakdown_dialog,
             label_text="Individual SAC Scores",
             width=550,
             height=250
         )
-        sac_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        self.breakdown_sac_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        
+        # Close button
+        close_btn = ctk.CTkButton(
+            breakdown_dialog,
+            text="Close",
+            width=100,
+            command=lambda: self.hide_cached_dialog(breakdown_dialog)
+        )
+        close_btn.pack(pady=20)
+        
+        breakdown_dialog.protocol("WM_DELETE_WINDOW", lambda: self.hide_cached_dialog(breakdown_dialog))
+
+    def refresh_sac_breakdown(self, subject):
+        """Point the breakdown dialog at subject, rebuilding its SAC cards only if they changed"""
+        self.breakdown_dialog.title(f"📋 SAC Breakdown - {subject}")
+        self.breakdown_title.configure(text=f"📋 {subject} - SAC Breakdown")
+        
+        # Overall score
+        current_score = self.get_current_score(subject)
+        target_score = self.target_scores.get(subject, 50)
+        self.breakdown_overall.configure(
+            text=f"Overall Study Score: {current_score}/50 (Target: {target_score}/50)"
+        )
+        projection = self.calculate_projected_sac_score(subject, target_score, current_score)
+        self.breakdown_projection.configure(
+            text=f"VCE Projection: {projection}",
+            text_color=self.styles.color("bad" if "Need" in projection else "good")
+        )
         
         sac_data = self.get_sac_breakdown(subject)
+        cached = self.breakdown_pages.get(subject)
+        if cached is None or cached[0] != sac_data:
+            if cached is not None:
+                cached[1].destroy()
+            page = self.build_sac_page(sac_data)
+            self.breakdown_pages[subject] = (sac_data, page)
+        
+        if self.breakdown_subject != subject or cached is None or cached[0] != sac_data:
+            for _, other in self.breakdown_pages.values():
+                other.pack_forget()
+            self.breakdown_pages[subject][1].pack(fill='both', expand=True)
+            self.breakdown_subject = subject
+
+    def build_sac_page(self, sac_data):
+        """Create the SAC cards for one subject inside the breakdown dialog"""
+        page = ctk.CTkFrame(self.breakdown_sac_frame, fg_color="transparent")
         
         if sac_data:
             for i, sac in enumerate(sac_data):
-                sac_card = ctk.CTkFrame(sac_frame)
+                sac_card = ctk.CTkFrame(page)
                 sac_card.pack(fill='x', padx=10, pady=5)
                 sac_card.grid_columnconfigure(1, weight=1)
                 
                 # SAC name
                 sac_name_label = ctk.CTkLabel(
                     sac_card,
-                    text=sac['name'],
-                    font=ctk.CTkFont(size=16, weight="bold"),
+                    text=sac.name,
+                    font=self.styles.font("card_title"),
                     anchor="w"
                 )
                 sac_name_label.grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
@@ -1289,38 +1530,30 @@ class ExamTodoApp(ctk.CTk):
                 # Score
                 score_label = ctk.CTkLabel(
                     sac_card,
-                    text=f"{sac['score']:.1f}/50",
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    text_color=("#1f538d", "#3d8bff")
+                    text=f"{sac.score:.1f}/50",
+                    font=self.styles.font("card_title"),
+                    text_color=self.styles.color("score")
                 )
                 score_label.grid(row=0, column=1, padx=15, pady=(15, 5), sticky="e")
                 
                 # Percentage (if available)
-                if sac['percentage'] != 'N/A':
+                if sac.percentage != 'N/A':
                     percentage_label = ctk.CTkLabel(
                         sac_card,
-                        text=f"Weight: {sac['percentage']}",
-                        font=ctk.CTkFont(size=12),
-                        text_color=("gray70", "gray30")
+                        text=f"Weight: {sac.percentage}",
+                        font=self.styles.font("caption"),
+                        text_color=self.styles.color("muted")
                     )
                     percentage_label.grid(row=1, column=0, columnspan=2, padx=15, pady=(0, 15))
         else:
             no_data_label = ctk.CTkLabel(
-                sac_frame,
+                page,
                 text="No detailed SAC data available",
-                font=ctk.CTkFont(size=16),
-                text_color=("gray70", "gray30")
+                font=self.styles.font("message"),
+                text_color=self.styles.color("muted")
             )
             no_data_label.pack(pady=50)
-        
-        # Close button
-        close_btn = ctk.CTkButton(
-            breakdown_dialog,
-            text="Close",
-            width=100,
-            command=breakdown_dialog.destroy
-        )
-        close_btn.pack(pady=20)
+        return page
 
     def open_study_timer(self):
         """Open a modern study timer dialog"""
@@ -1348,7 +1581,7 @@ class ExamTodoApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             timer_dialog, 
             text="⏱️ Study Timer", 
-            font=ctk.CTkFont(size=28, weight="bold")
+            font=self.styles.font("page_title")
         )
         title_label.pack(pady=(30, 20))
         
@@ -1361,8 +1594,8 @@ class ExamTodoApp(ctk.CTk):
         self.time_display = ctk.CTkLabel(
             timer_frame,
             text="25:00",
-            font=ctk.CTkFont(size=48, weight="bold"),
-            text_color=("#1f538d", "#14375e")
+            font=self.styles.font("timer"),
+            text_color=self.styles.color("timer")
         )
         self.time_display.pack(expand=True)
         
@@ -1375,7 +1608,7 @@ class ExamTodoApp(ctk.CTk):
         preset_frame = ctk.CTkFrame(timer_dialog)
         preset_frame.pack(pady=20, padx=40, fill="x")
         
-        preset_label = ctk.CTkLabel(preset_frame, text="Quick Presets:", font=ctk.CTkFont(size=16, weight="bold"))
+        preset_label = ctk.CTkLabel(preset_frame, text="Quick Presets:", font=self.styles.font("card_title"))
         preset_label.pack(pady=(15, 10))
         
         preset_buttons_frame = ctk.CTkFrame(preset_frame)
@@ -1396,7 +1629,7 @@ class ExamTodoApp(ctk.CTk):
         custom_frame = ctk.CTkFrame(timer_dialog)
         custom_frame.pack(pady=10, padx=40, fill="x")
         
-        custom_label = ctk.CTkLabel(custom_frame, text="Custom Time (minutes):", font=ctk.CTkFont(size=14))
+        custom_label = ctk.CTkLabel(custom_frame, text="Custom Time (minutes):", font=self.styles.font("body"))
         custom_label.pack(pady=(15, 5))
         
         input_frame = ctk.CTkFrame(custom_frame)
@@ -1426,7 +1659,7 @@ class ExamTodoApp(ctk.CTk):
         self.start_btn = ctk.CTkButton(
             control_frame,
             text="▶️ Start",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.styles.font("card_title"),
             fg_color="green",
             command=lambda: self.toggle_timer(timer_dialog),
             width=120,
@@ -1437,7 +1670,7 @@ class ExamTodoApp(ctk.CTk):
         self.reset_btn = ctk.CTkButton(
             control_frame,
             text="🔄 Reset",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self.styles.font("card_title"),
             fg_color="orange",
             command=lambda: self.reset_timer(timer_dialog),
             width=120,
@@ -1536,67 +1769,130 @@ class ExamTodoApp(ctk.CTk):
         except:
             pass
 
+    def open_tool_window(self, key, build, on_show=None, geometry=None):
+        """
+        Host one of the standalone tools (studytime, testscore, ...) in a
+        CTkToplevel of this app instead of a separate Python process.
+
+        build(window) creates the tool on the window, once; closing the window
+        only hides it, so reopening is instant and keeps the tool's state. The
+        tools subscribe to their files in data_service, so they stay current
+        while hidden; on_show(tool) can still refresh one when it comes back.
+        """
+        window, tool = self.tool_windows.get(key, (None, None))
+        if window is not None and window.winfo_exists():
+            window.deiconify()
+            window.lift()
+            window.focus_set()
+            if on_show:
+                on_show(tool)
+            return tool
+        window = ctk.CTkToplevel(self)
+        if geometry:
+            window.geometry(geometry)
+        # The one focus hook for hosted tools; they only subscribe to their files
+        window.bind("<FocusIn>", lambda event: get_service().check(), add="+")
+        tool = build(window)
+        window.protocol("WM_DELETE_WINDOW", lambda: self.hide_cached_dialog(window))
+        self.tool_windows[key] = (window, tool)
+        return tool
+
     def start_studytime(self):
         try:
-            subprocess.Popen(["python", "studytime.py"])
+            from studytime import StudyTimeApp
+            self.open_tool_window("studytime", StudyTimeApp)
         except Exception as e:
             messagebox.showerror("Error", f"Error: {e}", parent=self)
 
     def open_testscore_app(self):
         try:
-            subprocess.Popen(["python", "testscore.py"])
+            from testscore import StudyScoreApp
+            self.open_tool_window("testscore", StudyScoreApp)
         except Exception as e:
             messagebox.showerror("Error", f"Error: {e}", parent=self)
 
     def open_subject_difficulty_app(self):
         try:
-            subprocess.Popen(["python", "subject_difficulty.py"])
+            from subject_difficulty import CSVViewerApp
+            self.open_tool_window("difficulty", CSVViewerApp, geometry="600x400")
         except Exception as e:
             messagebox.showerror("Error", f"Error: {e}", parent=self)
 
+    def open_subject_selection(self):
+        """First run: pick subjects in a window of this app, then reload them"""
+        from Subject_selection import SubjectSelectionApp
+
+        def build(window):
+            window.transient(self)
+            window.after(100, window.grab_set)
+            return SubjectSelectionApp(window, on_saved=lambda _: self.on_subjects_saved())
+
+        self.open_tool_window("subjects", build)
+
+    def on_subjects_saved(self):
+        self.on_data_changed(SUBJECTS_FILE)
+
 def is_subjects_file_empty():
     if not os.path.exists(SUBJECTS_FILE):
         return True
     try:
-        with open(SUBJECTS_FILE, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if row:
-                    return False
-        return True
+        return not get_service().load(SUBJECTS_FILE, read_subjects)
     except Exception:
         return True
 
-def update_scores_from_api():
+def run_app():
+    # Update CSVs from API before UI loads
+    sync_startup()
+
+    # Create and run the modern app
+    app = ExamTodoApp()
+    if is_subjects_file_empty():
+        # Ask for subjects in a window of the app rather than a second process
+        app.after(0, app.open_subject_selection)
+    app.mainloop()
+
+def replay_startup():
     """
-    Calls API.py's fetch_and_save_scores and fetch_and_save_exams to update CSVs before UI loads.
+    Scripted, non-interactive run of startup + API sync + a full redraw of
+    every tab and chart, for reproducible profiles. Needs a display (or Xvfb)
+    but no user input; the window is never shown.
     """
+    sync_startup()
+    app = ExamTodoApp()
+    app.withdraw()
     try:
-        api_path = os.path.join(os.path.dirname(__file__), "API.py")
-        spec = importlib.util.spec_from_file_location("API", api_path)
-        api = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(api)
-        api.fetch_and_save_scores(TEST_SCORES_FILE)
-        api.fetch_and_save_exams(CSV_FILE)
-    except Exception as e:
-        print(f"Warning: Could not update scores/exams from API: {e}")
+        app.load_all_data()
+        app.load_exams_from_csv()
+        app.create_progress_cards()
+        app.update_all_charts()
+        app.update_idletasks()
+    finally:
+        app.on_close()
 
-if __name__ == "__main__":
-    # Update CSVs from API before UI loads
-    update_scores_from_api()
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="VCE exam priority dashboard")
+    parser.add_argument("--profile", action="store_true",
+                        help="run under cProfile and a stack sampler (pstats + collapsed stacks)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="run under tracemalloc and report the top allocation sites")
+    parser.add_argument("--replay", action="store_true",
+                        help="run a scripted startup + sync + redraw instead of the interactive app")
+    parser.add_argument("--profile-dir", default=None,
+                        help="where to write profiling output (default programs/profile)")
+    args = parser.parse_args(argv)
 
-    if is_subjects_file_empty():
-        try:
-            subprocess.Popen(["python", "Subject_selection.py"])
-            # Show info using tkinter messagebox since app isn't created yet
-            import tkinter as tk
-            root_temp = tk.Tk()
-            root_temp.withdraw()  # Hide the temporary root
-            messagebox.showinfo("Info", "Please select subjects first.")
-            root_temp.destroy()
-        except Exception as e:
-            print(f"Error: {e}")
+    target = replay_startup if args.replay else run_app
+    if not (args.profile or args.trace_memory):
+        target()
+        return
+    import profiling
+    profiling.run_profiled(
+        target,
+        profile=args.profile,
+        trace_memory=args.trace_memory,
+        out_dir=args.profile_dir or profiling.PROFILE_DIR,
+    )
 
-    # Create and run the modern app
-    app = ExamTodoApp()
-    app.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,159 @@
+"""
+Sync many students' Canvas data in one run.
+
+    python multi_sync.py accounts.csv --out-dir programs/students --parallel 4
+
+accounts.csv has a header row and the columns name,token (plus an optional
+api_url column, defaulting to CANVAS_API_URL). Each account is synced by its
+own CanvasClient, so each token gets its own adaptive rate limiter and its own
+requests session (cookies never cross accounts), while all the sessions share
+one HTTP connection pool (with --engine async only the course lists do; see
+async_api). Every student's study_scores.csv and
+exams.csv go into <out-dir>/<name>/, and a per-account timing and error report
+is printed at the end and written to <out-dir>/sync_report.json (tokens are
+never written out).
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_OUT_DIR = os.path.join("programs", "students")
+DEFAULT_PARALLEL = 4  # accounts synced at once
+REPORT_FILE = "sync_report.json"
+
+
+class Account:
+    __slots__ = ("name", "token", "api_url")
+
+    def __init__(self, name, token, api_url=None):
+        self.name = name
+        self.token = token
+        self.api_url = api_url
+
+    def __repr__(self):
+        return f"Account(name={self.name!r})"
+
+
+def load_accounts(path):
+    """Read name,token[,api_url] rows; rows without a name or token are skipped."""
+    accounts = []
+    seen = set()
+    with open(path, mode='r', newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            name = (row.get("name") or "").strip()
+            token = (row.get("token") or "").strip()
+            if not name or not token:
+                continue
+            # Names must stay distinct once reduced to directory names
+            key = account_dir("", name)
+            if key in seen:
+                raise ValueError(f"Duplicate account name {name!r} in {path}")
+            seen.add(key)
+            accounts.append(Account(name, token, (row.get("api_url") or "").strip() or None))
+    return accounts
+
+
+def account_dir(out_dir, name):
+    """Per-student data directory, with the name reduced to filesystem-safe characters."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("._") or "account"
+    return os.path.join(out_dir, safe)
+
+
+def make_adapter(pool_size):
+    """The connection pool shared by every account's session."""
+    from requests.adapters import HTTPAdapter
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+
+def make_session(adapter):
+    """
+    A session for one account, on the shared pool. Only the adapter is shared:
+    a session's cookie jar would carry one student's Canvas cookies into
+    another's requests.
+    """
+    import requests
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def sync_account(account, out_dir, adapter, engine="threads"):
+    """Run one account's refresh into its own directory; returns its report entry."""
+    import API
+    directory = account_dir(out_dir, account.name)
+    os.makedirs(directory, exist_ok=True)
+    api_url = account.api_url or API.API_URL
+    entry = {"account": account.name, "directory": directory}
+    start = time.perf_counter()
+    client = None
+    session = make_session(adapter)  # not closed: that would close the shared adapter
+    try:
+        if engine == "async":
+            import async_api
+            # Shares the pool for the course list only; see async_api
+            client = async_api.AsyncCanvasClient(api_url, account.token, session=session)
+        else:
+            client = API.CanvasClient(api_url, account.token, session=session)
+        metrics = client.refresh(os.path.join(directory, "study_scores.csv"),
+                                 os.path.join(directory, "exams.csv"))
+        entry.update(status=metrics["status"], duration=metrics["duration"],
+                     requests=metrics["requests"], retries=metrics["retries"],
+                     failures=metrics["failures"])
+    except Exception as e:
+        entry.update(status="error", duration=round(time.perf_counter() - start, 3),
+                     requests=client.request_count if client else 0,
+                     retries=client.retry_count if client else 0,
+                     failures=[str(e)])
+    return entry
+
+
+def run(accounts, out_dir=DEFAULT_OUT_DIR, parallel=DEFAULT_PARALLEL, engine="threads"):
+    """Sync every account, parallel at a time; returns the report dict (also saved as JSON)."""
+    from rate_limit import MAX_LIMIT
+    os.makedirs(out_dir, exist_ok=True)
+    adapter = make_adapter(parallel * MAX_LIMIT)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="account") as pool:
+        results = list(pool.map(lambda a: sync_account(a, out_dir, adapter, engine), accounts))
+    report = {
+        "duration": round(time.perf_counter() - start, 3),
+        "accounts": len(results),
+        "ok": sum(1 for r in results if r["status"] == "ok"),
+        "requests": sum(r.get("requests", 0) for r in results),
+        "results": results,
+    }
+    with open(os.path.join(out_dir, REPORT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return report
+
+
+def print_report(report):
+    print(f"{'Account':<24} {'Status':<9} {'Time (s)':>9} {'Requests':>9} {'Retries':>8}")
+    for r in report["results"]:
+        print(f"{r['account'][:24]:<24} {r['status']:<9} {r['duration']:>9.2f} "
+              f"{r.get('requests', 0):>9} {r.get('retries', 0):>8}")
+        for failure in r["failures"]:
+            print(f"    {failure}")
+    print(f"\n{report['ok']}/{report['accounts']} accounts synced in {report['duration']:.2f}s "
+          f"({report['requests']} requests)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync several students' Canvas data")
+    parser.add_argument("accounts", help="CSV file with name,token[,api_url] columns")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLEL, help="accounts synced at once")
+    parser.add_argument("--engine", choices=("threads", "async"), default="threads")
+    args = parser.parse_args()
+
+    report = run(load_accounts(args.accounts), args.out_dir, args.parallel, args.engine)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
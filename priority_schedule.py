@@ -0,0 +1,42 @@
+"""
+When does the exam list need re-ranking?
+
+Everything time-dependent in the dashboard (urgency in compute_priority, the
+OVERDUE/URGENT/SOON/LATER bands at 0/3/7 days, "N days left") is a function of
+the whole-day count (exam_datetime - now).days. That count only changes at one
+instant per exam per day, so instead of polling we compute the next such
+instant across all exams and set a single timer for it.
+"""
+import math
+from datetime import timedelta
+
+
+def next_change(exam_dt, now):
+    """
+    Next instant at which (exam_dt - now).days decreases, or None when it
+    no longer matters (the exam is already due: priority is pinned to inf and
+    the card just says OVERDUE).
+    """
+    delta = exam_dt - now
+    days = delta.days
+    if days <= 0:
+        return None
+    # delta.days stays the same until delta drops below days * 1 day
+    remainder = delta - timedelta(days=days)
+    return now + remainder
+
+
+def next_change_delay_ms(exam_datetimes, now):
+    """
+    Milliseconds from now until the earliest next_change over exam_datetimes
+    (rounded up, plus 1 ms so the day count has definitely rolled over), or
+    None if no exam will change.
+    """
+    earliest = None
+    for exam_dt in exam_datetimes:
+        at = next_change(exam_dt, now)
+        if at is not None and (earliest is None or at < earliest):
+            earliest = at
+    if earliest is None:
+        return None
+    return math.ceil((earliest - now).total_seconds() * 1000) + 1
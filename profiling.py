@@ -0,0 +1,114 @@
+"""
+Run a callable under cProfile and/or tracemalloc and dump the results.
+
+Used by `python main.py --profile` / `--trace-memory`. Output files (in
+out_dir, default programs/profile):
+
+    profile.pstats     cProfile stats, for `python -m pstats` or snakeviz
+    profile.txt        the top functions by cumulative time
+    profile.collapsed  sampled main-thread stacks in the collapsed format
+                       ("outer;inner;leaf count") read by flamegraph.pl/speedscope
+    memory_top.txt     top allocation sites when tracing memory
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+
+PROFILE_DIR = os.path.join("programs", "profile")
+SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+MEMORY_FRAMES = 10       # traceback depth kept by tracemalloc
+
+
+class StackSampler:
+    """Samples one thread's Python stack on a timer and counts identical stacks."""
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write_collapsed(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def write_memory_report(snapshot, path, limit=TOP_ALLOCATIONS):
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"Total traced: {total / 1024:.1f} KiB in {len(stats)} sites\n\n")
+        for i, stat in enumerate(stats[:limit], start=1):
+            frame = stat.traceback[0]
+            f.write(f"#{i}: {frame.filename}:{frame.lineno}: "
+                    f"{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+        # Full tracebacks for the biggest few, to see who called the allocator
+        for stat in snapshot.statistics("traceback")[:5]:
+            f.write(f"\n{stat.size / 1024:.1f} KiB in {stat.count} blocks\n")
+            for line in stat.traceback.format():
+                f.write(f"  {line}\n")
+
+
+def run_profiled(target, profile=True, trace_memory=False, out_dir=PROFILE_DIR):
+    """Call target() under the requested tools, write reports to out_dir, return its result."""
+    os.makedirs(out_dir, exist_ok=True)
+    profiler = cProfile.Profile() if profile else None
+    sampler = StackSampler(threading.get_ident()) if profile else None
+
+    if trace_memory:
+        tracemalloc.start(MEMORY_FRAMES)
+    if sampler:
+        sampler.start()
+    if profiler:
+        profiler.enable()
+    try:
+        return target()
+    finally:
+        if profiler:
+            profiler.disable()
+        if sampler:
+            sampler.stop()
+        if trace_memory:
+            memory = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            write_memory_report(memory, os.path.join(out_dir, "memory_top.txt"))
+        if profiler:
+            profiler.dump_stats(os.path.join(out_dir, "profile.pstats"))
+            text = io.StringIO()
+            pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+            with open(os.path.join(out_dir, "profile.txt"), 'w', encoding='utf-8') as f:
+                f.write(text.getvalue())
+            sampler.write_collapsed(os.path.join(out_dir, "profile.collapsed"))
+        print(f"Profiling output written to {out_dir}")
@@ -0,0 +1,103 @@
+"""
+Adaptive concurrency and retry policy for Canvas requests.
+
+Canvas meters each token with a leaky bucket and reports what is left in the
+X-Rate-Limit-Remaining header; once it runs dry requests fail with 403
+("Rate Limit Exceeded") or 429. AdaptiveLimiter caps the number of requests
+in flight AIMD-style: the cap grows by about one per round of successful
+requests while quota is plentiful, and halves on a throttle or when the
+remaining quota drops below LOW_WATER. Failed requests are retried after
+backoff_delay, with full jitter so parallel workers don't retry in lockstep.
+"""
+import random
+import threading
+
+INITIAL_LIMIT = 4
+MIN_LIMIT = 1
+MAX_LIMIT = 16
+LOW_WATER = 200.0     # X-Rate-Limit-Remaining below this counts as back-pressure
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5    # seconds
+BACKOFF_CAP = 30.0
+
+
+class AdaptiveLimiter:
+    def __init__(self, initial=INITIAL_LIMIT, min_limit=MIN_LIMIT, max_limit=MAX_LIMIT,
+                 low_water=LOW_WATER):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.low_water = low_water
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.peak_limit = self.limit
+        self.throttles = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+    def on_success(self, remaining=None):
+        """Additive increase, unless the reported quota says to back off."""
+        with self._cond:
+            if remaining is not None and remaining < self.low_water:
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.peak_limit = max(self.peak_limit, self.limit)
+            self._cond.notify_all()
+
+    def on_throttle(self):
+        """Multiplicative decrease after a 403/429."""
+        with self._cond:
+            self.throttles += 1
+            self._decrease()
+
+    def _decrease(self):
+        self.limit = max(self.min_limit, self.limit / 2)
+
+
+def parse_remaining(headers):
+    """X-Rate-Limit-Remaining as a float, or None if absent/invalid."""
+    value = headers.get("X-Rate-Limit-Remaining")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_throttled(status_code, body_text=""):
+    return status_code == 429 or (status_code == 403 and "Rate Limit Exceeded" in body_text)
+
+
+def is_retryable(status_code):
+    return status_code >= 500 or status_code in (408, 429)
+
+
+def backoff_delay(attempt, retry_after=None, base=BACKOFF_BASE, cap=BACKOFF_CAP, rng=random):
+    """
+    Seconds to wait before retry number attempt (0-based): a uniformly random
+    delay up to base * 2**attempt (capped), but never less than Retry-After.
+    """
+    delay = rng.uniform(0, min(cap, base * 2 ** attempt))
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+    return delay
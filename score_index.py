@@ -0,0 +1,173 @@
+"""
+In-memory index over study_scores.csv.
+
+The file is parsed once per version (see persistence.snapshot_version) and every
+lookup after that is a dict access, instead of a full CSV parse per subject.
+Scores and subjects only need the Total rows, which are picked out of the
+memory-mapped file by column_reader without parsing anything else; the SAC
+breakdowns are parsed on first use (large exports in parallel chunks by
+csv_loader).
+"""
+import sys
+
+import csv_loader
+from column_reader import MappedCSV, text
+from persistence import is_pending, read_snapshot, snapshot_version
+
+
+class SacRecord:
+    """One SAC result in a subject's breakdown (immutable, slotted)."""
+    __slots__ = ("name", "score", "percentage")
+
+    def __init__(self, name, score, percentage='N/A'):
+        object.__setattr__(self, "name", sys.intern(name))
+        object.__setattr__(self, "score", score)
+        object.__setattr__(self, "percentage", percentage)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("SacRecord is immutable")
+
+    __delattr__ = __setattr__
+
+    def __eq__(self, other):
+        if not isinstance(other, SacRecord):
+            return NotImplemented
+        return (self.name, self.score, self.percentage) == (other.name, other.score, other.percentage)
+
+    def __hash__(self):
+        return hash((self.name, self.score, self.percentage))
+
+    def __repr__(self):
+        return f"SacRecord(name={self.name!r}, score={self.score!r}, percentage={self.percentage!r})"
+
+
+def score_events(rows, header):
+    """
+    Per-row part of the parse: ("T", subject, score) for Total rows and
+    ("S", subject, sac, value, percentage) for SAC rows with a numeric score.
+    Pure and order-preserving, so csv_loader can run it on chunks in workers.
+    """
+    events = []
+    for values in rows:
+        row = dict(zip(header, values))
+        subject = row.get('Subject')
+        sac = (row.get('SAC') or '').strip()
+        score = row.get('Score') or ''
+        if not subject:
+            continue
+        if sac == 'Total':
+            events.append(("T", subject, score))
+        elif sac and score:
+            try:
+                value = float(score)
+            except ValueError:
+                continue
+            events.append(("S", subject, row.get('SAC', ''), value, row.get('Percentage', 'N/A')))
+    return events
+
+
+def total_events(path):
+    """
+    (version, events) where events are score_events' ("T", subject, score)
+    tuples, read from only the Total rows of the mapped file.
+    """
+    events = []
+    with MappedCSV(path) as data:
+        for subject, score in data.scan(["Subject", "Score"], where={"SAC": "Total"}):
+            subject = text(subject)
+            if subject:
+                events.append(("T", subject, text(score) or ''))
+        return data.version, events
+
+
+class ScoreIndex:
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self._totals = {}      # subject -> formatted "Total" score, e.g. "85.0"
+        self._breakdown = {}   # subject -> [SacRecord]; None until needed for this version
+        self._subjects = []    # subjects that have a "Total" row, in file order
+
+    def _ensure(self, breakdown=False):
+        """
+        Reload the totals if the file has been replaced since the last load,
+        and with breakdown=True make sure the SAC breakdowns are parsed too.
+        """
+        version = snapshot_version(self.path)
+        if version is None:
+            if self.version is not None:
+                self._load([])
+                self.version = None
+            return
+        try:
+            if version != self.version:
+                if is_pending(self.path):
+                    # A queued write only exists in memory; read it in full
+                    self._fold_all()
+                else:
+                    self.version, events = total_events(self.path)
+                    self._fold(events)
+                    self._breakdown = None
+            if breakdown and self._breakdown is None:
+                self._fold_all()
+        except Exception as e:
+            print(f"Error loading scores: {e}")
+
+    def _fold_all(self):
+        version = snapshot_version(self.path)
+        if version is not None and version[2] >= csv_loader.LARGE_FILE and not is_pending(self.path):
+            self.version, events = self._parse_large(version)
+        else:
+            self.version, rows = read_snapshot(self.path)
+            events = score_events(rows[1:], rows[0] if rows else [])
+        self._fold(events)
+
+    def _parse_large(self, version, attempts=3):
+        """Chunked parallel parse; retried if the file is replaced mid-parse."""
+        for _ in range(attempts):
+            events = csv_loader.parse_file(self.path, score_events, has_header=True)
+            current = snapshot_version(self.path)
+            if current == version:
+                return version, events
+            version = current
+        return version, events
+
+    def _load(self, rows):
+        self._fold(score_events(rows[1:], rows[0] if rows else []))
+
+    def _fold(self, events):
+        totals = {}
+        breakdown = {}
+        subjects = []
+        bad_totals = set()
+        for event in events:
+            subject = event[1]
+            if event[0] == "T":
+                score = event[2]
+                if subject not in totals and subject not in bad_totals and subject.strip():
+                    subjects.append(subject.strip())
+                if score and subject not in totals and subject not in bad_totals:
+                    try:
+                        totals[subject] = f"{float(score):.1f}"
+                    except ValueError:
+                        bad_totals.add(subject)
+            else:
+                breakdown.setdefault(subject, []).append(SacRecord(*event[2:]))
+        self._totals = totals
+        self._breakdown = breakdown
+        self._subjects = list(dict.fromkeys(subjects))
+
+    def current_score(self, subject):
+        """Formatted current study score for subject, or "No data"."""
+        self._ensure()
+        return self._totals.get(subject, "No data")
+
+    def breakdown(self, subject):
+        """Individual SAC rows for subject (a fresh list the caller may keep)."""
+        self._ensure(breakdown=True)
+        return list((self._breakdown or {}).get(subject, []))
+
+    def subjects(self):
+        """Subjects that have a "Total" row (i.e. courses from the API)."""
+        self._ensure()
+        return list(self._subjects)
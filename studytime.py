@@ -1,32 +1,33 @@
-import csv
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
 
-class StudyTimeApp(tk.Tk):
-    def __init__(self, csv_path="programs/studytime.csv"):
-        super().__init__()
-        self.title("📚 Study Time Tracker")
-        self.geometry("700x500")  # Increase window size for better display
-        self.configure(bg="#f0f4f8")
+from data_service import STUDYTIME_FILE, get_service, read_rows
+
+class StudyTimeApp:
+    """Study log viewer; root is a tk.Tk when run standalone or a Toplevel hosted by main.py."""
+    def __init__(self, root, csv_path=STUDYTIME_FILE):
+        self.root = root
+        self.root.title("📚 Study Time Tracker")
+        self.root.geometry("700x500")  # Increase window size for better display
+        self.root.configure(bg="#f0f4f8")
         self.csv_path = csv_path
 
-        # Set style
-        style = ttk.Style(self)
-        style.theme_use('clam')
+        # Set style (own style names: hosted in main.py, ttk styles are shared app-wide)
+        style = ttk.Style(root)
         style.configure(
-            'Treeview',
+            'StudyTime.Treeview',
             background='#ffffff',
             foreground='#333333',
             rowheight=25,
             fieldbackground='#ffffff',
             font=('Helvetica', 10)
         )
-        style.map('Treeview', background=[('selected', '#aed6f1')])
-        style.configure('Treeview.Heading', font=('Helvetica', 11, 'bold'), background='#d6eaf8')
+        style.map('StudyTime.Treeview', background=[('selected', '#aed6f1')])
+        style.configure('StudyTime.Treeview.Heading', font=('Helvetica', 11, 'bold'), background='#d6eaf8')
 
         # Main frame
-        main_frame = ttk.Frame(self, padding=15)
+        main_frame = ttk.Frame(root, padding=15)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Title
@@ -42,7 +43,8 @@ class StudyTimeApp(tk.Tk):
             tree_frame, 
             columns=("Timestamp", "Duration"), 
             show="headings", 
-            height=12
+            height=12,
+            style='StudyTime.Treeview'
         )
         self.tree.heading("Timestamp", text="Timestamp")
         self.tree.heading("Duration", text="Duration (H:M:S)")
@@ -80,7 +82,11 @@ class StudyTimeApp(tk.Tk):
         refresh_btn = ttk.Button(button_frame, text="🔄 Refresh", command=self.load_and_display_data)
         refresh_btn.pack(side=tk.RIGHT, padx=5)
 
-        # Initial data load
+        # Initial data load; after that the table follows every write to the file
+        self.load_and_display_data()
+        get_service().subscribe(self.csv_path, self.on_data_changed, tk_widget=self.root)
+
+    def on_data_changed(self, path):
         self.load_and_display_data()
 
     def parse_timedelta(self, td_str):
@@ -119,55 +125,61 @@ class StudyTimeApp(tk.Tk):
     def load_and_display_data(self):
         """Read CSV file and display data"""
         try:
-            with open(self.csv_path, newline='', encoding='utf-8') as csvfile:
-                # Clear existing data
-                for row in self.tree.get_children():
-                    self.tree.delete(row)
+            # Parsed once per version of the file by the shared data service
+            rows = get_service().load(self.csv_path, read_rows)
 
-                total_time = timedelta()
-                reader = csv.reader(csvfile)
+            # Clear existing data
+            for row in self.tree.get_children():
+                self.tree.delete(row)
+
+            total_time = timedelta()
+            
+            # Read and display data
+            for row_num, row in enumerate(rows):
+                if len(row) < 2:
+                    continue
                 
-                # Read and display data
-                for row_num, row in enumerate(reader):
-                    if len(row) < 2:
-                        continue
-                    
-                    timestamp_str, duration_str = row[0], row[1]
-                    
-                    # Skip possible header row
-                    if row_num == 0 and (duration_str.lower() == "duration" or ":" not in duration_str):
-                        continue
-                    
-                    duration = self.parse_timedelta(duration_str)
-                    total_time += duration
-                    
-                    # Format time to HH:MM:SS
-                    formatted_time = self.format_timedelta(duration)
-                    
-                    # Add to table
-                    self.tree.insert("", "end", values=(
-                        timestamp_str,
-                        formatted_time
-                    ))
-
-                # Update total time
-                total_formatted = self.format_timedelta(total_time)
-                h, m, s = map(int, total_formatted.split(':'))
-                self.total_label.config(
-                    text=f"Total Study Time: {h} hrs {m} mins {s} secs"
-                )
+                timestamp_str, duration_str = row[0], row[1]
                 
+                # Skip possible header row
+                if row_num == 0 and (duration_str.lower() == "duration" or ":" not in duration_str):
+                    continue
+                
+                duration = self.parse_timedelta(duration_str)
+                total_time += duration
+                
+                # Format time to HH:MM:SS
+                formatted_time = self.format_timedelta(duration)
+                
+                # Add to table
+                self.tree.insert("", "end", values=(
+                    timestamp_str,
+                    formatted_time
+                ))
+
+            # Update total time
+            total_formatted = self.format_timedelta(total_time)
+            h, m, s = map(int, total_formatted.split(':'))
+            self.total_label.config(
+                text=f"Total Study Time: {h} hrs {m} mins {s} secs"
+            )
+            
         except FileNotFoundError:
             messagebox.showerror(
                 "File Not Found",
-                f"Could not find '{self.csv_path}'.\nPlease ensure the file exists."
+                f"Could not find '{self.csv_path}'.\nPlease ensure the file exists.",
+                parent=self.root
             )
         except Exception as e:
             messagebox.showerror(
                 "Error", 
-                f"An error occurred while reading the file:\n{str(e)}"
+                f"An error occurred while reading the file:\n{str(e)}",
+                parent=self.root
             )
 
 if __name__ == "__main__":
-    app = StudyTimeApp()
-    app.mainloop()
\ No newline at end of file
+    root = tk.Tk()
+    # The theme is global to the interpreter, so only pick it when running on our own
+    ttk.Style(root).theme_use('clam')
+    app = StudyTimeApp(root)
+    root.mainloop()
\ No newline at end of file
@@ -1,11 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import csv
 import os
 
-# Path to the difficulty CSV
-DIFFICULTY_FILE = os.path.join('programs', 'difficulty.csv')
-CHECK_INTERVAL = 2000  # milliseconds to check for header change
+from data_service import DIFFICULTY_FILE, get_service, read_rows
 
 def read_csv(filename):
     """
@@ -13,9 +10,7 @@ def read_csv(filename):
     """
     if not os.path.exists(filename):
         raise FileNotFoundError(f"File '{filename}' not found.")
-    with open(filename, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        return list(reader)
+    return get_service().load(filename, read_rows)
 
 class CSVViewerApp:
     def __init__(self, root):
@@ -25,8 +20,8 @@ class CSVViewerApp:
         # Load initial CSV data
         try:
             data = read_csv(DIFFICULTY_FILE)
-        except FileNotFoundError as e:
-            messagebox.showerror("Error", str(e))
+        except FileNotFoundError:
+            messagebox.showerror("Error", f"File '{DIFFICULTY_FILE}' not found.", parent=self.root)
             data = []
 
         # Store initial headers
@@ -47,15 +42,14 @@ class CSVViewerApp:
                 if len(row) == len(self.headers):
                     self.tree.insert("", tk.END, values=row)
 
-        # Start periodic check for header changes
-        self.root.after(CHECK_INTERVAL, self.periodic_check)
+        # Check for header changes whenever the file is rewritten
+        get_service().subscribe(DIFFICULTY_FILE, self.on_file_changed, tk_widget=self.root)
 
-    def periodic_check(self):
+    def on_file_changed(self, path=None):
         # Check for header change
         try:
             data = read_csv(DIFFICULTY_FILE)
         except FileNotFoundError:
-            self.root.after(CHECK_INTERVAL, self.periodic_check)
             return
         new_headers = data[0] if data else []
         # If headers changed (e.g., Subject column renamed)
@@ -63,15 +57,13 @@ class CSVViewerApp:
             # Clear all displayed rows (scores)
             for item in self.tree.get_children():
                 self.tree.delete(item)
-            messagebox.showinfo("Info", "CSV headers changed; all scores cleared.")
+            messagebox.showinfo("Info", "CSV headers changed; all scores cleared.", parent=self.root)
             # Update treeview columns to new headers
             self.headers = new_headers
             self.tree["columns"] = self.headers
             for col in self.headers:
                 self.tree.heading(col, text=col)
                 self.tree.column(col, width=100, anchor='center')
-        # Schedule next check
-        self.root.after(CHECK_INTERVAL, self.periodic_check)
 
 if __name__ == "__main__":
     root = tk.Tk()
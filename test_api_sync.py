@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for partial Canvas syncs against the fake server
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import API
+import async_api
+import fake_canvas
+from persistence import read_snapshot
+
+
+def sync(server, directory, client_class=API.CanvasClient):
+    client = client_class(server.base_url, "test")
+    scores = os.path.join(directory, "study_scores.csv")
+    exams = os.path.join(directory, "exams.csv")
+    return client.refresh(scores, exams), read_snapshot(scores)[1], read_snapshot(exams)[1]
+
+
+def check_failed_course_keeps_previous_rows(client_class):
+    server = fake_canvas.serve(courses=4, assignments=6, bulk_scores=False)
+    try:
+        with tempfile.TemporaryDirectory() as d:
+            metrics, scores, exams = sync(server, d, client_class)
+            assert metrics["status"] == "ok"
+            restricted = "Subject 002"
+            old_scores = [r for r in API.score_blocks(scores[1:]).items() if r[0] == restricted]
+            old_exams = [r for r in exams if r[3] == restricted]
+
+            # The course becomes access-restricted and the others change
+            server.forbidden.add(1002)
+            for course in server.data.courses:
+                server.data.enrollments[course["id"]][0]["grades"]["current_score"] = 99.0
+            metrics, scores, exams = sync(server, d, client_class)
+            assert metrics["status"] == "partial"
+            assert len(metrics["failures"]) == 2
+            blocks = API.score_blocks(scores[1:])
+            assert [r for r in blocks.items() if r[0] == restricted] == old_scores
+            assert all(total[2] == "99.0" for name, (total, _) in blocks.items() if name != restricted)
+            assert len(blocks) == 4
+            assert [r for r in exams if r[3] == restricted] == old_exams
+    finally:
+        server.shutdown()
+
+
+def test_failed_course_keeps_previous_rows():
+    check_failed_course_keeps_previous_rows(API.CanvasClient)
+    print("  ✅ A failing course keeps its old rows; the rest are written fresh")
+
+
+def test_failed_course_keeps_previous_rows_async():
+    if not async_api.available():
+        print("  ⏭️ httpx/aiohttp not installed, skipping the async engine")
+        return
+    check_failed_course_keeps_previous_rows(async_api.AsyncCanvasClient)
+    print("  ✅ The async engine carries failed courses forward too")
+
+
+def test_async_engine_falls_back_to_threads():
+    saved_clients, available = dict(API._clients), async_api.available
+    API._clients.clear()
+    async_api.available = lambda: False
+    try:
+        client = API.get_client("async")
+        assert type(client) is API.CanvasClient
+        assert API.get_client("threads") is client
+    finally:
+        async_api.available = available
+        API._clients.clear()
+        API._clients.update(saved_clients)
+    print("  ✅ Without httpx/aiohttp the async engine falls back to the threaded client")
+
+
+def test_invalid_rows_are_dropped():
+    server = fake_canvas.serve(courses=3, assignments=6)
+    try:
+        server.data.courses[0]["name"] = None
+        with tempfile.TemporaryDirectory() as d:
+            metrics, scores, exams = sync(server, d)
+            assert metrics["status"] == "ok"
+            assert metrics["skipped"]
+            assert {r[1] for r in scores if r[0] == "Total"} == {"Subject 002", "Subject 003"}
+            assert all(r[3] for r in exams)
+    finally:
+        server.shutdown()
+    print("  ✅ Rows failing validation are skipped without failing the sync")
+
+
+if __name__ == "__main__":
+    print("🔄 Testing partial syncs:")
+    test_failed_course_keeps_previous_rows()
+    test_failed_course_keeps_previous_rows_async()
+    test_async_engine_falls_back_to_threads()
+    test_invalid_rows_are_dropped()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the timezone search index
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from clockapp import SEARCH_CACHE_SIZE, TimezoneIndex
+
+ZONES = [
+    "America/Argentina/Buenos_Aires",
+    "America/New_York",
+    "Asia/Yerevan",
+    "Australia/Melbourne",
+    "Europe/London",
+    "Europe/Paris",
+    "UTC",
+    "Arctic/Longyearbyen",
+]
+
+
+def test_ranking():
+    index = TimezoneIndex(ZONES)
+    # Exact name, then name prefix
+    assert index.search("UTC") == ("UTC",)
+    assert index.search("europe") == ("Europe/London", "Europe/Paris")
+    # A component prefix ("York", "Aires") beats a plain substring hit
+    assert index.search("york") == ("America/New_York",)
+    assert index.search("ar") == (
+        "Arctic/Longyearbyen",               # name prefix
+        "America/Argentina/Buenos_Aires",    # component prefix
+        "Europe/Paris",                      # substring only
+    )
+    assert index.search("lon") == ("Arctic/Longyearbyen", "Europe/London")
+    # Ties keep alphabetical order
+    assert index.search("a")[:3] == ("America/Argentina/Buenos_Aires", "America/New_York", "Arctic/Longyearbyen")
+    print("  ✅ Exact beats prefix beats component prefix beats substring")
+
+
+def test_empty_and_garbage_queries():
+    index = TimezoneIndex(ZONES)
+    assert index.search("") == tuple(sorted(ZONES))
+    assert index.search("   ") == tuple(sorted(ZONES))
+    assert index.search("  LONDON ") == ("Europe/London",)
+    assert index.search("zzzz") == ()
+    assert index.search("!!/") == ()
+    assert index.search("é") == ()
+    assert index.search("europe/london/extra") == ()
+    print("  ✅ Empty queries list every zone; garbage matches nothing")
+
+
+def test_cache_is_bounded():
+    index = TimezoneIndex(ZONES)
+    for i in range(SEARCH_CACHE_SIZE * 2):
+        index.search(f"q{i}")
+    assert index._search.cache_info().currsize == SEARCH_CACHE_SIZE
+    assert index.search("paris") == ("Europe/Paris",)
+    print("  ✅ The query cache stays bounded")
+
+
+if __name__ == "__main__":
+    print("🌍 Testing the timezone index:")
+    test_ranking()
+    test_empty_and_garbage_queries()
+    test_cache_is_bounded()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the memory-mapped column reader
+"""
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from column_reader import MappedCSV, text
+from score_index import ScoreIndex, score_events, total_events
+
+
+def write(path, rows, newline="\r\n"):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f, lineterminator=newline).writerows(rows)
+
+
+def totals_by_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    return [e for e in score_events([r for r in rows[1:] if r], rows[0]) if e[0] == "T"]
+
+
+def test_plain_rows_are_views():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "study_scores.csv")
+        write(path, [["SAC", "Subject", "Score"], ["Total", "Maths", "81.5"],
+                     ["SAC 1", "Maths", "20"], [" Total ", "English", "70"]])
+        with MappedCSV(path) as data:
+            rows = list(data.scan(["Subject", "Score"], where={"SAC": "Total"}))
+            assert all(isinstance(v, memoryview) for row in rows for v in row)
+            assert [tuple(text(v) for v in row) for row in rows] == [("Maths", "81.5"), ("English", "70")]
+            assert list(data.scan(["Subject"], where={"Missing": "x"})) == []
+    print("  ✅ Total rows filtered without decoding, as memoryview slices")
+
+
+def test_matches_csv_module():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "study_scores.csv")
+        cases = [
+            [["SAC", "Subject", "Score"], ["Total", "Maths, Methods", "80"], ["Total", 'Say "hi"', "1"],
+             ["Total", "Line\nbreak", "2"], ["Total\xa0", "Physics", "3"], ["Totals", "Chem", "4"]],
+            [["Subject", "SAC", "Score", "SAC"], ["Maths", "SAC 1", "5", "Total"], ["English", "Total"],
+             [], ["Bio", "a\rTotal", "6"], ["Art", "Total", "7", ""]],
+        ]
+        for rows in cases:
+            for newline in ("\n", "\r\n"):
+                write(path, rows, newline)
+                assert total_events(path)[1] == totals_by_csv(path), (rows, newline)
+    print("  ✅ Quoted fields, blank lines and duplicate headers parse as csv.reader does")
+
+
+def test_index_defers_breakdown():
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "study_scores.csv")
+        write(path, [["SAC", "Subject", "Score", "Percentage"], ["Total", "Maths", "81.5", ""],
+                     ["SAC 1", "Maths", "20", "80%"]])
+        index = ScoreIndex(path)
+        assert index.current_score("Maths") == "81.5"
+        assert index._breakdown is None
+        assert [r.name for r in index.breakdown("Maths")] == ["SAC 1"]
+        assert index.subjects() == ["Maths"]
+    print("  ✅ Scores read from Total rows; SAC breakdown parsed on first use")
+
+
+if __name__ == "__main__":
+    print("🗺️ Testing the mapped column reader:")
+    test_plain_rows_are_views()
+    test_matches_csv_module()
+    test_index_defers_breakdown()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the chunked multi-process CSV loader
+"""
+import csv
+import math
+import os
+import random
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import csv_loader
+from score_index import ScoreIndex, score_events
+
+
+def write_exams(path, rows=3000):
+    rng = random.Random(7)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for i in range(rows):
+            name = rng.choice([f"SAC {i}", f'Essay, "draft" {i}', f"Multi\nline {i}"])
+            date = rng.choice(["2025-08-04", "2025-8-5", "bad-date", "2026-02-28"])
+            diff = rng.choice(["0.5", "nan", "x", "0.75"])
+            row = [name, date, diff, rng.choice(["English", "Physics", "Méthods"])]
+            writer.writerow(row if i % 97 else row[:3])
+
+
+def sequential_exams(path):
+    from datetime import datetime
+    exams = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) == 4:
+                name, date_str, diff, subject = row
+                try:
+                    day = datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+                    difficulty = float(diff)
+                    if math.isnan(difficulty):
+                        continue
+                    exams.append((name, day, difficulty, subject))
+                except ValueError:
+                    continue
+    return exams
+
+
+def test_chunks_end_on_row_boundaries():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "exams.csv")
+        write_exams(path)
+        chunks = csv_loader.split_chunks(path, 16)
+        assert len(chunks) > 1
+        assert chunks[0][0] == 0 and chunks[-1][1] == os.path.getsize(path)
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+        with open(path, 'rb') as f:
+            data = f.read()
+        for start, _ in chunks[1:]:
+            # Never inside a quoted field: an even number of quotes precedes each boundary
+            assert data[start - 1:start] == b"\n" and data[:start].count(b'"') % 2 == 0
+    print("  ✅ Chunks split on row boundaries outside quoted fields")
+
+
+def test_parallel_matches_sequential():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "exams.csv")
+        write_exams(path)
+        expected = sequential_exams(path)
+        parallel = csv_loader.parse_file(path, csv_loader.exam_rows, workers=4, large_file=0)
+        assert parallel == expected and csv_loader.load_exam_rows(path) == expected
+
+        scores = os.path.join(tmp, "study_scores.csv")
+        with open(scores, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(["SAC", "Subject", "Score"])
+            for i in range(3000):
+                writer.writerow(["Total" if i % 10 == 0 else "Assessed Coursework",
+                                 f"Subject {i % 13}" if i % 10 == 0 else f"SAC {i}",
+                                 ["85", "", "n/a", "40.5"][i % 4]])
+        with open(scores, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        events = csv_loader.parse_file(scores, score_events, has_header=True, workers=4, large_file=0)
+        assert events == score_events(rows[1:], rows[0])
+
+        index = ScoreIndex(scores)
+        parallel_index = ScoreIndex(scores)
+        parallel_index._fold(events)
+        assert index.subjects() == parallel_index._subjects
+        assert index.current_score("Subject 0") == parallel_index._totals.get("Subject 0", "No data")
+
+        difficulty = os.path.join(tmp, "difficulty.csv")
+        with open(difficulty, 'w', newline='', encoding='utf-8') as f:
+            f.write("Subject,tests_taken,mean_score,planned_tests,difficulty\n")
+            for i in range(2000):
+                f.write(f"Subject {i % 50},2,80,7,{['0.5', 'nan', '', '1.25'][i % 4]}\n\n")
+        expected = {}
+        with open(difficulty, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                try:
+                    value = float(row.get('difficulty'))
+                    if not math.isnan(value):
+                        expected[row.get('Subject')] = value
+                except (TypeError, ValueError):
+                    continue
+        assert dict(csv_loader.parse_file(difficulty, csv_loader.difficulty_rows, has_header=True,
+                                          workers=4, large_file=0)) == expected
+    print("  ✅ Parallel parsing identical to sequential parsing")
+
+
+if __name__ == "__main__":
+    print("📋 Testing chunked CSV loader:")
+    test_chunks_end_on_row_boundaries()
+    test_parallel_matches_sequential()
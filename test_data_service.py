@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared data service
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import persistence
+from data_service import DataService, read_rows, read_subjects, read_target_scores
+
+parses = []
+
+
+def counting_parser(path):
+    parses.append(path)
+    return persistence.read_snapshot(path)[1]
+
+
+def test_parsed_once_per_version():
+    service = DataService()
+    try:
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "difficulty.csv")
+            service.write(path, [["Maths", 0.4]], header=["Subject", "difficulty"])
+            parses.clear()
+            first = service.load(path, counting_parser)
+            assert service.load(path, counting_parser) is first
+            assert len(parses) == 1
+            service.write(path, [["Maths", 0.6]], header=["Subject", "difficulty"])
+            assert service.load(path, counting_parser)[1] == ["Maths", "0.6"]
+            assert len(parses) == 2
+            # A coalesced write is served once it lands; loading doesn't flush it early
+            service.write(path, [["Maths", 0.8]], header=["Subject", "difficulty"], coalesce=True)
+            assert service.load(path, read_rows)[1] == ["Maths", "0.6"]
+            assert persistence.is_pending(path)
+            persistence.flush(path)
+            assert service.load(path, read_rows)[1] == ["Maths", "0.8"]
+    finally:
+        service.close()
+    print("  ✅ Each file version is parsed once and shared")
+
+
+def test_writes_are_pushed_to_subscribers():
+    service = DataService()
+    try:
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "studytime.csv")
+            seen = []
+            service.subscribe(path, seen.append)
+            service.append(path, [["Timestamp", "Duration"], ["2025-08-04 10:00:00", "0:30:00"]])
+            service.write(path, [["2025-08-04 11:00:00", "0:10:00"]])
+            assert seen == [os.path.abspath(path)] * 2
+            service.check()
+            assert len(seen) == 2  # nothing changed since the last notification
+
+            # A write from outside persistence (e.g. another process) is found by check()
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write("2025-08-05 09:00:00,1:00:00\n")
+            service.check()
+            assert len(seen) == 3
+
+            service.unsubscribe(path, seen.append)
+            service.write(path, [])
+            assert len(seen) == 3
+    finally:
+        service.close()
+    print("  ✅ Writes and external changes reach subscribers without polling")
+
+
+def test_shared_parsers():
+    with tempfile.TemporaryDirectory() as d:
+        subjects = os.path.join(d, "selected_subjects.csv")
+        persistence.write_rows(subjects, [["English", "Physics"], []])
+        assert read_subjects(subjects) == ["English", "Physics"]
+        targets = os.path.join(d, "target_scores.csv")
+        persistence.write_rows(targets, [["English", "40"], ["Physics", "60"], ["Maths", "nan"]],
+                               header=["Subject", "Target_Score"])
+        assert read_target_scores(targets) == {"English": 40.0}
+    print("  ✅ Subjects and target scores parse as the tools did")
+
+
+if __name__ == "__main__":
+    print("🗄️ Testing the data service:")
+    test_parsed_once_per_version()
+    test_writes_are_pushed_to_subscribers()
+    test_shared_parsers()
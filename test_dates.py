@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared date parsing helpers
+"""
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import dates
+
+
+def test_matches_strptime():
+    for text in ["2025-08-04", "2024-02-29", "2025-8-4", "2025-02-30", "04/08/2025", "", "2025-08-04 "]:
+        try:
+            expected = datetime.strptime(text, "%Y-%m-%d").date()
+        except ValueError:
+            expected = ValueError
+        try:
+            actual = dates.parse_date(text)
+        except ValueError:
+            actual = ValueError
+        assert actual == expected, text
+    assert dates.parse_day("2025-08-04") == date(2025, 8, 4).toordinal()
+    print("  ✅ Cached parsing accepts exactly what strptime did")
+
+
+def test_canvas_timestamps():
+    assert dates.parse_canvas_date("2025-08-04T13:59:59Z") == date(2025, 8, 4)
+    assert dates.parse_canvas_date("2025-08-04T23:30:00+10:00") == date(2025, 8, 4)
+    dates.parse_canvas_date("2025-08-04T13:59:59Z")
+    assert dates.parse_canvas_date.cache_info().hits >= 1
+    print("  ✅ Canvas timestamps parsed and cached")
+
+
+if __name__ == "__main__":
+    print("📅 Testing date parsing:")
+    test_matches_strptime()
+    test_canvas_timestamps()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for the exam store's upserts and reload deltas
+"""
+import os
+import sys
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from exam_store import ExamRecord, ExamStore, exam_key
+
+DAY = date(2025, 8, 20).toordinal()
+
+
+def test_duplicate_rows_collapse():
+    store = ExamStore()
+    delta = store.replace_all([
+        ExamRecord("SAC 1", DAY, 0.4, "Physics"),
+        ExamRecord("SAC 1", DAY, 0.6, "Physics"),
+    ])
+    assert len(store) == 1
+    assert store.values()[0].difficulty == 0.6  # the last row wins
+    assert delta.added == [("Physics", "SAC 1", DAY)]
+    assert store.subject_counts() == {"Physics": 1}
+    print("  ✅ Rows sharing (subject, name, date) collapse to one exam")
+
+
+def test_changed_vs_moved():
+    store = ExamStore()
+    store.replace_all([ExamRecord("SAC 1", DAY, 0.4, "Physics"), ExamRecord("SAC 2", DAY, 0.5, "Physics")])
+
+    # Same key, new difficulty: an update in place
+    delta = store.replace_all([ExamRecord("SAC 1", DAY, 0.7, "Physics"), ExamRecord("SAC 2", DAY, 0.5, "Physics")])
+    assert delta.changed == [("Physics", "SAC 1", DAY)]
+    assert not delta.added and not delta.removed
+    assert delta.subjects == {"Physics"}
+
+    # A new date is a new key: the old exam is removed and the moved one added
+    moved = ExamRecord("SAC 2", DAY + 3, 0.5, "Physics")
+    delta = store.replace_all([ExamRecord("SAC 1", DAY, 0.7, "Physics"), moved])
+    assert delta.added == [exam_key(moved)]
+    assert delta.removed == [("Physics", "SAC 2", DAY)]
+    assert not delta.changed
+    assert len(store) == 2
+    print("  ✅ A changed exam updates in place; a moved exam is removed and re-added")
+
+
+def test_unchanged_reload_is_empty():
+    exams = [ExamRecord("SAC 1", DAY, 0.4, "Physics"), ExamRecord("Essay", DAY + 1, 0.3, "English")]
+    store = ExamStore()
+    assert store.replace_all(exams)
+    delta = store.replace_all([ExamRecord(e.name, e.day, e.difficulty, e.subject) for e in exams])
+    assert not delta
+    assert not delta.subjects
+    assert store.values() == exams
+    print("  ✅ Reloading the same exams gives an empty delta")
+
+
+def test_subject_counts():
+    store = ExamStore()
+    store.replace_all([
+        ExamRecord("SAC 1", DAY, 0.4, "Physics"),
+        ExamRecord("SAC 2", DAY + 7, 0.4, "Physics"),
+        ExamRecord("Essay", DAY, 0.3, "English"),
+    ])
+    assert store.subject_counts() == {"Physics": 2, "English": 1}
+    store.replace_all([ExamRecord("SAC 2", DAY + 7, 0.4, "Physics")])
+    assert store.subject_counts() == {"Physics": 1}
+    store.clear()
+    assert store.subject_counts() == {} and len(store) == 0
+    print("  ✅ Subject counts follow adds and removes")
+
+
+if __name__ == "__main__":
+    print("🗂️ Testing the exam store:")
+    test_duplicate_rows_collapse()
+    test_changed_vs_moved()
+    test_unchanged_reload_is_empty()
+    test_subject_counts()
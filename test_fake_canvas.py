@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline fake Canvas server
+"""
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import fake_canvas
+
+
+def get(url, token="test"):
+    request = urllib.request.Request(url)
+    if token:
+        request.add_header("Authorization", f"Bearer {token}")
+    with urllib.request.urlopen(request) as resp:
+        return json.loads(resp.read()), resp.headers
+
+
+def test_pagination_and_endpoints():
+    server = fake_canvas.serve(courses=25, assignments=6)
+    try:
+        courses, url = [], f"{server.base_url}/courses?per_page=10"
+        pages = 0
+        while url:
+            page, headers = get(url)
+            courses.extend(page)
+            pages += 1
+            link = headers.get("Link", "")
+            url = link[1:link.index(">")] if 'rel="next"' in link else None
+        assert pages == 3 and len(courses) == 25
+        assert len({c["id"] for c in courses}) == 25
+        assert "computed_current_score" not in courses[0]["enrollments"][0]
+
+        bulk, _ = get(f"{server.base_url}/courses?include[]=total_scores")
+        assert "computed_current_score" in bulk[0]["enrollments"][0]
+
+        course_id = courses[0]["id"]
+        enrollments, headers = get(f"{server.base_url}/courses/{course_id}/enrollments")
+        assert "current_score" in enrollments[0]["grades"]
+        assert "X-Rate-Limit-Remaining" in headers
+
+        groups, _ = get(f"{server.base_url}/courses/{course_id}/assignment_groups?include[]=assignments")
+        assert sum(len(g["assignments"]) for g in groups) == 6
+    finally:
+        server.shutdown()
+    print("  ✅ Paginated courses, enrollments and assignment groups served")
+
+
+def test_auth_rate_limit_and_errors():
+    server = fake_canvas.serve(courses=2, rate_limit=3, burst=3)
+    try:
+        try:
+            get(f"{server.base_url}/courses", token=None)
+            assert False, "expected 401"
+        except urllib.error.HTTPError as e:
+            assert e.code == 401
+
+        codes = []
+        for _ in range(6):
+            try:
+                get(f"{server.base_url}/courses")
+                codes.append(200)
+            except urllib.error.HTTPError as e:
+                codes.append(e.code)
+                assert e.headers["Retry-After"] == "1"
+        assert codes[:3] == [200, 200, 200] and 429 in codes
+    finally:
+        server.shutdown()
+
+    server = fake_canvas.serve(courses=2, error_rate=1.0)
+    try:
+        try:
+            get(f"{server.base_url}/courses")
+            assert False, "expected 500"
+        except urllib.error.HTTPError as e:
+            assert e.code == 500
+    finally:
+        server.shutdown()
+    print("  ✅ Auth, 429 rate limiting and injected errors working")
+
+
+if __name__ == "__main__":
+    print("📋 Testing fake Canvas server:")
+    test_pagination_and_endpoints()
+    test_auth_rate_limit_and_errors()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the multi-account sync runner
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import API
+import fake_canvas
+from multi_sync import Account, account_dir, load_accounts, run
+
+
+def test_load_accounts():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "accounts.csv")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("name,token,api_url\n"
+                    "Alice Smith,tok-a,\n"
+                    "Bob,tok-b,http://127.0.0.1:8765/api/v1\n"
+                    "No Token,,\n")
+        accounts = load_accounts(path)
+        assert [a.name for a in accounts] == ["Alice Smith", "Bob"]
+        assert accounts[0].api_url is None
+        assert accounts[1].api_url == "http://127.0.0.1:8765/api/v1"
+        assert "tok-a" not in repr(accounts[0])
+
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("Alice/Smith,tok-c,\n")
+        try:
+            load_accounts(path)
+            assert False, "expected a duplicate name error"
+        except ValueError:
+            pass
+    print("  ✅ Accounts file loading working")
+
+
+def test_account_dir():
+    assert account_dir("out", "Alice Smith") == os.path.join("out", "Alice_Smith")
+    assert account_dir("out", "../../etc") == os.path.join("out", "etc")
+    assert account_dir("out", "...") == os.path.join("out", "account")
+    print("  ✅ Per-student directories are filesystem safe")
+
+
+def test_run_against_fake_canvas():
+    server = fake_canvas.serve(courses=3, assignments=4, rate_limit=1000)
+    clients = []
+    original_init = API.CanvasClient.__init__
+
+    def recording_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        clients.append(self)
+
+    API.CanvasClient.__init__ = recording_init
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            accounts = [Account("Alice", "tok-a", server.base_url), Account("Bob", "tok-b", server.base_url)]
+            report = run(accounts, tmp, parallel=2)
+            assert report["ok"] == 2, report
+            for account in accounts:
+                directory = account_dir(tmp, account.name)
+                assert sorted(os.listdir(directory)) == ["exams.csv", "study_scores.csv"]
+            assert os.path.exists(os.path.join(tmp, "sync_report.json"))
+    finally:
+        API.CanvasClient.__init__ = original_init
+        server.shutdown()
+    # One limiter and one cookie jar per token, one connection pool for all
+    assert len(clients) == 2
+    assert clients[0].limiter is not clients[1].limiter
+    assert clients[0].session is not clients[1].session
+    assert clients[0].session.cookies is not clients[1].session.cookies
+    assert clients[0].session.get_adapter("http://") is clients[1].session.get_adapter("http://")
+    assert set(server.buckets) == {"Bearer tok-a", "Bearer tok-b"}
+    print("  ✅ Each account syncs into its own directory with its own limiter and session")
+
+
+if __name__ == "__main__":
+    print("📋 Testing multi-account sync:")
+    test_load_accounts()
+    test_account_dir()
+    test_run_against_fake_canvas()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the timing spans, counters and trace export
+"""
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import perf
+
+
+def test_disabled_records_nothing():
+    perf.disable()
+    perf.reset()
+
+    @perf.timed("work")
+    def work():
+        return 42
+
+    assert work() == 42
+    with perf.span("block"):
+        pass
+    perf.incr("calls")
+    assert perf.snapshot() == {"spans": {}, "counters": {}}
+    print("  ✅ Disabled instrumentation records nothing")
+
+
+def test_spans_counters_and_trace():
+    perf.reset()
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_path = os.path.join(tmp, "trace.jsonl")
+        perf.enable(trace_path)
+        try:
+            @perf.timed()
+            def work():
+                return "done"
+
+            assert work() == "done"
+            assert work() == "done"
+            with perf.span("block"):
+                pass
+            perf.incr("calls", 3)
+        finally:
+            perf.disable()
+
+        stats = perf.snapshot()
+        assert stats["spans"]["work"]["count"] == 2
+        assert stats["spans"]["block"]["count"] == 1
+        assert stats["counters"] == {"calls": 3}
+
+        with open(trace_path, encoding='utf-8') as f:
+            events = [json.loads(line) for line in f]
+        assert [e["name"] for e in events] == ["work", "work", "block"]
+        assert all(e["ms"] >= 0 for e in events)
+    perf.reset()
+    print("  ✅ Spans, counters and JSONL trace working")
+
+
+if __name__ == "__main__":
+    print("📋 Testing performance instrumentation:")
+    test_disabled_records_nothing()
+    test_spans_counters_and_trace()
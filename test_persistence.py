@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared CSV persistence layer
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import persistence
+
+
+def test_atomic_write_and_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "programs", "scores.csv")
+        persistence.write_rows(path, [["Total", "English", 85.0]], header=["SAC", "Subject", "Score"])
+        version, rows = persistence.read_snapshot(path)
+        assert rows == [["SAC", "Subject", "Score"], ["Total", "English", "85.0"]]
+        assert version == persistence.snapshot_version(path)
+
+        persistence.write_rows(path, [], header=["SAC", "Subject", "Score"])
+        assert persistence.snapshot_version(path) != version
+        # No temp files are left behind next to the target
+        assert os.listdir(os.path.dirname(path)) == ["scores.csv"]
+    print("  ✅ Atomic write and snapshot working")
+
+
+def test_coalesced_writes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "targets.csv")
+        for score in range(5):
+            persistence.write_rows(path, [["English", score]], header=["Subject", "Target_Score"], coalesce=True)
+        # Nothing on disk yet, but this process reads its own pending write
+        assert not os.path.exists(path)
+        assert persistence.read_snapshot(path)[1][-1] == ["English", "4"]
+
+        persistence.flush(path)
+        assert persistence.read_snapshot(path)[1] == [["Subject", "Target_Score"], ["English", "4"]]
+
+        # Every pending write gets a fresh version, even if its rows reuse a freed list's address
+        versions = set()
+        for score in range(50):
+            persistence.write_rows(path, [["English", score]], coalesce=True)
+            versions.add(persistence.read_snapshot(path)[0])
+            persistence.flush(path)
+        assert len(versions) == 50
+
+        persistence.write_rows(path, [["English", 9]], coalesce=True)
+        time.sleep(persistence.COALESCE_WINDOW * 4)
+        assert persistence.read_snapshot(path)[1] == [["English", "9"]]
+    print("  ✅ Coalesced writes working")
+
+
+def test_stream_writer():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scores.csv")
+        persistence.write_rows(path, [["Total", "English", 85.0]], header=["SAC", "Subject", "Score"])
+        version = persistence.snapshot_version(path)
+
+        # A failure part-way leaves the old file in place and no temp file behind
+        try:
+            with persistence.CSVStreamWriter(path, ["SAC", "Subject", "Score"], (str, str, float)) as out:
+                out.writerow(["Total", "Maths", 70])
+                out.writerow(["Total", "Physics", "not a number"])
+            assert False, "expected a schema error"
+        except persistence.SchemaError:
+            pass
+        assert persistence.snapshot_version(path) == version
+        assert os.listdir(tmp) == ["scores.csv"]
+
+        with persistence.CSVStreamWriter(path, ["SAC", "Subject", "Score"], (str, str, float)) as out:
+            out.writerows([["Total", "Maths", 70], ["SAC 1", "Essay", 18.5]])
+        assert out.committed and out.rows_written == 2
+        assert persistence.read_snapshot(path)[1] == [
+            ["SAC", "Subject", "Score"], ["Total", "Maths", "70"], ["SAC 1", "Essay", "18.5"]
+        ]
+
+        with persistence.CSVStreamWriter(path, ["SAC", "Subject", "Score"], (str, str, float),
+                                         skip_invalid=True) as out:
+            assert out.writerow(["Total", "Maths", 71])
+            assert not out.writerow(["Total", "Physics", "not a number"])
+        assert out.rows_written == 1 and len(out.skipped) == 1
+        assert persistence.read_snapshot(path)[1][1:] == [["Total", "Maths", "71"]]
+
+        with persistence.CSVStreamWriter(path) as out:
+            out.writerow(["ignored"])
+            out.abort()
+        assert not out.committed
+        assert persistence.read_snapshot(path)[1][1] == ["Total", "Maths", "71"]
+    print("  ✅ Streaming writer validation and atomic swap working")
+
+
+if __name__ == "__main__":
+    print("💾 Testing persistence layer:")
+    test_atomic_write_and_snapshot()
+    test_coalesced_writes()
+    test_stream_writer()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the maintained exam priority/date index
+"""
+import os
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from priority_index import PriorityIndex
+
+
+def test_ranking_and_date_range():
+    index = PriorityIndex()
+    index.upsert("a", "SAC 1", 0.4, datetime(2025, 8, 10))
+    index.upsert("b", "SAC 2", 0.9, datetime(2025, 8, 4))
+    index.upsert("c", "SAC 3", 0.4, datetime(2025, 8, 20))
+    index.upsert("d", "SAC 4", float('inf'), datetime(2025, 8, 1))
+
+    # Ties keep insertion order, like the stable sort this replaces
+    assert index.ranked() == [(float('inf'), "SAC 4"), (0.9, "SAC 2"), (0.4, "SAC 1"), (0.4, "SAC 3")]
+    assert index.top(2) == [(float('inf'), "SAC 4"), (0.9, "SAC 2")]
+    assert index.date_range(datetime(2025, 8, 4), datetime(2025, 8, 20)) == ["SAC 2", "SAC 1"]
+    print("  ✅ Ranking and date range queries working")
+
+
+def test_update_and_remove():
+    index = PriorityIndex()
+    index.upsert("a", "SAC 1", 0.2, datetime(2025, 8, 10))
+    index.upsert("b", "SAC 2", 0.5, datetime(2025, 8, 4))
+    index.upsert("a", "SAC 1", 0.8, datetime(2025, 8, 2))
+    index.upsert("a", "SAC 1", 0.2, datetime(2025, 8, 10))
+    index.upsert("a", "SAC 1", 0.8, datetime(2025, 8, 2))
+    assert index.ranked() == [(0.8, "SAC 1"), (0.5, "SAC 2")]
+    assert index.date_range() == ["SAC 1", "SAC 2"]
+
+    index.remove("a")
+    assert index.ranked() == [(0.5, "SAC 2")]
+    assert index.date_range() == ["SAC 2"]
+    assert len(index) == 1
+    print("  ✅ Updates and removals working")
+
+
+if __name__ == "__main__":
+    print("📋 Testing priority index:")
+    test_ranking_and_date_range()
+    test_update_and_remove()
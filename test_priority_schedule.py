@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the priority re-rank timer
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from priority_schedule import next_change, next_change_delay_ms
+
+EXAM = datetime(2025, 8, 20)  # exams are due at midnight
+
+
+def test_crossing_midnight():
+    now = datetime(2025, 8, 18, 22, 30)
+    assert (EXAM - now).days == 1
+    assert next_change(EXAM, now) == datetime(2025, 8, 19)
+    delay = next_change_delay_ms([EXAM], now)
+    assert delay == 90 * 60 * 1000 + 1
+    # When the timer fires the day count has rolled over
+    assert (EXAM - (now + timedelta(milliseconds=delay))).days == 0
+    print("  ✅ The timer fires just after the exam's day count drops at midnight")
+
+
+def test_rollover_margin():
+    now = datetime(2025, 8, 18, 22, 30, 0, 500)
+    delay = next_change_delay_ms([EXAM], now)
+    # 5399999.5 ms away: rounded up, plus 1 ms
+    assert delay == 5400001
+    fired = now + timedelta(milliseconds=delay)
+    assert (EXAM - fired).days == 0
+    # Without the margin the timer could land exactly on the boundary, still a day out
+    assert (EXAM - datetime(2025, 8, 19)).days == 1
+    print("  ✅ The delay is rounded up with a 1 ms margin past the rollover")
+
+
+def test_earliest_exam_wins():
+    now = datetime(2025, 8, 10, 12, 0)
+    later = datetime(2025, 9, 1)
+    overdue = datetime(2025, 8, 1)
+    assert next_change_delay_ms([later, EXAM, overdue], now) == 12 * 3600 * 1000 + 1
+    print("  ✅ The next change is the earliest over all exams")
+
+
+def test_no_upcoming_changes():
+    now = datetime(2025, 8, 19, 12, 0)
+    assert next_change_delay_ms([], now) is None
+    # Already due (less than a day left) or overdue: nothing left to re-rank
+    assert next_change(EXAM, now) is None
+    assert next_change_delay_ms([EXAM, datetime(2025, 8, 1)], now) is None
+    print("  ✅ No timer when no exam's day count will change")
+
+
+if __name__ == "__main__":
+    print("⏰ Testing the priority schedule:")
+    test_crossing_midnight()
+    test_rollover_margin()
+    test_earliest_exam_wins()
+    test_no_upcoming_changes()
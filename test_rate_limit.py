@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the adaptive Canvas request limiter and retry backoff
+"""
+import os
+import random
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from rate_limit import AdaptiveLimiter, backoff_delay, is_throttled, parse_remaining
+
+
+def test_aimd_limit():
+    limiter = AdaptiveLimiter(initial=4, min_limit=1, max_limit=8, low_water=100)
+    for _ in range(50):
+        limiter.on_success(remaining=500)
+    assert limiter.limit == 8
+
+    limiter.on_throttle()
+    assert limiter.limit == 4 and limiter.throttles == 1
+    limiter.on_success(remaining=50)  # low quota is back-pressure too
+    assert limiter.limit == 2
+    for _ in range(5):
+        limiter.on_throttle()
+    assert limiter.limit == 1
+    print("  ✅ Additive increase / multiplicative decrease working")
+
+
+def test_backoff_and_headers():
+    rng = random.Random(1)
+    for attempt in range(8):
+        delay = backoff_delay(attempt, base=0.5, cap=4, rng=rng)
+        assert 0 <= delay <= min(4, 0.5 * 2 ** attempt)
+    assert backoff_delay(0, retry_after="3", rng=rng) >= 3
+
+    assert is_throttled(429)
+    assert is_throttled(403, '{"errors": "403 Forbidden (Rate Limit Exceeded)"}')
+    assert not is_throttled(403, "Unauthorized")
+    assert parse_remaining({"X-Rate-Limit-Remaining": "612.5"}) == 612.5
+    assert parse_remaining({}) is None
+    print("  ✅ Jittered backoff and rate limit headers working")
+
+
+if __name__ == "__main__":
+    print("📋 Testing rate limiting:")
+    test_aimd_limit()
+    test_backoff_and_headers()
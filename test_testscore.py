@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming subject difficulty aggregator
+"""
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# NaN, blank and non-numeric scores, a blank subject and a subject left with no valid scores
+SCORES = """SAC,Subject,Score
+Total,Biology,80
+SAC 1,Biology,72
+SAC 2,Biology,
+SAC 3,Biology,nan
+SAC 4,Biology,abs
+Total,Physics,65
+SAC 1,Physics,NaN
+SAC 2,Physics,88
+SAC 3,Physics,90
+SAC 1,,50
+SAC 1,Chemistry,N/A
+SAC 1,Chemistry,
+Total,Maths,55
+"""
+
+EXPECTED = [
+    ("Biology", 2, 76.0, 7, 0.84),
+    ("Maths", 1, 55.0, 7, 3.15),
+    ("Physics", 3, 81.0, 7, 0.4433),
+]
+
+
+def pandas_difficulty(scores_file):
+    """The pandas groupby that aggregate_difficulty replaced."""
+    from testscore import DEFAULT_TOTAL_TESTS, PLANNED_TESTS
+    df = pd.read_csv(scores_file)
+    df = df.dropna(subset=['Score'])
+    df['Score'] = pd.to_numeric(df['Score'], errors='coerce')
+    df = df.dropna(subset=['Score'])
+    res = []
+    for subj, g in df.groupby('Subject'):
+        n = g.shape[0]
+        m = g['Score'].mean()
+        planned = PLANNED_TESTS.get(subj, DEFAULT_TOTAL_TESTS)
+        factor = planned / n if n > 0 else 1
+        diff = round((1 - m/100) * factor, 4)
+        res.append((subj, n, round(m, 2), planned, diff))
+    return res
+
+
+def test_aggregate_difficulty_matches_groupby():
+    # testscore pulls in tkinter and matplotlib
+    from testscore import aggregate_difficulty
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "study_scores.csv")
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(SCORES)
+        rows = aggregate_difficulty(path)
+        assert rows == EXPECTED
+        if pd is not None:
+            expected = [(subj, int(n), float(m), planned, float(diff))
+                        for subj, n, m, planned, diff in pandas_difficulty(path)]
+            assert rows == expected
+    print("  ✅ Difficulty rows match the old pandas groupby")
+
+
+if __name__ == "__main__":
+    print("📊 Testing the difficulty aggregator:")
+    test_aggregate_difficulty_matches_groupby()
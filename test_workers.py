@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared background executor
+"""
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from workers import BackgroundExecutor, JobCancelled, JobTimeout
+
+
+def test_single_flight_joins_running_job():
+    executor = BackgroundExecutor()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def slow_sync(cancel_event=None):
+        calls.append(1)
+        release.wait(2)
+        return "synced"
+
+    first = executor.submit("sync", slow_sync, on_success=results.append)
+    second = executor.submit("sync", slow_sync, on_success=results.append)
+    assert first is second
+    release.set()
+    first.future.result(2)
+    assert calls == [1]
+    assert results == ["synced", "synced"]
+    executor.shutdown()
+    print("  ✅ Single-flight deduplication working")
+
+
+def test_cancel_and_timeout():
+    executor = BackgroundExecutor()
+    errors = []
+
+    def wait_for_cancel(cancel_event=None):
+        cancel_event.wait(2)
+
+    job = executor.submit("a", wait_for_cancel, on_error=errors.append)
+    job.cancel()
+    job.future.result(2)
+    assert isinstance(errors[0], JobCancelled)
+
+    job = executor.submit("b", wait_for_cancel, timeout=0.05, on_error=errors.append)
+    job.future.result(2)
+    assert isinstance(errors[1], JobTimeout)
+    assert not executor.running("b")
+    executor.shutdown()
+    print("  ✅ Cancellation and timeouts working")
+
+
+if __name__ == "__main__":
+    print("🧵 Testing background executor:")
+    test_single_flight_joins_running_job()
+    test_cancel_and_timeout()
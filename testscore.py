@@ -1,22 +1,63 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import csv
+import math
 import os
 from collections import defaultdict
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
-import importlib.util
 
-# Use os.path.join for cross-platform file paths
-SUBJECTS_FILE = os.path.join("programs", "selected_subjects.csv")
-SCORES_FILE = os.path.join("programs", "study_scores.csv")
+from data_service import DIFFICULTY_FILE, EXAMS_FILE, SCORES_FILE, SUBJECTS_FILE, get_service, read_rows, read_subjects
+from workers import API_REFRESH_KEY, API_REFRESH_TIMEOUT, JobCancelled, get_executor
+
 DEFAULT_TOTAL_TESTS = 7
 PLANNED_TESTS = {
     # 'Biology': 6,
 }
 NUM_SACS = 6
-DIFFICULTY_FILE = os.path.join("programs", "difficulty.csv")
+DIFFICULTY_HEADER = ['Subject', 'tests_taken', 'mean_score', 'planned_tests', 'difficulty']
+
+def aggregate_difficulty(scores_file=SCORES_FILE):
+    """
+    Stream the scores file once, keeping only a running (count, sum) per subject,
+    and return one difficulty row per subject sorted by subject name.
+    """
+    totals = {}  # subject -> [count, sum]
+    with open(scores_file, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            subj = (row.get('Subject') or '').strip()
+            score = (row.get('Score') or '').strip()
+            if not subj or not score:
+                continue
+            try:
+                val = float(score)
+            except ValueError:
+                continue
+            if math.isnan(val):
+                continue
+            acc = totals.get(subj)
+            if acc is None:
+                totals[subj] = [1, val]
+            else:
+                acc[0] += 1
+                acc[1] += val
+
+    res = []
+    for subj in sorted(totals):
+        n, total = totals[subj]
+        m = total / n
+        planned = PLANNED_TESTS.get(subj, DEFAULT_TOTAL_TESTS)
+        factor = planned / n if n > 0 else 1
+        diff = round((1 - m/100) * factor, 4)
+        res.append((subj, n, round(m, 2), planned, diff))
+    return res
+
+def write_difficulty(rows, difficulty_file=DIFFICULTY_FILE):
+    # Derived from the scores file and redone on every change to it (a save is
+    # followed by its own change notification, a sync may write it again), so
+    # a burst of these is coalesced into one write
+    get_service().write(difficulty_file, rows, header=DIFFICULTY_HEADER, coalesce=True)
 
 class StudyScoreApp:
     def __init__(self, root):
@@ -27,19 +68,18 @@ class StudyScoreApp:
 
         self.create_widgets()
         self.load_existing_scores()
+        # Refill the entries whenever the scores file is rewritten (e.g. by an API sync)
+        get_service().subscribe(SCORES_FILE, self.on_scores_changed, tk_widget=self.root)
 
     def load_subjects(self):
         subjects = []
         if os.path.exists(SUBJECTS_FILE):
             try:
-                with open(SUBJECTS_FILE, newline='', encoding='utf-8') as f:
-                    reader = csv.reader(f)
-                    for row in reader:
-                        subjects.extend(row)
+                subjects.extend(get_service().load(SUBJECTS_FILE, read_subjects))
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load subjects: {e}")
+                messagebox.showerror("Error", f"Failed to load subjects: {e}", parent=self.root)
         else:
-            messagebox.showwarning("Warning", f"{SUBJECTS_FILE} not found.")
+            messagebox.showwarning("Warning", f"{SUBJECTS_FILE} not found.", parent=self.root)
         return sorted(set(subjects))
 
     def create_widgets(self):
@@ -69,22 +109,46 @@ class StudyScoreApp:
         summary_btn = ttk.Button(btn_frame, text="Show Summary", command=self.display_summary)
         summary_btn.grid(row=0, column=1, padx=5)
         # Add API fetch button
-        fetch_btn = ttk.Button(btn_frame, text="Fetch from API", command=self.fetch_from_api)
-        fetch_btn.grid(row=0, column=2, padx=5)
+        self.fetch_btn = ttk.Button(btn_frame, text="Fetch from API", command=self.fetch_from_api)
+        self.fetch_btn.grid(row=0, column=2, padx=5)
 
     def fetch_from_api(self):
-        # Dynamically import API.py and call fetch_and_save_scores
-        try:
-            api_path = os.path.join(os.path.dirname(__file__), "API.py")
-            spec = importlib.util.spec_from_file_location("API", api_path)
-            api = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(api)
-            api.fetch_and_save_scores(SCORES_FILE)
-            messagebox.showinfo("Success", "Fetched data from API and updated scores.")
-            self.load_existing_scores()
-            self.display_summary()
-        except Exception as e:
-            messagebox.showerror("API Error", f"Failed to fetch from API: {e}")
+        # Fetch in the background; results come back on the Tk thread. Shares the
+        # main window's job key, so a sync already running there is joined
+        self.fetch_btn.config(state='disabled')
+        get_executor().submit(
+            API_REFRESH_KEY,
+            self._fetch_scores,
+            timeout=API_REFRESH_TIMEOUT,
+            tk_widget=self.root,
+            on_success=self._on_fetch_done,
+            on_error=self._on_fetch_failed
+        )
+
+    def _fetch_scores(self, cancel_event=None):
+        # API.py is imported once and its client (HTTP session, caches) reused
+        import API
+        # Same files as the main window's sync, so whichever window starts it serves both
+        return API.get_client().refresh(SCORES_FILE, EXAMS_FILE, cancel_event=cancel_event)
+
+    def _on_fetch_done(self, metrics):
+        import API
+        self.fetch_btn.config(state='normal')
+        warning = API.sync_warning(metrics)
+        if warning:
+            messagebox.showwarning("Sync Incomplete", warning, parent=self.root)
+        else:
+            messagebox.showinfo("Success", "Fetched data from API and updated scores.", parent=self.root)
+        # The entries were refilled by on_scores_changed when the sync wrote the file
+        self.display_summary()
+
+    def _on_fetch_failed(self, e):
+        self.fetch_btn.config(state='normal')
+        if isinstance(e, JobCancelled):
+            import API
+            messagebox.showwarning("Sync Incomplete", f"{API.sync_warning({'status': 'cancelled'})}\n({e})", parent=self.root)
+            return
+        messagebox.showerror("API Error", f"Failed to fetch from API: {e}", parent=self.root)
 
     def build_tab(self, parent, sac_index):
         frame = ttk.LabelFrame(parent, text=f"Enter Scores for SAC {sac_index}")
@@ -102,20 +166,19 @@ class StudyScoreApp:
 
     def save_scores(self):
         try:
-            with open(SCORES_FILE, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["SAC", "Subject", "Score"])
-                for (sac, subj), (var, _) in sorted(self.score_vars.items()):
-                    score = var.get().strip()
-                    if score:
-                        if not self.is_valid_score(score):
-                            raise ValueError(f"Invalid score '{score}' for {subj} in SAC {sac}. Please enter a number.")
-                        writer.writerow([f"SAC {sac}", subj, score])
-            messagebox.showinfo("Success", f"Scores saved to {SCORES_FILE}")
+            rows = []
+            for (sac, subj), (var, _) in sorted(self.score_vars.items()):
+                score = var.get().strip()
+                if score:
+                    if not self.is_valid_score(score):
+                        raise ValueError(f"Invalid score '{score}' for {subj} in SAC {sac}. Please enter a number.")
+                    rows.append([f"SAC {sac}", subj, score])
+            get_service().write(SCORES_FILE, rows, header=["SAC", "Subject", "Score"])
+            messagebox.showinfo("Success", f"Scores saved to {SCORES_FILE}", parent=self.root)
             # Automatically calculate difficulty after saving
             self.display_difficulty()
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save scores: {e}")
+            messagebox.showerror("Error", f"Failed to save scores: {e}", parent=self.root)
 
     def is_valid_score(self, score):
         try:
@@ -127,19 +190,25 @@ class StudyScoreApp:
     def load_existing_scores(self):
         if os.path.exists(SCORES_FILE):
             try:
-                with open(SCORES_FILE, newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        sac_str = row.get("SAC", "")
-                        if sac_str.startswith("SAC"):
-                            sac_index = int(sac_str.split()[1])
-                            subject = row.get("Subject", "")
-                            score = row.get("Score", "")
-                            if (sac_index, subject) in self.score_vars:
-                                var, entry = self.score_vars[(sac_index, subject)]
-                                var.set(score)
+                rows = get_service().load(SCORES_FILE, read_rows)
+                header = rows[0] if rows else []
+                for values in rows[1:]:
+                    row = dict(zip(header, values))
+                    sac_str = row.get("SAC", "")
+                    if sac_str.startswith("SAC"):
+                        sac_index = int(sac_str.split()[1])
+                        subject = row.get("Subject", "")
+                        score = row.get("Score", "")
+                        if (sac_index, subject) in self.score_vars:
+                            var, entry = self.score_vars[(sac_index, subject)]
+                            var.set(score)
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load previous scores: {e}")
+                messagebox.showerror("Error", f"Failed to load previous scores: {e}", parent=self.root)
+
+    def on_scores_changed(self, path):
+        self.load_existing_scores()
+        if os.path.exists(SCORES_FILE):
+            self.update_difficulty()
 
     def display_summary(self):
         for widget in self.summary_tab.winfo_children():
@@ -179,32 +248,26 @@ class StudyScoreApp:
             self.plot_subject(self.subjects[0], subject_scores)
 
     def display_difficulty(self):
-        for w in self.diff_tab.winfo_children():
-            w.destroy()
         if not os.path.exists(SCORES_FILE):
-            messagebox.showerror("Error", f"Scores file not found: {SCORES_FILE}")
+            for w in self.diff_tab.winfo_children():
+                w.destroy()
+            messagebox.showerror("Error", f"Scores file not found: {SCORES_FILE}", parent=self.root)
             return
-        df = pd.read_csv(SCORES_FILE)
-        df = df.dropna(subset=['Score'])
-        df['Score'] = pd.to_numeric(df['Score'], errors='coerce')
-        df = df.dropna(subset=['Score'])
-        res = []
-        for subj, g in df.groupby('Subject'):
-            n = g.shape[0]
-            m = g['Score'].mean()
-            planned = PLANNED_TESTS.get(subj, DEFAULT_TOTAL_TESTS)
-            factor = planned / n if n > 0 else 1
-            diff = round((1 - m/100) * factor, 4)
-            res.append((subj, n, round(m, 2), planned, diff))
-        pd.DataFrame(res, columns=['Subject','tests_taken','mean_score','planned_tests','difficulty']) \
-          .to_csv(DIFFICULTY_FILE, index=False)
+        self.update_difficulty()
+        messagebox.showinfo("Done", f"Difficulty saved to {DIFFICULTY_FILE}", parent=self.root)
+
+    def update_difficulty(self):
+        """Recompute difficulty.csv from the scores file and redraw the Difficulty tab"""
+        for w in self.diff_tab.winfo_children():
+            w.destroy()
+        res = aggregate_difficulty(SCORES_FILE)
+        write_difficulty(res, DIFFICULTY_FILE)
         tree = ttk.Treeview(self.diff_tab, columns=('subject','taken','mean','planned','difficulty'), show='headings')
         for c,h in [('subject','Subject'),('taken','Taken'),('mean','Mean'),('planned','Planned'),('difficulty','Difficulty')]:
             tree.heading(c, text=h)
         for r in res:
             tree.insert('', tk.END, values=r)
         tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        messagebox.showinfo("Done", f"Difficulty saved to {DIFFICULTY_FILE}")
 
     def plot_subject(self, subj, scores):
         self.ax.clear()
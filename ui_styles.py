@@ -0,0 +1,88 @@
+"""
+Shared, theme-aware style registry for the CustomTkinter windows.
+
+Widgets ask for fonts, colours and card configurations by name instead of
+building a new ctk.CTkFont per label on every redraw. Fonts are created once
+per (size, weight) and reused until invalidate() is called (on theme toggle).
+"""
+import customtkinter as ctk
+
+# name -> (size, weight)
+FONTS = {
+    "page_title": (28, "bold"),
+    "dialog_title": (24, "bold"),
+    "section": (18, "bold"),
+    "card_title": (16, "bold"),
+    "message": (16, "normal"),
+    "body_bold": (14, "bold"),
+    "body": (14, "normal"),
+    "badge": (12, "bold"),
+    "caption": (12, "normal"),
+    "timer": (48, "bold"),
+}
+
+# name -> (light mode, dark mode) colour tuple as CTk expects
+COLORS = {
+    "muted": ("gray70", "gray30"),
+    "score": ("#1f538d", "#3d8bff"),
+    "bad": ("#d63031", "#ff6b6b"),
+    "good": ("#00b894", "#00cec9"),
+    "timer": ("#1f538d", "#14375e"),
+}
+
+# Exam card look per urgency band (see ExamTodoApp.show_priority)
+CARDS = {
+    "overdue": {"fg_color": ("red", "darkred"), "label": "OVERDUE", "text_color": "white"},
+    "urgent": {"fg_color": ("orange", "darkorange"), "label": "URGENT", "text_color": "white"},
+    "soon": {"fg_color": ("yellow", "gold"), "label": "SOON", "text_color": "black"},
+    "later": {"fg_color": ("lightblue", "blue"), "label": "LATER", "text_color": "white"},
+}
+
+# Resolved colours for matplotlib, which doesn't understand CTk colour tuples
+CHART_COLORS = {
+    "Dark": {"bg": "#2b2b2b", "text": "white", "mpl_style": "dark_background"},
+    "Light": {"bg": "white", "text": "black", "mpl_style": "default"},
+}
+
+
+class StyleRegistry:
+    def __init__(self):
+        self._fonts = {}
+        self._mode = None
+
+    def font(self, name_or_size, weight="normal"):
+        """Cached CTkFont, by FONTS name or by explicit size and weight."""
+        if isinstance(name_or_size, str):
+            size, weight = FONTS[name_or_size]
+        else:
+            size = name_or_size
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight)
+            self._fonts[key] = font
+        return font
+
+    def color(self, name):
+        return COLORS[name]
+
+    def card(self, name):
+        return CARDS[name]
+
+    @property
+    def mode(self):
+        if self._mode is None:
+            self._mode = ctk.get_appearance_mode()
+        return self._mode
+
+    def chart(self, key):
+        """Resolved matplotlib colour ('bg', 'text', 'mpl_style') for the current mode."""
+        return CHART_COLORS.get(self.mode, CHART_COLORS["Light"])[key]
+
+    def invalidate(self):
+        """Drop cached state; called when the appearance mode changes."""
+        self._fonts.clear()
+        self._mode = None
+
+
+styles = StyleRegistry()
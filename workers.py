@@ -0,0 +1,169 @@
+"""
+Shared background executor for slow work (API refreshes) started from the UI.
+
+- One small thread pool per process instead of a new thread per refresh.
+- Single-flight: submitting a key that is already running joins that job, so
+  the auto refresh and the "Refresh Data" button never sync twice at once.
+- Cancellation is cooperative: the worker function receives a threading.Event
+  and should return early once it is set. Timeouts set the same event.
+- Callbacks are handed back to the Tk thread with widget.after, so they can
+  touch widgets directly.
+"""
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 2
+# Job key of the Canvas sync: every window submits it under this key, so a
+# sync started from one window is joined (not repeated) by the others
+API_REFRESH_KEY = "api-refresh"
+API_REFRESH_TIMEOUT = 120  # seconds before a stuck sync is abandoned
+
+
+class JobCancelled(Exception):
+    """Raised to callbacks when a job was cancelled before it finished."""
+
+
+class JobTimeout(JobCancelled):
+    """Raised to callbacks when a job ran past its timeout."""
+
+
+class Job:
+    def __init__(self, key, timeout=None):
+        self.key = key
+        self.timeout = timeout
+        self.cancel_event = threading.Event()
+        self.future = None
+        self._timer = None
+        self._callbacks = []  # (tk_widget, on_success, on_error)
+        self._outcome = None  # ("ok", result) / ("error", exc) once finished
+        self._lock = threading.Lock()
+
+    def cancel(self, exc=None):
+        """Ask the worker to stop and fail the job's callbacks right away."""
+        self.cancel_event.set()
+        self._finish("error", exc or JobCancelled(f"{self.key} cancelled"))
+
+    @property
+    def done(self):
+        return self._outcome is not None
+
+    def add_callbacks(self, tk_widget=None, on_success=None, on_error=None):
+        with self._lock:
+            if self._outcome is None:
+                self._callbacks.append((tk_widget, on_success, on_error))
+                return
+        self._dispatch(tk_widget, on_success, on_error)
+
+    def _finish(self, kind, value):
+        with self._lock:
+            if self._outcome is not None:
+                return False
+            self._outcome = (kind, value)
+            callbacks, self._callbacks = self._callbacks, []
+        if self._timer is not None:
+            self._timer.cancel()
+        for tk_widget, on_success, on_error in callbacks:
+            self._dispatch(tk_widget, on_success, on_error)
+        return True
+
+    def _dispatch(self, tk_widget, on_success, on_error):
+        kind, value = self._outcome
+        callback = on_success if kind == "ok" else on_error
+        if callback is None:
+            return
+        if tk_widget is None:
+            callback(value)
+            return
+        try:
+            tk_widget.after(0, callback, value)
+        except (RuntimeError, tk.TclError):
+            # Window was closed while the job was running
+            pass
+
+
+class BackgroundExecutor:
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bg-worker")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, timeout=None, tk_widget=None,
+               on_success=None, on_error=None, **kwargs):
+        """
+        Run fn(*args, cancel_event=..., **kwargs) in the pool under key.
+
+        If a job with the same key is in flight, the callbacks are attached to
+        it and that job is returned instead of starting a new one.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.done:
+                job.add_callbacks(tk_widget, on_success, on_error)
+                return job
+            job = Job(key, timeout)
+            job.add_callbacks(tk_widget, on_success, on_error)
+            self._jobs[key] = job
+
+        def run():
+            if job.cancel_event.is_set():
+                return
+            try:
+                result = fn(*args, cancel_event=job.cancel_event, **kwargs)
+            except Exception as e:
+                job._finish("error", e)
+            else:
+                if job.cancel_event.is_set():
+                    job._finish("error", JobCancelled(f"{key} cancelled"))
+                else:
+                    job._finish("ok", result)
+            finally:
+                self._forget(job)
+
+        if timeout:
+            job._timer = threading.Timer(
+                timeout, lambda: job.cancel(JobTimeout(f"{key} timed out after {timeout}s"))
+            )
+            job._timer.daemon = True
+            job._timer.start()
+        job.future = self._pool.submit(run)
+        return job
+
+    def _forget(self, job):
+        with self._lock:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+
+    def running(self, key):
+        with self._lock:
+            job = self._jobs.get(key)
+            return job is not None and not job.done
+
+    def cancel(self, key):
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None:
+            job.cancel()
+
+    def cancel_all(self):
+        with self._lock:
+            jobs, self._jobs = list(self._jobs.values()), {}
+        for job in jobs:
+            job.cancel()
+
+    def shutdown(self):
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def get_executor():
+    """Process-wide executor shared by all windows."""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = BackgroundExecutor()
+        return _default_executor